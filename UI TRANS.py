@@ -1,40 +1,206 @@
 # Import necessary modules from Python and PyQt5
+import time
+_T_START = time.perf_counter()  # for --startup-time (before the heavy imports)
+
+import os
 import sys
-import re  # <-- used by normalize_mode
+import threading
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QPushButton, QComboBox,
-    QTextEdit, QMessageBox, QTextBrowser, QLabel
+    QTextEdit, QMessageBox, QTextBrowser, QLabel, QProgressBar, QCheckBox,
+    QFileDialog, QShortcut
 )
-from PyQt5.QtGui import QIcon
-from PyQt5 import uic
+from PyQt5.QtGui import QIcon, QTextCursor, QKeySequence
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal, pyqtSlot
 
 # Import your backend file that contains all the conversion functions 
 import backend as backend
+import backend_parallel
+import binlator_profile
+from backend import normalize_mode
+from build_ui import UI_FILE, ui_source_hash
+from output_view import PagedTextView, LazyTextMime, iter_text_chunks
+
+_T_IMPORTED = time.perf_counter()
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LOGO_FILE = os.path.join(BASE_DIR, "Logo.jpg")
+
+# Results longer than this go to the paged viewer instead of the QTextBrowser
+LARGE_OUTPUT = 256 * 1024
 
+# How long closing the window waits for a cancelled translation to stop
+CLOSE_WAIT_MS = 2000
+_leftover_threads = []   # QThreads still running after their window closed
 
-def normalize_mode(s: str) -> str:
+
+def load_ui(window):
     """
-    Make combobox text consistent so it matches fn_map keys even if the UI
-    has extra/missing spaces or uses en/em dashes.
+    Build the widgets from bin_ui.py (made by build_ui.py). Falls back to
+    parsing the .ui file with uic when bin_ui.py is missing or older than
+    the .ui file.
     """
-    s = (s or "")
-    # unify different dashes to a plain hyphen
-    s = s.replace("–", "-").replace("—", "-")
-    # collapse multiple spaces
-    s = re.sub(r"\s+", " ", s)
-    # ensure single spaces around the hyphen
-    s = re.sub(r"\s*-\s*", " - ", s)
-    return s.strip()
+    try:
+        import bin_ui
+        if bin_ui.UI_SOURCE_HASH == ui_source_hash():
+            window._ui = bin_ui.Ui_MainWindow()
+            window._ui.setupUi(window)
+            return "bin_ui"
+    except ImportError:
+        pass
+
+    from PyQt5 import uic  # slow path: parse the XML at runtime
+    uic.loadUi(UI_FILE, window)
+    return "uic"
+
+
+# -----------------------------
+# Sample hints (built on first use)
+# -----------------------------
+_sample_hints = None
+
+
+def sample_hint(mode: str) -> str:
+    """'Sample Input: ...' text for a normalized mode name ('' if none)."""
+    global _sample_hints
+    if _sample_hints is None:
+        _sample_hints = {
+            "Text - Unicode/ASCII": "Sample Input: Hi!  →  72 105 33",
+            "Text - Binary": "Sample Input: Hi  →  01001000 01101001",
+            "Text - Octal": "Sample Input: Hi  →  110 151",
+            "Text - Hexadecimal": "Sample Input: Hi  →  48 69",
+
+            "Binary (ASCII Bytes) - Text": "Sample Input: 01001000 01101001  →  Hi",
+            "Binary (ASCII Bytes) - Unicode/ASCII": "Sample Input: 01001000 01101001  →  72 105",
+            "Binary (ASCII Bytes) - Octal": "Sample Input: 01001000 01101001  →  110 151",
+            "Binary (ASCII Bytes) - Hexadecimal": "Sample Input: 01001000 01101001  →  48 69",
+
+            "Unicode/ASCII - Text": "Sample Input: 72 105  →  Hi",
+            "Unicode/ASCII - Binary": "Sample Input: 72 105  →  01001000 01101001",
+            "Unicode/ASCII - Octal": "Sample Input: 72 105  →  110 151",
+            "Unicode/ASCII - Hexadecimal": "Sample Input: 72 105  →  48 69",
+
+            "Octal - Text": "Sample Input: 110 151  →  Hi",
+            "Octal - Binary": "Sample Input: 110 151  →  01001000 01101001",
+            "Octal - Unicode/ASCII": "Sample Input: 110 151  →  72 105",
+            "Octal - Hexadecimal": "Sample Input: 110 151  →  48 69",
+
+            "Hexadecimal - Text": "Sample Input: 48 69 21  →  Hi!",
+            "Hexadecimal - Unicode/ASCII": "Sample Input: 48 69  →  72 105",
+            "Hexadecimal - Octal": "Sample Input: 48 69  →  110 151",
+            "Hexadecimal - Binary": "Sample Input: 48 69  →  01001000 01101001",
+
+            "Text - UTF-8 Hexadecimal": "Sample Input: Hé  →  48 C3 A9",
+            "Text - UTF-8 Binary": "Sample Input: é  →  11000011 10101001",
+            "Text - UTF-16LE Hexadecimal": "Sample Input: Hé  →  48 00 E9 00",
+            "Text - UTF-16LE Binary": "Sample Input: é  →  11101001 00000000",
+            "Text - UTF-16BE Hexadecimal": "Sample Input: Hé  →  00 48 00 E9",
+            "Text - UTF-16BE Binary": "Sample Input: é  →  00000000 11101001",
+            "Text - UTF-32BE Hexadecimal": "Sample Input: é  →  00 00 00 E9",
+            "Text - UTF-32BE Binary": "Sample Input: é  →  00000000 00000000 00000000 11101001",
+
+            "UTF-8 Hexadecimal - Text": "Sample Input: 48 C3 A9  →  Hé",
+            "UTF-8 Binary - Text": "Sample Input: 11000011 10101001  →  é",
+            "UTF-16LE Hexadecimal - Text": "Sample Input: 48 00 E9 00  →  Hé",
+            "UTF-16LE Binary - Text": "Sample Input: 11101001 00000000  →  é",
+            "UTF-16BE Hexadecimal - Text": "Sample Input: 00 48 00 E9  →  Hé",
+            "UTF-16BE Binary - Text": "Sample Input: 00000000 11101001  →  é",
+            "UTF-32BE Hexadecimal - Text": "Sample Input: 00 00 00 E9  →  é",
+            "UTF-32BE Binary - Text": "Sample Input: 00000000 00000000 00000000 11101001  →  é",
+
+            "Binary Number - Octal Number": "Sample Input: 1101 1110 1010 1101  →  157255",
+            "Binary Number - Decimal Number": "Sample Input: 1101 1110 1010 1101  →  57005",
+            "Binary Number - Hexadecimal Number": "Sample Input: 1101 1110 1010 1101  →  DEAD",
+            "Octal Number - Binary Number": "Sample Input: 157255  →  1101111010101101",
+            "Octal Number - Decimal Number": "Sample Input: 157255  →  57005",
+            "Octal Number - Hexadecimal Number": "Sample Input: 157255  →  DEAD",
+            "Decimal Number - Binary Number": "Sample Input: 57005  →  1101111010101101",
+            "Decimal Number - Octal Number": "Sample Input: 57005  →  157255",
+            "Decimal Number - Hexadecimal Number": "Sample Input: 57005  →  DEAD",
+            "Hexadecimal Number - Binary Number": "Sample Input: DEAD  →  1101111010101101",
+            "Hexadecimal Number - Octal Number": "Sample Input: DEAD  →  157255",
+            "Hexadecimal Number - Decimal Number": "Sample Input: DEAD  →  57005",
+        }
+    return _sample_hints.get(mode, "")
+
+
+# -----------------------------
+# Background translation
+# -----------------------------
+class TranslateWorker(QObject):
+    """Runs one backend conversion on a QThread so the window stays responsive."""
+
+    progress = pyqtSignal(int)       # percent done, 0–100
+    done = pyqtSignal(object)        # backend result (CodeLists already rendered into text)
+    located = pyqtSignal(object)     # backend.BadToken, sent before done for an "Error: ..." result
+    failed = pyqtSignal(str)         # unexpected exception message
+    cancelled = pyqtSignal()
+
+    def __init__(self, func, user_input):
+        super().__init__()
+        self._func = func
+        self._input = user_input
+        self._stop = threading.Event()
+        self._last_percent = -1
+
+    def cancel(self):
+        """Ask the backend to stop at its next progress check (any thread)."""
+        self._stop.set()
+
+    def _on_progress(self, done, total):
+        if self._stop.is_set():
+            raise backend.ConversionCancelled()
+        percent = done * 100 // total if total else 100
+        if percent != self._last_percent:   # don't flood the GUI with signals
+            self._last_percent = percent
+            self.progress.emit(percent)
+
+    def _render(self, codes):
+        """codes.render(), a block at a time so Cancel still works."""
+        blocks = []
+        for start in range(0, len(codes), backend.PROGRESS_BLOCK):
+            self._on_progress(start, len(codes))
+            blocks.append(codes[start:start + backend.PROGRESS_BLOCK].render())
+        return " ".join(blocks)
+
+    @pyqtSlot()
+    @binlator_profile.profiled
+    def run(self):
+        try:
+            # auto-grouping / clean-up (the input box keeps what was typed)
+            user = backend.normalize_input(self._func, self._input, self._on_progress)
+            # repeated inputs come from the cache; big new ones are spread over all cores
+            result = backend.result_cache.call(
+                self._func, user, progress=self._on_progress, run=backend_parallel.convert
+            )
+            if isinstance(result, backend.CodeList):
+                # render here too, a million-item join would freeze the GUI thread
+                result = self._render(result)
+            elif isinstance(result, str) and result.startswith("Error:") and user == self._input:
+                # (positions in a cleaned-up copy wouldn't match the input box)
+                bad = backend.check_input(self._func, self._input, self._on_progress)
+                if bad is not None:
+                    self.located.emit(bad)
+        except backend.ConversionCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.done.emit(result)
 
 
 class MainWindow(QMainWindow):  # Main window class (inherits from QMainWindow)
     def __init__(self):
         super().__init__()
 
-        # Load the .ui file (created using Qt Designer)
-        uic.loadUi("BIN UI.ui", self)
+        # Build the widgets (precompiled bin_ui.py, or the .ui file via uic)
+        self.ui_source = load_ui(self)
         self.setWindowTitle("BINLATOR")          # Set window title
-        self.setWindowIcon(QIcon("Logo.jpg"))    # Set window icon 
+        self.first_paint_time = None             # set by paintEvent (startup timing)
+
+        # Window icon is decoded after the window is up, not before
+        QTimer.singleShot(0, lambda: self.setWindowIcon(QIcon(LOGO_FILE)))
 
         #  Connect Python to widgets made in Qt Designer 
         self.combo: QComboBox = self.findChild(QComboBox, "comboBox")        # Dropdown menu
@@ -54,6 +220,54 @@ class MainWindow(QMainWindow):  # Main window class (inherits from QMainWindow)
             self.sample_label.setGeometry(g.x(), g.y() + g.height() + 5, g.width(), 24)
         self.sample_label.hide()
 
+        # --- Paged viewer for huge results (same place as the output box) ---
+        self.big_view = PagedTextView(self.text_2.parentWidget())
+        self.big_view.setObjectName("bigOutputView")
+        self.big_view.setGeometry(self.text_2.geometry())
+        self.big_view.setStyleSheet(
+            "QPlainTextEdit { background-color: #ffffff; color: #000000;"
+            " border: 2px solid #ff69b4; border-radius: 15px; padding: 6px; }"
+            "QPlainTextEdit:focus { border: 2px solid #e75480; background-color: #fff5fa; }"
+        )
+        self.big_view.hide()
+
+        # --- Progress bar + Cancel button in the status bar (shown while a slow translation runs) ---
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setMaximumWidth(240)
+        self.cancel_button = QPushButton("Cancel", self)
+        self.cancel_button.clicked.connect(self.cancel_translation)
+        self.save_button = QPushButton("Save Output…", self)
+        self.save_button.clicked.connect(self.save_output)
+        self.normalize_button = QPushButton("Normalize Input", self)
+        self.normalize_button.setToolTip("Regroup binary/octal digits and tidy decimal codes in the input box")
+        self.normalize_button.clicked.connect(self.normalize_input_box)
+        self.statusBar().addPermanentWidget(self.progress_bar)
+        self.statusBar().addPermanentWidget(self.cancel_button)
+        self.statusBar().addPermanentWidget(self.save_button)
+        self.statusBar().addPermanentWidget(self.normalize_button)
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self._thread = None   # QThread of the running translation (if any)
+        self._worker = None
+        self._bad_token = None   # backend.BadToken of the last failed translation
+
+        # --- Live mode: output follows the input while typing (opt-in) ---
+        self.live_check = QCheckBox("Live", self)
+        self.live_check.setToolTip("Translate while typing")
+        self.live_check.toggled.connect(self._set_live)
+        self.statusBar().addWidget(self.live_check)
+        self.detect_label = QLabel(self)   # what an "Auto - ..." entry picked last time
+        self.statusBar().addWidget(self.detect_label)
+        self._live = None          # backend.LiveTranslation while live mode is on
+        self._live_prefix = None   # unchanged chars at the start/end since the last update
+        self._live_suffix = None
+        self._live_shown = False   # output box holds self._live.output (so patches apply to it)
+        self._live_timer = QTimer(self)
+        self._live_timer.setSingleShot(True)
+        self._live_timer.setInterval(250)   # debounce: wait for a pause in typing
+        self._live_timer.timeout.connect(self._live_update)
+
         #  Connect buttons to their corresponding functions 
         self.trans_button.clicked.connect(self.translate)  # Runs translate() when clicked
         self.clear_button.clicked.connect(self.clear)      # Runs clear() when clicked
@@ -63,42 +277,23 @@ class MainWindow(QMainWindow):  # Main window class (inherits from QMainWindow)
         # When mode changes, update the sample hint
         if self.combo:
             self.combo.currentTextChanged.connect(self.update_sample_hint)
+            self.combo.currentTextChanged.connect(self._restart_live)
+        if self.text_1:
+            self.text_1.document().contentsChange.connect(self._on_input_change)
 
         #  Dictionary linking dropdown modes to backend functions 
-        self.fn_map = {
-            # Text Based Translations
-            "Text - Unicode/ASCII": backend.text_to_unicode,
-            "Text - Binary": backend.text_to_binary,
-            "Text - Octal": backend.text_to_octal,
-            "Text - Hexadecimal": backend.text_to_hex,
-
-            # Binary Based translations
-            "Binary (ASCII Bytes) - Text": backend.binary_to_text,
-            "Binary (ASCII Bytes) - Unicode/ASCII": backend.binary_to_unicode,
-            "Binary (ASCII Bytes) - Octal": backend.binary_to_octal,
-            "Binary (ASCII Bytes) - Hexadecimal": backend.binary_to_hex,
-
-            # Unicode/ASCII Based Translations
-            "Unicode/ASCII - Text": backend.unicode_to_text,
-            "Unicode/ASCII - Binary": backend.unicode_to_binary,
-            "Unicode/ASCII - Octal": backend.unicode_to_octal,
-            "Unicode/ASCII - Hexadecimal": backend.decimal_to_hex,
-
-            # Octal Based Translations
-            "Octal - Text": backend.octal_to_text,
-            "Octal - Binary": backend.octal_to_binary,
-            "Octal - Unicode/ASCII": backend.octal_to_unicode,
-            "Octal - Hexadecimal": backend.octal_to_hex,
-
-            #Hexadecimal Based Translations
-            "Hexadecimal - Text": backend.hex_to_text,
-            "Hexadecimal - Unicode/ASCII": backend.hex_to_decimal,
-            "Hexadecimal - Octal": backend.hex_to_octal,
-            "Hexadecimal - Binary": backend.hex_to_binary,
-        }
+        #  (built in backend.py from the source × target grid, e.g.
+        #   "Text - Binary": backend.text_to_binary)
+        self.fn_map = dict(backend.MODES)
 
         # Build a normalized lookup so small spacing/dash differences don’t break things
         self.fn_map_norm = {normalize_mode(k): v for k, v in self.fn_map.items()}
+        # "Auto - Target" entries: the source is detected from the input (see backend.detect_format)
+        self.auto_map_norm = {normalize_mode(k): t for k, t in backend.AUTO_MODES.items()}
+
+        # Hidden diagnostics panel (backend counters, cache stats)
+        self._diagnostics = None
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, self.show_diagnostics)
 
         # Initialize sample hint text based on current combo value
         self.update_sample_hint()
@@ -113,34 +308,8 @@ class MainWindow(QMainWindow):  # Main window class (inherits from QMainWindow)
 
         mode = normalize_mode(self.combo.currentText())
 
-        examples = {
-            "Text - Unicode/ASCII": "Sample Input: Hi!  →  72 105 33",
-            "Text - Binary": "Sample Input: Hi  →  01001000 01101001",
-            "Text - Octal": "Sample Input: Hi  →  110 151",
-            "Text - Hexadecimal": "Sample Input: Hi  →  48 69",
-
-            "Binary (ASCII Bytes) - Text": "Sample Input: 01001000 01101001  →  Hi",
-            "Binary (ASCII Bytes) - Unicode/ASCII": "Sample Input: 01001000 01101001  →  72 105",
-            "Binary (ASCII Bytes) - Octal": "Sample Input: 01001000 01101001  →  110 151",
-            "Binary (ASCII Bytes) - Hexadecimal": "Sample Input: 01001000 01101001  →  48 69",
-
-            "Unicode/ASCII - Text": "Sample Input: 72 105  →  Hi",
-            "Unicode/ASCII - Binary": "Sample Input: 72 105  →  01001000 01101001",
-            "Unicode/ASCII - Octal": "Sample Input: 72 105  →  110 151",
-            "Unicode/ASCII - Hexadecimal": "Sample Input: 72 105  →  48 69",
-
-            "Octal - Text": "Sample Input: 110 151  →  Hi",
-            "Octal - Binary": "Sample Input: 110 151  →  01001000 01101001",
-            "Octal - Unicode/ASCII": "Sample Input: 110 151  →  72 105",
-            "Octal - Hexadecimal": "Sample Input: 110 151  →  48 69",
-
-            "Hexadecimal - Text": "Sample Input: 48 69 21  →  Hi!",
-            "Hexadecimal - Unicode/ASCII": "Sample Input: 48 69  →  72 105",
-            "Hexadecimal - Octal": "Sample Input: 48 69  →  110 151",
-            "Hexadecimal - Binary": "Sample Input: 48 69  →  01001000 01101001",
-        }
-
-        text = examples.get(mode, "")
+        # "Select" (or anything unknown) has no hint; skip building the table
+        text = sample_hint(mode) if mode in self.fn_map_norm else ""
 
         if text:
             self.sample_label.setText(text)
@@ -152,131 +321,140 @@ class MainWindow(QMainWindow):  # Main window class (inherits from QMainWindow)
             self.sample_label.hide()
 
     # -----------------------------
-    # UI helper: group binary input
+    # Normalize Input button
     # -----------------------------
-    def _group_binary_8(self, raw: str):
+    def normalize_input_box(self):
         """
-        Binary helper:
-          1) keep only 0 and 1,
-          2) require length % 8 == 0,
-          3) return 'xxxxxxxx xxxxxxxx ...' (8-bit groups) or None.
+        Put the cleaned-up input (binary/octal regrouped, decimal commas and
+        junk removed; see "INPUT NORMALIZER" in backend.py) into the input box.
+        Translate uses the same clean-up but leaves the box alone.
         """
-        if raw is None:
-            return None
-
-        cleaned = ""
-        for ch in raw:
-            if ch == "0" or ch == "1":
-                cleaned += ch
-
-        if len(cleaned) == 0 or (len(cleaned) % 8) != 0:
-            return None
-
-        groups = []
-        current = ""
-        for bit in cleaned:
-            current += bit
-            if len(current) == 8:
-                groups.append(current)
-                current = ""
-
-        if current:
-            return None
-
-        grouped = ""
-        i = 0
-        while i < len(groups):
-            grouped += groups[i]
-            if i != len(groups) - 1:
-                grouped += " "
-            i += 1
-
-        return grouped
+        mode = normalize_mode(self.combo.currentText())
+        text = self.text_1.toPlainText()
+        func = self._mode_function(mode, text)
+        if func is None:
+            if mode not in self.auto_map_norm:   # (Auto already said why)
+                QMessageBox.information(self, "Pick a mode", "Please pick a mode of translation.")
+            return
+        normalized = backend.normalize_input(func, text)
+        if normalized != text:
+            self.text_1.setPlainText(normalized)
 
     # -----------------------------
-    # UI helper: group octal input
+    # Mode lookup (incl. "Auto - ...")
     # -----------------------------
-    def _group_octal_3(self, raw: str):
+    def _mode_function(self, mode, text):
         """
-        Octal helper:
-          1) keep only digits 0–7,
-          2) require length % 3 == 0,
-          3) return 'xxx xxx ...' (3-digit octal groups) or None.
-        Example: '110151' -> '110 151'
+        Backend function for a normalized dropdown name. "Auto - ..." entries
+        look at the start of `text` to pick the source; None (after telling
+        the user) when the input already is in the target format.
         """
-        if raw is None:
-            return None
-
-        cleaned = ""
-        for ch in raw:
-            if ch in "01234567":
-                cleaned += ch
-
-        if len(cleaned) == 0 or (len(cleaned) % 3) != 0:
+        target = self.auto_map_norm.get(mode)
+        if target is None:
+            return self.fn_map_norm.get(mode)
+        func, found = backend.auto_mode(target, text)
+        if func is None:
+            QMessageBox.information(self, "Nothing to convert", f"The input already looks like {found.label}.")
             return None
+        if found.confidence:
+            self.detect_label.setText(f"Auto: {found.label} ({found.confidence:.0%} sure)")
+        return func
 
-        groups = []
-        current = ""
-        for ch in cleaned:
-            current += ch
-            if len(current) == 3:
-                groups.append(current)
-                current = ""
+    # -----------------------------
+    # Live mode
+    # -----------------------------
+    def _set_live(self, on):
+        self._live = None
+        self._live_timer.stop()
+        if on:
+            self._restart_live()
+        else:
+            self.statusBar().clearMessage()
 
-        if current:
-            return None
+    def _restart_live(self, _=None):
+        """(Re)start live mode for the selected mode with a full translation."""
+        if not self.live_check.isChecked():
+            return
+        func = self.fn_map_norm.get(normalize_mode(self.combo.currentText()))
+        if func is None:
+            self._live = None
+            self.statusBar().showMessage("Live: pick a mode of translation.")
+            return
+        try:
+            self._live = backend.LiveTranslation(func)
+        except ValueError:   # the UTF byte modes
+            self._live = None
+            self.statusBar().showMessage("Live: not available for this mode; use Translate.")
+            return
+        self._live.reset(self.text_1.toPlainText())
+        self._live_prefix = self._live_suffix = None
+        self._show_live(None)
 
-        grouped = ""
-        i = 0
-        while i < len(groups):
-            grouped += groups[i]
-            if i != len(groups) - 1:
-                grouped += " "
-            i += 1
+    def _on_input_change(self, position, removed, added):
+        if self._live is None:
+            return
+        # Remember the unchanged part at each end. Counting the end part from
+        # the end keeps both numbers valid across several edits.
+        doc_len = self.text_1.document().characterCount() - 1
+        suffix = max(doc_len - position - added, 0)
+        if self._live_prefix is None:
+            self._live_prefix, self._live_suffix = position, suffix
+        else:
+            self._live_prefix = min(self._live_prefix, position)
+            self._live_suffix = min(self._live_suffix, suffix)
+        self._live_timer.start()
 
-        return grouped
+    def _live_update(self):
+        if self._live is None or self._live_prefix is None:
+            return
+        text = self.text_1.toPlainText()
+        prefix, suffix = self._live_prefix, self._live_suffix
+        self._live_prefix = self._live_suffix = None
+
+        had_astral = self._live.output_has_astral
+        if self._live.input_has_astral:
+            # Qt counts these as 2 positions, Python as 1: start over
+            self._live.reset(text)
+            patch = None
+        else:
+            patch = self._live.edit(text, prefix, suffix)
+        if had_astral or self._live.output_has_astral:
+            patch = None
+        self._show_live(patch)
+
+    def _show_live(self, patch):
+        if self._live.error is not None:
+            self.statusBar().showMessage(f"Live: {self._live.error}")
+            return  # keep the last good output
+        self.statusBar().clearMessage()
+
+        if patch is None or not self._live_shown or self.big_view.isVisibleTo(self):
+            # the output box was last set by something else (Translate, Clear,
+            # the paged viewer): show the whole live output again
+            self._set_output(self._live.output)
+            self._live_shown = True
+            return
+        start, removed, text = patch
+        cursor = QTextCursor(self.text_2.document())
+        cursor.setPosition(start)
+        cursor.setPosition(start + removed, QTextCursor.KeepAnchor)
+        cursor.insertText(text)
 
-    # -----------------------------
-    # UI helper: normalize decimal codes (Unicode/ASCII input)
-    # -----------------------------
-    def _normalize_decimal_codes(self, raw: str):
-        """
-        Unicode/ASCII helper:
-
-        - Keep only digits, spaces, commas, semicolons.
-        - Turn commas/semicolons into spaces.
-        - Collapse multiple spaces.
-        Example:
-            '72,105;  33'  -> '72 105 33'
-        We do NOT try to guess splits like '72105' -> backend will show error.
-        """
-        if raw is None:
-            return ""
-
-        # Replace commas/semicolons with spaces
-        temp = ""
-        for ch in raw:
-            if ch.isdigit():
-                temp += ch
-            elif ch in [",", ";"]:
-                temp += " "
-            elif ch.isspace():
-                temp += " "
-            # ignore any weird characters
-
-        # Collapse multiple spaces
-        temp = temp.strip()
-        temp = re.sub(r"\s+", " ", temp)
-        return temp
+    def paintEvent(self, event):
+        if self.first_paint_time is None:
+            self.first_paint_time = time.perf_counter()
+        super().paintEvent(event)
 
     #  Function: Clear the interface 
     def clear(self):
+        self.cancel_translation()
         if self.text_1:
             self.text_1.setPlainText("")
         if self.text_2:
-            self.text_2.setPlainText("")
+            self._set_output("")
         if self.combo:
             self.combo.setCurrentIndex(0)
+        self.detect_label.setText("")
         self.update_sample_hint()
 
     #  Function: Copy output to clipboard 
@@ -285,15 +463,63 @@ class MainWindow(QMainWindow):  # Main window class (inherits from QMainWindow)
             QMessageBox.warning(self, "Copy Failed", "Output box not found.")
             return
 
-        text = self.text_2.toPlainText()
+        text = self._output_text()
         if not text.strip():
             QMessageBox.warning(self, "Nothing to Copy", "There’s no translated output yet.")
             return
 
-        QApplication.clipboard().setText(text)
+        if len(text) > LARGE_OUTPUT:
+            # hand Qt the text only when it is pasted, not as a copy right now
+            QApplication.clipboard().setMimeData(LazyTextMime(text))
+        else:
+            QApplication.clipboard().setText(text)
         QMessageBox.information(self, "Copied!", "Translated output copied to clipboard!")
 
+    #  Function: Save output to a text file 
+    def save_output(self):
+        text = self._output_text()
+        if not text.strip():
+            QMessageBox.warning(self, "Nothing to Save", "There’s no translated output yet.")
+            return
+
+        path, _ = QFileDialog.getSaveFileName(self, "Save Output", "output.txt", "Text files (*.txt);;All files (*)")
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                for chunk in iter_text_chunks(text):   # no second full-size copy
+                    f.write(chunk)
+        except (OSError, UnicodeEncodeError) as e:
+            QMessageBox.critical(self, "Save Failed", f"Could not save the output:\n{e}")
+            return
+        self.statusBar().showMessage(f"Saved {len(text):,} characters to {os.path.basename(path)}", 5000)
+
+    # -----------------------------
+    # Output box / large result viewer
+    # -----------------------------
+    def _set_output(self, text):
+        """Show a result: small ones in the output box, huge ones in the paged viewer."""
+        self._live_shown = False
+        if len(text) > LARGE_OUTPUT:
+            self.text_2.clear()
+            self.text_2.hide()
+            self.big_view.show()   # lay it out first so it knows its rows/cols
+            self.big_view.set_text(text)
+        else:
+            self.big_view.clear()
+            self.big_view.hide()
+            self.text_2.show()
+            self.text_2.setPlainText(text)
+
+    def _output_text(self):
+        """The full current output (from the paged viewer's store when it is in use)."""
+        if self.big_view.isVisibleTo(self):
+            return self.big_view.text()
+        return self.text_2.toPlainText()
+
     #  Function: Handle the translation process 
+    @pyqtSlot()
+    @binlator_profile.profiled
     def translate(self):
         if not (self.combo and self.text_1 and self.text_2):
             QMessageBox.critical(self, "Error", "UI elements not found (check objectNames in the .ui).")
@@ -307,28 +533,11 @@ class MainWindow(QMainWindow):  # Main window class (inherits from QMainWindow)
 
         user_input = self.text_1.toPlainText()
 
-        # AUTO-SPACING / AUTO-CLEAN STEP (UI-side convenience)
-        if mode.startswith("Binary"):
-            grouped = self._group_binary_8(user_input)
-            if grouped is not None:
-                self.text_1.setPlainText(grouped)
-                user_input = grouped
-
-        elif mode.startswith("Octal"):
-            grouped = self._group_octal_3(user_input)
-            if grouped is not None:
-                self.text_1.setPlainText(grouped)
-                user_input = grouped
-
-        elif mode.startswith("Unicode/ASCII"):
-            normalized = self._normalize_decimal_codes(user_input)
-            if normalized:
-                self.text_1.setPlainText(normalized)
-                user_input = normalized
-
         # Look up the correct backend function based on dropdown choice (normalized)
-        func = self.fn_map_norm.get(mode)
+        func = self._mode_function(mode, user_input)
         if func is None:
+            if mode in self.auto_map_norm:
+                return   # the user was told why
             QMessageBox.warning(
                 self,
                 "Pick a mode",
@@ -336,35 +545,131 @@ class MainWindow(QMainWindow):  # Main window class (inherits from QMainWindow)
             )
             return
 
-        # Try running the backend function safely
-        try:
-            result = func(user_input)
-        except Exception as e:
-            QMessageBox.critical(self, "Unexpected Error", f"An unexpected error occurred:\n{e}")
-            return
-
+        # Run the backend function on a worker thread (see TranslateWorker)
+        self._start_worker(func, user_input)
+
+    def _start_worker(self, func, user_input):
+        if self._thread is not None:
+            return  # one translation at a time
+
+        self._thread = QThread(self)
+        self._worker = TranslateWorker(func, user_input)
+        self._worker.moveToThread(self._thread)
+
+        self._thread.started.connect(self._worker.run)
+        self._worker.progress.connect(self.progress_bar.setValue)
+        self._worker.located.connect(self._select_bad_token)
+        self._worker.done.connect(self._show_result)
+        self._worker.failed.connect(self._show_failure)
+        for signal in (self._worker.done, self._worker.failed, self._worker.cancelled):
+            signal.connect(self._thread.quit)
+        self._thread.finished.connect(self._translation_finished)
+
+        self.trans_button.setEnabled(False)
+        self.progress_bar.setValue(0)
+        QTimer.singleShot(150, self._show_progress)  # quick ones never show the bar
+        self._thread.start()
+
+    def _show_progress(self):
+        if self._thread is not None:
+            self.cancel_button.setEnabled(True)
+            self.progress_bar.show()
+            self.cancel_button.show()
+
+    def cancel_translation(self):
+        """Cancel button: stop the running translation (output is left unchanged)."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self.cancel_button.setEnabled(False)
+
+    def _translation_finished(self):
+        self._worker.deleteLater()
+        self._thread.deleteLater()
+        self._worker = None
+        self._thread = None
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.trans_button.setEnabled(True)
+
+    def _show_failure(self, message):
+        QMessageBox.critical(self, "Unexpected Error", f"An unexpected error occurred:\n{message}")
+
+    def _select_bad_token(self, bad):
+        """Select the token the backend rejected in the input box."""
+        self._bad_token = bad
+        text = self.text_1.toPlainText()
+        if text[bad.offset:bad.offset + len(bad.token)] != bad.token:
+            return   # input was edited while translating
+        start = bad.offset
+        if not text.isascii():   # Qt positions count UTF-16 units
+            start = len(text[:start].encode("utf-16-le")) // 2
+        cursor = self.text_1.textCursor()
+        cursor.setPosition(start)
+        cursor.setPosition(start + len(bad.token.encode("utf-16-le")) // 2, QTextCursor.KeepAnchor)
+        self.text_1.setTextCursor(cursor)   # also scrolls it into view
+
+    def _show_result(self, result):
         # If backend returns an "Error: ..." message
         if isinstance(result, str) and result.startswith("Error:"):
+            bad, self._bad_token = self._bad_token, None
+            if bad is not None:
+                token = bad.token if len(bad.token) <= 40 else bad.token[:40] + "…"
+                result += f"\n\nLine {bad.line}, column {bad.column}: {token!r}"
             QMessageBox.warning(self, "Input Error", result)
-            self.text_2.setPlainText("")
+            self._set_output("")
             return
 
-        # Display the result in the output box 
-        if isinstance(result, list):
-            pretty = " ".join(str(x) for x in result)
-            self.text_2.setPlainText(pretty)
-        elif isinstance(result, str):
-            self.text_2.setPlainText(result)
+        # Display the result in the output box (or the paged viewer if huge)
+        if isinstance(result, str):
+            self._set_output(result)
         else:
-            self.text_2.setPlainText(str(result))
+            self._set_output(str(result))
+
+    def show_diagnostics(self):
+        if self._diagnostics is None:
+            from diagnostics_view import DiagnosticsDialog  # only built when asked for
+            self._diagnostics = DiagnosticsDialog(self)
+        self._diagnostics.show()
+        self._diagnostics.raise_()
+
+    def closeEvent(self, event):
+        # don't leave a worker thread running behind a closed window
+        if self._thread is not None:
+            self._worker.cancel()
+            self._thread.quit()
+            if not self._thread.wait(CLOSE_WAIT_MS):
+                # stuck in one long step: close anyway, main() waits for it at exit
+                self._thread.setParent(None)
+                _leftover_threads.append(self._thread)
+        super().closeEvent(event)
 
 
 #  Main entry point of the program 
 def main():
+    binlator_profile.start_session("gui")
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
-    sys.exit(app.exec_())
+
+    # --startup-time: print import / first paint timings and quit
+    if "--startup-time" in sys.argv[1:]:
+        def report():
+            if window.first_paint_time is None:
+                QTimer.singleShot(10, report)  # not painted yet
+                return
+            ms = lambda t: (t - _T_START) * 1000
+            print(
+                f"startup: imports {ms(_T_IMPORTED):.1f} ms, "
+                f"first paint {ms(window.first_paint_time):.1f} ms "
+                f"(ui from {window.ui_source})"
+            )
+            app.quit()
+        QTimer.singleShot(0, report)
+
+    status = app.exec_()
+    for thread in _leftover_threads:
+        thread.wait()   # (a QThread must not be destroyed while running)
+    sys.exit(status)
 
 
 #  Only runs this if file is executed directly 
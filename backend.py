@@ -3,365 +3,1309 @@
 # ==========================================================
 # TEST CHANGE 123
 
+import codecs
+import decimal
+import hashlib
+import os
+import re
+import sys
+import threading
+import time
+from array import array
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+from functools import partial
+from itertools import chain, product, repeat
+
 
 # ===========================
-# TEXT-BASED MODES
+# CODEC CORE (lookup tables)
 # ===========================
+# Every mode ends with "turn this number into digits" or "turn this number
+# into a character". Doing format()/chr() per character is slow on big inputs,
+# so the 0–255 range is precomputed once and higher code points are filled in
+# lazily (up to _CACHE_LIMIT entries) the first time they show up.
 
-# Text → Unicode/ASCII
-def text_to_unicode(user):
-    try:
-        if not isinstance(user, str): 
-            # Checks if the input is a string using isinstance()
-            return "Error: Input must be a string."
-        if not user or user.isspace(): 
-            # Checks if the user entered something (not empty or just spaces)
-            return "Error: Please enter something, not just spaces."
-        
-        
-        user = user.strip()  # removes leading/trailing spaces
-        user = " ".join(user.split()) # collapses multiple spaces into one
-
-        chars_only = [c for c in user if not c.isspace()]
-        # Collect all letters only, ignore spaces
-        space_count = sum(1 for c in user if c.isspace())
-        # Count how many spaces there are
-        if len(chars_only) >= 2 and space_count == len(chars_only) - 1:
-            # Check if the input looks like "H e l l o"
-            user = "".join(chars_only)   
-
-        # Collapse any remaining multiple spaces inside to a single space
-        user = " ".join(user.split())
-        # --- END NEW PART ---
-
-        unicode_list = []  # list to store Unicode/ASCII numbers/output
-        for jhaila in user:
-            unicode_list.append(ord(jhaila)) 
-            # 'ord()' converts each character to its Unicode/ASCII value
-        return unicode_list
-    except Exception:
-        # Catches any unexpected error
-        return "Error: Something went wrong while converting text to Unicode."
-
-
-
-
-# Text → Binary
-def text_to_binary(user):
-    try:
-        if not isinstance(user, str): 
-            # Ensures the input is text
-            return "Error: Input must be a string."
-        if not user or user.isspace(): 
-            # Prevents empty or whitespace-only inputs
-            return "Error: Please enter something, not just spaces."
-
-        user = user.strip()  # removes leading/trailing spaces
-        user = " ".join(user.split()) # collapses multiple spaces into one
-
-        chars_only = [c for c in user if not c.isspace()]
-        # Collect all letters only, ignore spaces
-        space_count = sum(1 for c in user if c.isspace())
-        # Count how many spaces there are
-        if len(chars_only) >= 2 and space_count == len(chars_only) - 1:
-            # Check if the input looks like "H e l l o"
-            user = "".join(chars_only)   
-        
-        binary_result = ''  # empty string to store binary output
-        for char in user:
-            binary_result += format(ord(char), '08b') + ' ' 
-            # Converts each letter to binary (8 bits per character)
-        return binary_result.strip()  # Removes the last extra space
-    except Exception:
-        return "Error: Something went wrong while converting text to binary."
-
-    
-# Text → Octal (list of octal strings, no 0o prefix)
-def text_to_octal(user):
-    try:
-        if not isinstance(user, str):
-            # Ensures input is a string
-            return "Error: Input must be a string."
-        if not user or user.isspace():
-            # Prevents empty or whitespace-only input
-            return "Error: Please enter something, not just spaces."
+_CACHE_LIMIT = 65536   # max entries per table (256 precomputed + lazy ones)
+_MAX_CODE_POINT = 0x10FFFF
 
-        user = user.strip()  # removes leading/trailing spaces
-        user = " ".join(user.split()) # collapses multiple spaces into one
 
-        chars_only = [c for c in user if not c.isspace()]
-        # Collect all letters only, ignore spaces
-        space_count = sum(1 for c in user if c.isspace())
-        # Count how many spaces there are
-        if len(chars_only) >= 2 and space_count == len(chars_only) - 1:
-            # Check if the input looks like "H e l l o"
-            user = "".join(chars_only)   
+class _CodecTable(dict):
+    """Lookup table: number -> converted value (digits string or character)."""
 
-        oct_list = []
-        for ch in user:
-            code = ord(ch)                 # Unicode code point
-            oct_list.append(format(code, "o"))  # to octal (no prefix)
-        return oct_list
-    except Exception:
-        return "Error: Something went wrong while converting text to octal."
+    def __init__(self, convert, limit=_CACHE_LIMIT):
+        super().__init__((i, convert(i)) for i in range(256))
+        self._convert = convert
+        self._limit = limit
 
+    def __missing__(self, code):
+        # Same call as before, so odd values (negative, huge) still give the
+        # exact same output or raise the exact same error.
+        value = self._convert(code)
+        if 0 <= code <= _MAX_CODE_POINT and len(self) < self._limit:
+            self[code] = value
+        return value
 
 
-# Text → Hexadecimal
-def text_to_hex(user):
-    try:
-        if not isinstance(user, str): 
-            # Ensures input is a string
-            return "Error: Input must be a string."
-        if not user or user.isspace(): 
-            # Prevents empty or whitespace-only inputs
-            return "Error: Please enter something, not just spaces."
-
-        user = user.strip()  # removes leading/trailing spaces
-        user = " ".join(user.split()) # collapses multiple spaces into one
-
-        chars_only = [c for c in user if not c.isspace()]
-        # Collect all letters only, ignore spaces
-        space_count = sum(1 for c in user if c.isspace())
-        # Count how many spaces there are
-        if len(chars_only) >= 2 and space_count == len(chars_only) - 1:
-            # Check if the input looks like "H e l l o"
-            user = "".join(chars_only)   
-        
-        hex_list = []  # list to store hexadecimal results
-        for char in user:
-            hex_list.append(format(ord(char), 'X')) 
-            # Converts each character to its hex code
-        return hex_list
-    except Exception:
-        return "Error: Something went wrong while converting text to hexadecimal."
+_BIN_TABLE = _CodecTable(lambda n: format(n, "08b"))   # 65 -> '01000001'
+_OCT_TABLE = _CodecTable(lambda n: format(n, "o"))     # 65 -> '101'
+_HEX_TABLE = _CodecTable(lambda n: format(n, "X"))     # 65 -> '41'
+_CHR_TABLE = _CodecTable(chr)                          # 65 -> 'A'
 
 
+def _codes_to_text(codes):
+    """Map every code point to its character and join them."""
+    return "".join(map(_CHR_TABLE.__getitem__, codes))
+
 
 # ===========================
-# BINARY-BASED MODES
+# OPTIONAL NUMPY ENGINE
 # ===========================
+# For big inputs the loops above are replaced by array operations from
+# backend_numpy.py. Only used when NumPy is installed; set USE_NUMPY = False
+# to always use the pure-Python path (results are the same either way).
+# NumPy is imported on the first big input, so small jobs start fast.
+
+USE_NUMPY = True
+NUMPY_MIN_SIZE = 64 * 1024  # characters; smaller inputs are faster in pure Python
+
+_np_engine = None     # backend_numpy module once loaded
+_np_missing = False   # True once we know NumPy is not installed
+
+
+def _numpy_wanted(user):
+    global _np_engine, _np_missing
+    if not USE_NUMPY or _np_missing or len(user) < NUMPY_MIN_SIZE:
+        return False
+    if _np_engine is None:
+        try:
+            import backend_numpy
+        except ImportError:
+            _np_missing = True
+            return False
+        _np_engine = backend_numpy
+    return True
 
-# Binary → Text
-def binary_to_text(user):
-    try:
-        if not isinstance(user, str):
-            return "Error: Input must be a string of binary values."
-        if not user or user.isspace():
-            return "Error: Please enter something, not just spaces."
 
-        cleaned = user.replace(" ", "")
+def _fast_text_codes(user):
+    """Code points of a big text as a NumPy array, or None."""
+    if _numpy_wanted(user):
+        return _np_engine.text_codes(user)
+    return None
 
-        #  Must be at least 8 bits
-        if len(cleaned) < 8:
-            return "Error: Need at least 8 bits."
 
-        # N If total bits > 8, require spaces
-        if len(cleaned) > 8 and " " not in user.strip():
-            return "Error: Missing spaces between bytes (e.g. '01000001 01000010')."
+def _fast_fixed_codes(user, base, width):
+    """
+    Values of a big, evenly spaced input like '01000001 01000010 ...'
+    as a NumPy array, or None when the normal per-token loop should run.
+    """
+    if _numpy_wanted(user):
+        return _np_engine.parse_fixed(user, base, width)
+    return None
 
-        # If exactly 8 bits, allow no spaces
-        if len(cleaned) == 8:
-            user = cleaned   # replace input with the clean single byte
 
-        # Now normal grouped validation
-        if len(cleaned) % 8 != 0:
-            return "Error: Total bit length must be a multiple of 8."
+# ===========================
+# PIPELINE: PARSERS
+# ===========================
+# Every mode is "parse the input into code points, then format them".
+# There is one parser per source base and one formatter per target base;
+# the mode functions further down just pick a pair.
+#
+# Parsers return a sized, sliceable sequence of code points: a list, a
+# NumPy array for big evenly spaced input, a memoryview of byte values, or
+# _LazyCodes. Text, hex and octal are parsed lazily, so a bad value is
+# reported at the same token as it always was.
+#
+# Short tokens (8-bit binary, 1–2 digit hex, 1–3 digit octal) skip int():
+# 'dd dd dd' hex and 'dddddddd dddddddd' binary are converted as one buffer
+# (bytes.fromhex / one int(bits, 2)), other spacings by looking every token
+# up in a table. Input either can't take goes on to the per-token parser,
+# so errors are the same as before.
 
-        text = ""
-        for b in user.split():
-            if len(b) != 8:
-                return "Error: Each group must be 8 bits."
-            decimal_value = int(b, 2)
-            text += chr(decimal_value)
+_EMPTY_MSG = "Error: Please enter something, not just spaces."
+_GROUP_MSG = "Error: Each group must be 8 bits."
 
-        return text
+# Characters a whole binary/octal input may not contain (one C-level scan)
+_NOT_BINARY_OR_SPACE = re.compile("[^01 \t\n\r]")
+_NOT_OCTAL_OR_SPACE = re.compile("[^0-7 \t\n\r]")
 
-    except ValueError:
-        return "Error: Make sure you only enter valid binary numbers (0s and 1s)."
-    except Exception:
-        return "Error: Something went wrong while converting binary to text."
 
+# token -> value for every short token of a base
+_BINARY_VALUES = {format(n, "08b"): n for n in range(256)}
+_HEX_VALUES = {
+    "".join(digits): int("".join(digits), 16)
+    for width in (1, 2) for digits in product("0123456789abcdefABCDEF", repeat=width)
+}
+_OCTAL_VALUES = {
+    "".join(digits): int("".join(digits), 8)
+    for width in (1, 2, 3) for digits in product("01234567", repeat=width)
+}
 
 
-# Binary → Unicode/ASCII
-def binary_to_unicode(user):
-    try:
-        if not isinstance(user, str):
-            return "Error: Input must be a string of binary values."
-        if not user or user.isspace():
-            return "Error: Please enter something, not just spaces."
+class _InputError(Exception):
+    """Input has the wrong shape; the message is shown as-is."""
 
-        cleaned = user.replace(" ", "")
 
-        if len(cleaned) < 8:
-            return "Error: Need at least 8 bits."
+class _BadDigits(ValueError):
+    """Input contains characters that are not digits of its base."""
 
-        #  allow single byte without spaces
-        if len(cleaned) > 8 and " " not in user.strip():
-            return "Error: Missing spaces between bytes (e.g. '01000001 01000010')."
 
-        if len(cleaned) == 8:
-            user = cleaned
+class _LazyCodes:
+    """
+    Characters or digit tokens that are turned into code points only when
+    iterated (ord() for text, int(tok, base) for tokens). Supports len() and
+    slicing so the work can be split into blocks.
+    """
 
-        if len(cleaned) % 8 != 0:
-            return "Error: Total bit length must be a multiple of 8."
+    def __init__(self, items, base=None):
+        self._items = items
+        self._base = base
 
-        number_list = []
-        for b in user.split():
-            if len(b) != 8:
-                return "Error: Each group must be 8 bits."
-            number_list.append(int(b, 2))
+    def __len__(self):
+        return len(self._items)
 
-        return number_list
+    def __getitem__(self, part):
+        return _LazyCodes(self._items[part], self._base)
 
-    except ValueError:
-        return "Error: Make sure you only enter valid binary numbers (0s and 1s)"
-    except Exception:
-        return "Error: Something went wrong while converting binary to Unicode."
+    def __iter__(self):
+        if self._base is None:
+            return map(ord, self._items)
+        return map(int, self._items, repeat(self._base))
+
+
+def _is_octal_or_space(s: str) -> bool:
+    """True only if s contains digits 0–7 and/or whitespace."""
+    return _NOT_OCTAL_OR_SPACE.search(s) is None
 
-# Binary to Octal 
-def binary_to_octal(user):
+
+def _prepare_text(user):
+    """
+    Text modes: trim, collapse multiple spaces into one, and glue
+    spaced-out letters back together ('H e l l o' -> 'Hello').
+    """
+    user = " ".join(user.split())
+    space_count = user.count(" ")
+    letter_count = len(user) - space_count
+    if letter_count >= 2 and space_count == letter_count - 1:
+        user = user.replace(" ", "")
+    return user
+
+
+def _parse_text(user):
+    return _text_codes(_prepare_text(user))
+
+
+def _text_codes(user):
+    """Already prepared text -> code points."""
+    codes = _fast_text_codes(user)
+    if codes is not None:
+        return codes
+    return _LazyCodes(user)  # each character -> its Unicode/ASCII value
+
+
+def _parse_binary(user):
+    """8-bit binary bytes, e.g. '01000001 01000010'."""
+    return _parse_binary_groups(_check_binary_shape(user))
+
+
+def _check_binary_shape(user):
+    """Whole-input checks for 8-bit binary. Returns the text to split into bytes."""
+    cleaned = user.replace(" ", "")
+    message = _binary_shape_error(len(cleaned), lambda: " " in user.strip())
+    if message is not None:
+        raise _InputError(message)
+
+    # If exactly 8 bits, allow no spaces
+    if len(cleaned) == 8:
+        user = cleaned   # replace input with the clean single byte
+    return user
+
+
+def _binary_shape_error(bits, spaced):
+    """
+    The message _check_binary_shape() gives for an input with `bits`
+    characters other than ' ', or None. spaced() says whether there is a
+    ' ' inside user.strip() (only asked when it matters).
+    """
+    #  Must be at least 8 bits
+    if bits < 8:
+        return "Error: Need at least 8 bits."
+
+    # If total bits > 8, require spaces
+    if bits > 8 and not spaced():
+        return "Error: Missing spaces between bytes (e.g. '01000001 01000010')."
+
+    # Now normal grouped validation
+    if bits % 8 != 0:
+        return "Error: Total bit length must be a multiple of 8."
+    return None
+
+
+def _table_values(tokens, table):
+    """Values of tokens that are all in table (a list), or None."""
     try:
-        # If you added _auto_space_binary earlier, keep using it:
-        # user = _auto_space_binary(user)
+        return list(map(table.__getitem__, tokens))
+    except KeyError:
+        return None
 
-        if not isinstance(user, str):
-            return "Error: Input must be a string of binary values."
-        if not user or user.isspace():
-            return "Error: Please enter something, not just spaces."
-        # simple 0/1/space check (same pattern as others)
-        for ch in user:
-            if ch not in ("0","1"," ", "\t", "\n", "\r"):
-                return "Error: Make sure you only enter valid binary numbers (0s and 1s)."
-
-        jef = []
-        for tok in user.split():
-            jhaila = int(tok, 2)        # binary → decimal
-            jef.append(format(jhaila, "o"))  # decimal → octal
-        return jef
+
+def _table_bytes(tokens, table):
+    """Same for tables of byte values, as bytes."""
+    try:
+        return bytes(map(table.__getitem__, tokens))
+    except KeyError:
+        return None
+
+
+def _binary_bytes(user):
+    """'01001000 01101001' (8 bits per token, single spaces) -> bytes, or None."""
+    text = user.strip()
+    count = (len(text) + 1) // 9
+    if len(text) != 9 * count - 1 or text[8::9] != " " * (count - 1):
+        return None
+    bits = text.replace(" ", "")
+    if len(bits) != 8 * count or not bits.isascii() or bits.encode("ascii").translate(None, b"01"):
+        return None
+    return int(bits, 2).to_bytes(count, "big")
+
+
+def _hex_bytes(user):
+    """'48 69 21' (2 digits per token, one whitespace between) -> bytes, or None."""
+    text = user.strip()
+    if len(text) % 3 != 2 or not (len(text) == 2 or text[2::3].isspace()):
+        return None
+    try:
+        data = bytes.fromhex(text)
     except ValueError:
-        return "Error: Make sure you only enter valid binary numbers (0s and 1s)."
-    except Exception:
-        return "Error: Something went wrong while converting binary to octal."
+        return None
+    # 2 digits per byte and exactly one separator each: nothing else fits
+    return data if len(data) * 3 - 1 == len(text) else None
+
+
+def _parse_binary_groups(user):
+    """Split shape-checked binary into 8-bit groups -> code points."""
+    codes = _fast_fixed_codes(user, 2, 8)
+    if codes is not None:
+        return codes
+    data = _binary_bytes(user)
+    if data is not None:
+        return memoryview(data)
+
+    groups = user.split()
+    data = _table_bytes(groups, _BINARY_VALUES)
+    if data is not None:
+        return memoryview(data)
+
+    codes = []
+    for b in groups:
+        if len(b) != 8:
+            raise _InputError(_GROUP_MSG)
+        codes.append(int(b, 2))
+    return codes
+
+
+def _parse_binary_any_width(user):
+    """Binary numbers of any length (used by Binary → Octal)."""
+    codes = _fast_fixed_codes(user, 2, 8)  # evenly spaced bytes pass the check below
+    if codes is not None:
+        return codes
+
+    # simple 0/1/space check
+    if _NOT_BINARY_OR_SPACE.search(user):
+        raise _BadDigits()
+    return [int(tok, 2) for tok in user.split()]
+
+
+def _parse_decimal(user, progress=None):
+    tokens = user.split()
+    if progress is None:
+        return [int(tok) for tok in tokens]
+    # every token is parsed up front, so this reports progress too
+    codes = []
+    for start in range(0, len(tokens), PROGRESS_BLOCK):
+        progress(start, len(tokens))
+        codes.extend(map(int, tokens[start:start + PROGRESS_BLOCK]))
+    return codes
+
+
+def _parse_octal(user):
+    codes = _fast_fixed_codes(user, 8, 3)
+    if codes is not None:
+        return codes
+
+    if not _is_octal_or_space(user):
+        raise _BadDigits()
+    tokens = user.split()
+    codes = _table_values(tokens, _OCTAL_VALUES)
+    if codes is not None:
+        return codes
+    return _LazyCodes(tokens, 8)
+
+
+def _parse_hex(user):
+    codes = _fast_fixed_codes(user, 16, 2)
+    if codes is not None:
+        return codes
+    data = _hex_bytes(user)
+    if data is not None:
+        return memoryview(data)
+
+    tokens = user.split()
+    data = _table_bytes(tokens, _HEX_VALUES)
+    if data is not None:
+        return memoryview(data)
+    return _LazyCodes(tokens, 16)
 
 
-# Binary → Hexadecimal
-def binary_to_hex(user):
+# ===========================
+# RESULT TYPE
+# ===========================
+# Modes with a number target (Unicode/decimal, binary, octal, hex) return a
+# CodeList: the code points packed 4 bytes each in an array('I'), plus the
+# target base. It reads like the list these modes used to return (len,
+# indexing, slicing, iteration, == with a list), with ints for decimal and
+# digit strings ('41', '01000001') for the other bases, but no per-item
+# objects are made until something asks for them.
+#
+# result.render() builds the final text in one pass, straight from the
+# packed values:
+#
+#   text_to_hex("Hi").render()                       -> '48 69'
+#   text_to_hex("\n").render(sep=",", case="lower", pad=4)  -> '000a'
+#   text_to_binary_stream(...)  /  result.write(f)   -> written in blocks
+#
+# Values that don't fit 32 bits (negative or huge numbers typed by the
+# user) are kept in a plain list instead; everything else works the same.
+
+_LOWER_HEX_TABLE = _CodecTable(lambda n: format(n, "x"))   # 171 -> 'ab'
+
+_ITEM_TABLES = {"binary": _BIN_TABLE, "octal": _OCT_TABLE, "hex": _HEX_TABLE}
+_ITEM_SPECS = {"decimal": "d", "binary": "b", "octal": "o", "hex": "X"}
+_ITEM_WIDTHS = {"decimal": 1, "binary": 8, "octal": 1, "hex": 1}   # digits without padding
+
+RENDER_BLOCK = 64 * 1024   # values rendered per write() call
+
+
+def _code_array(codes):
+    """Code points -> array('I'), or a list when some value doesn't fit."""
+    if _is_numpy(codes):
+        return array("I", codes.astype("=u4").tobytes())
+    if isinstance(codes, _LazyCodes) and codes._base is None:
+        values = array("I")
+        values.frombytes(codes._items.encode("utf-32", "surrogatepass")[4:])   # minus the BOM
+        return values
+    if iter(codes) is codes:
+        codes = list(codes)   # a one-shot iterator: keep it for the fallback
     try:
-        if not isinstance(user, str):
-            return "Error: Input must be a string of binary values."
-        if not user or user.isspace():
-            return "Error: Please enter something, not just spaces."
+        return array("I", codes)
+    except OverflowError:   # negative, or above 0xFFFFFFFF
+        return list(codes)
+
+
+class CodeList(Sequence):
+    """Read-only list of converted numbers, stored compactly (see above)."""
+
+    __slots__ = ("_values", "kind")
+
+    def __init__(self, values, kind):
+        self._values = values   # array('I') or list of ints
+        self.kind = kind        # "decimal", "binary", "octal" or "hex"
+
+    @classmethod
+    def from_codes(cls, codes, kind):
+        return cls(_code_array(codes), kind)
+
+    @classmethod
+    def concat(cls, parts):
+        """Join CodeLists of the same kind into one."""
+        parts = list(parts)
+        if all(isinstance(p._values, array) for p in parts):
+            values = array("I")
+        else:
+            values = []
+        for p in parts:
+            values.extend(p._values)
+        return cls(values, parts[0].kind if parts else "decimal")
+
+    # ---- sequence ----
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CodeList(self._values[index], self.kind)
+        value = self._values[index]
+        return value if self.kind == "decimal" else _ITEM_TABLES[self.kind][value]
+
+    def __iter__(self):
+        if self.kind == "decimal":
+            return iter(self._values)
+        return map(_ITEM_TABLES[self.kind].__getitem__, self._values)
+
+    def __eq__(self, other):
+        if isinstance(other, CodeList):
+            return self.kind == other.kind and list(self._values) == list(other._values)
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+    def __sizeof__(self):
+        size = object.__sizeof__(self) + sys.getsizeof(self._values)
+        if isinstance(self._values, list):
+            size += sum(map(sys.getsizeof, self._values))
+        return size
+
+    def tolist(self):
+        """The items as a real list (what these modes used to return)."""
+        return list(self)
+
+    # ---- output ----
+
+    def _strings(self, values, case, pad):
+        """Iterator of the digit strings for `values` with the given options."""
+        if case not in ("upper", "lower"):
+            raise ValueError(f"case must be 'upper' or 'lower', not {case!r}")
+        lower = case == "lower" and self.kind == "hex"
+        if not pad or pad <= _ITEM_WIDTHS[self.kind]:
+            if self.kind == "decimal":
+                return map(str, values)
+            table = _LOWER_HEX_TABLE if lower else _ITEM_TABLES[self.kind]
+            return map(table.__getitem__, values)
+        spec = f"0{pad}" + (_ITEM_SPECS[self.kind].lower() if lower else _ITEM_SPECS[self.kind])
+        return map(format, values, repeat(spec))
+
+    def render(self, sep=" ", case="upper", pad=None):
+        """
+        The output text: every item as digits, joined with `sep`. case is
+        "upper" or "lower" (hex letters), pad a minimum digit count (zeros
+        are added in front; binary always has at least 8).
+        """
+        return sep.join(self._strings(self._values, case, pad))
+
+    def write(self, out, sep=" ", case="upper", pad=None):
+        """render() into a text stream block by block. Returns the characters written."""
+        written = 0
+        for start in range(0, len(self._values), RENDER_BLOCK):
+            block = self[start:start + RENDER_BLOCK].render(sep, case, pad)
+            if start:
+                block = sep + block
+            out.write(block)
+            written += len(block)
+        return written
 
-        cleaned = user.replace(" ", "")
 
-        if len(cleaned) < 8:
-            return "Error: Need at least 8 bits."
+# ===========================
+# PIPELINE: FORMATTERS
+# ===========================
 
-        if len(cleaned) > 8 and " " not in user.strip():
-            return "Error: Missing spaces between bytes (e.g. '01000001 01000010')."
+def _is_numpy(codes):
+    return _np_engine is not None and isinstance(codes, _np_engine.np.ndarray)
 
-        if len(cleaned) == 8:
-            user = cleaned
 
-        if len(cleaned) % 8 != 0:
-            return "Error: Total bit length must be a multiple of 8."
+def _format_text(codes):
+    if _is_numpy(codes):
+        return _np_engine.to_text(codes)
+    if isinstance(codes, _LazyCodes) and codes._base is None:
+        return codes._items   # still the text itself
+    if isinstance(codes, (bytes, memoryview)):
+        return str(codes, "latin-1")   # byte values, one character each
+    return _codes_to_text(codes)
 
-        hex_list = []
-        for b in user.split():
-            if len(b) != 8:
-                return "Error: Each group must be 8 bits."
-            decimal_value = int(b, 2)
-            hex_list.append(format(decimal_value, 'X'))
 
-        return hex_list
+def _format_decimal(codes):
+    return CodeList.from_codes(codes, "decimal")
 
-    except ValueError:
-        return "Error: Make sure you only enter valid binary numbers (0s and 1s)"
-    except Exception:
-        return "Error: Something went wrong while converting binary to hexadecimal."
+
+def _format_binary(codes):
+    return CodeList.from_codes(codes, "binary")
+
+
+def _format_binary_joined(codes):
+    """Binary as one string: '01001000 01101001' (Text → Binary)."""
+    if _is_numpy(codes):
+        return _np_engine.to_joined_digits(codes, 2, 8)
+    return _format_binary(codes).render()
+
+
+def _format_octal(codes):
+    return CodeList.from_codes(codes, "octal")
+
+
+def _format_hex(codes):
+    return CodeList.from_codes(codes, "hex")
 
 
 # ===========================
-# UNICODE/ASCII-BASED MODES
+# PIPELINE: BYTE ENCODINGS
 # ===========================
+# The classic modes work on code points: 'é' is one number (233) whatever
+# the encoding. The encoding modes show the bytes a text is stored as
+# instead: Text → UTF-8 Hexadecimal gives 'C3 A9' for 'é', and
+# UTF-16LE Hexadecimal → Text reads '3D D8 00 DE' back as '😀'.
+#
+# Both directions work on the whole buffer at once: str.encode() and
+# bytes.decode() for the codec, bytes.hex() / bytes.fromhex() for hex
+# digits and one int(bits, 2) for binary, so there is no Python loop per
+# character. Text is encoded exactly as typed (no trimming, no 'H e l l o'
+# gluing), since every byte counts.
+
+_ENCODINGS = {   # name -> (codec, label)
+    "utf8": ("utf-8", "UTF-8"),
+    "utf16le": ("utf-16-le", "UTF-16LE"),
+    "utf16be": ("utf-16-be", "UTF-16BE"),
+    "utf32be": ("utf-32-be", "UTF-32BE"),
+}
+# base ("utf8_hex", ...) -> (codec, label, digits)
+_ENCODED_BASES = {
+    f"{name}_{digits}": (codec, label, digits)
+    for name, (codec, label) in _ENCODINGS.items()
+    for digits in ("binary", "hex")
+}
+
+
+def _invalid_bytes_msg(base):
+    return f"Error: These bytes are not valid {_ENCODED_BASES[base][1]}."
+
+
+def _digits_to_bytes(user, digits):
+    """'C3 A9' or '11000011 10101001' -> b'\\xc3\\xa9' (ValueError for anything else)."""
+    if digits == "hex":
+        return bytes.fromhex(user)
+    codes = _fast_fixed_codes(user, 2, 8)   # big evenly spaced input
+    if codes is not None:
+        return codes.astype("u1").tobytes()
+
+    # 8 bits per group, or one unspaced run of whole bytes
+    groups = user.split()
+    bits = "".join(groups)
+    if len(groups) > 1 and (max(map(len, groups)) != 8 or len(bits) != 8 * len(groups)):
+        raise ValueError("each group must be 8 bits")
+    if len(bits) % 8 or not bits.isascii() or bits.encode("ascii").translate(None, b"01"):
+        raise ValueError("not 8-bit binary")
+    return int(bits, 2).to_bytes(len(bits) // 8, "big")
+
+
+def _bytes_to_digits(data, digits):
+    """b'\\xc3\\xa9' -> 'C3 A9' or '11000011 10101001'."""
+    if digits == "hex":
+        return data.hex(" ").upper()
+    if _numpy_wanted(data):
+        return _np_engine.to_joined_digits(_np_engine.np.frombuffer(data, dtype=_np_engine.np.uint8), 2, 8)
+    return " ".join(map(_BIN_TABLE.__getitem__, data))
+
+
+def _encoded_parser(base):
+    codec, _, digits = _ENCODED_BASES[base]
+
+    def parse(user):
+        data = _digits_to_bytes(user, digits)
+        try:
+            return _LazyCodes(data.decode(codec))
+        except UnicodeDecodeError:
+            raise _InputError(_invalid_bytes_msg(base)) from None
+
+    return parse
+
+
+def _encoded_formatter(base):
+    codec, _, digits = _ENCODED_BASES[base]
+
+    def fmt(codes):
+        return _bytes_to_digits(_format_text(codes).encode(codec), digits)
+
+    return fmt
 
-# Unicode/ASCII → Text
-def unicode_to_text(user):
-    try:
-        if not isinstance(user, str): 
-            return "Error: Input must be a string of numbers."
-        if not user or user.isspace(): 
-            return "Error: Please enter something, not just spaces."
-
-        number_list = []  # stores Unicode numbers
-        for b in user.split():
-            number_list.append(int(b))  # converts string to integer
-        result_text = ''
-        for code in number_list:
-            result_text += chr(code)  # converts number to character
-        return result_text
-    except ValueError:
-        return "Error: Please enter valid decimal numbers (e.g. 65 66 67)."
-    except Exception:
-        return "Error: Something went wrong while converting Unicode to text."
 
+# ===========================
+# PIPELINE: WHOLE NUMBERS
+# ===========================
+# The whole input as one number (a key, a checksum, a big constant) instead
+# of one number per token: 'DE AD BE EF' as a Hexadecimal Number is
+# 3735928559. Whitespace anywhere is ignored, and a 0b/0o/0x prefix that
+# matches the base is allowed.
+#
+# Between binary, octal and hex, int(digits, base) and format(n, spec)
+# only regroup the bits (linear time, and not subject to the int
+# max-str-digits limit). Decimal needs a real base conversion; the
+# built-in one is quadratic and refuses more than 4300 digits by default,
+# so it is done divide and conquer:
+#   digits -> int  split the digits in half and combine the two values as
+#                  high * 10**k + low (Karatsuba products, cached powers)
+#   int -> digits  split the bits in half and combine the halves in the
+#                  decimal module, whose big products are faster still
+# Pieces below _DC_DIGITS digits / _DC_BITS bits are converted directly.
+
+_NUMBER_BASES = {"binary_number": 2, "octal_number": 8, "decimal_number": 10, "hex_number": 16}
+_NUMBER_PREFIXES = {2: ("0b", "0B"), 8: ("0o", "0O"), 16: ("0x", "0X")}
+_NUMBER_SPECS = {2: "b", 8: "o", 16: "X"}
+_NUMBER_DIGITS = {2: b"01", 8: b"01234567", 10: b"0123456789", 16: b"0123456789abcdefABCDEF"}
+_DC_DIGITS = 4000   # decimal digits int() takes in one go (the default limit is 4300)
+_DC_BITS = 8000     # bits (about 2400 digits) str() / Decimal() take in one go
+
+# big enough for any integer, and exact
+_EXACT_DECIMAL = decimal.Context(
+    prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN, traps=[decimal.Inexact]
+)
+
+
+def _number_digits(user, base):
+    """The digits of a whole-number input, without whitespace or prefix."""
+    digits = "".join(user.split())
+    if digits[:2] in _NUMBER_PREFIXES.get(base, ()):
+        digits = digits[2:]
+    if not digits or not digits.isascii() or digits.encode("ascii").translate(None, _NUMBER_DIGITS[base]):
+        raise _BadDigits()
+    return digits
+
+
+def _decimal_to_int(digits, tick=None):
+    """Decimal digit string -> int in subquadratic time. tick() is called before every piece."""
+    limit = getattr(sys, "get_int_max_str_digits", lambda: 0)()   # 0 = no limit
+    leaf = min(_DC_DIGITS, limit or _DC_DIGITS)
+    powers = {}
+
+    def convert(lo, hi):
+        if hi - lo <= leaf:
+            if tick is not None:
+                tick()
+            return int(digits[lo:hi])
+        mid = (lo + hi + 1) // 2
+        width = hi - mid
+        power = powers.get(width)
+        if power is None:
+            power = powers[width] = 5 ** width
+        return (convert(lo, mid) * power << width) + convert(mid, hi)   # high * 10**width + low
+
+    return convert(0, len(digits))
+
+
+def _int_to_decimal(n, tick=None):
+    """int (>= 0) -> decimal digit string in subquadratic time. tick() is called before every piece."""
+    if n.bit_length() <= _DC_BITS:
+        return str(n)
+    powers = {}
+
+    def convert(n, bits):   # n < 2**bits
+        if bits <= _DC_BITS:
+            if tick is not None:
+                tick()
+            return decimal.Decimal(n)
+        half = bits >> 1
+        high = n >> half
+        low = n - (high << half)
+        power = powers.get(half)
+        if power is None:
+            power = powers[half] = decimal.Decimal(2) ** half
+        return convert(high, bits - half) * power + convert(low, half)
+
+    with decimal.localcontext(_EXACT_DECIMAL):
+        return str(convert(n, n.bit_length()))
+
+
+def _number_parser(base):
+    def parse(user, tick=None):
+        digits = _number_digits(user, base)
+        return _decimal_to_int(digits, tick) if base == 10 else int(digits, base)
+
+    return parse
+
+
+def _number_formatter(base):
+    if base == 10:
+        return _int_to_decimal
+    spec = _NUMBER_SPECS[base]
+    return lambda n, tick=None: format(n, spec)   # linear, one C call
 
-# Unicode/ASCII → Binary
-def unicode_to_binary(user):
+
+# ===========================
+# PIPELINE: MODE TABLE
+# ===========================
+
+_PARSERS = {
+    "text": _parse_text,
+    "binary": _parse_binary,
+    "decimal": _parse_decimal,
+    "octal": _parse_octal,
+    "hex": _parse_hex,
+    **{base: _encoded_parser(base) for base in _ENCODED_BASES},
+    **{name: _number_parser(base) for name, base in _NUMBER_BASES.items()},
+}
+
+_FORMATTERS = {
+    "text": _format_text,
+    "decimal": _format_decimal,
+    "binary": _format_binary,
+    "octal": _format_octal,
+    "hex": _format_hex,
+    **{base: _encoded_formatter(base) for base in _ENCODED_BASES},
+    **{name: _number_formatter(base) for name, base in _NUMBER_BASES.items()},
+}
+
+# Message shown when the input is not a str at all
+_TYPE_MSGS = {
+    "text": "Error: Input must be a string.",
+    "binary": "Error: Input must be a string of binary values.",
+    "decimal": "Error: Input must be a string of numbers.",
+    "octal": "Error: Input must be a string of octal values.",
+    "hex": "Error: Input must be a string of hexadecimal values.",
+    **{base: f"Error: Input must be a string of {'hexadecimal' if digits == 'hex' else 'binary'} bytes."
+       for base, (_, _, digits) in _ENCODED_BASES.items()},
+    "binary_number": "Error: Input must be a string of binary digits.",
+    "octal_number": "Error: Input must be a string of octal digits.",
+    "decimal_number": "Error: Input must be a string of decimal digits.",
+    "hex_number": "Error: Input must be a string of hexadecimal digits.",
+}
+
+_BINARY_MSG = "Error: Make sure you only enter valid binary numbers (0s and 1s)"
+_DECIMAL_MSG = "Error: Please enter valid decimal numbers."
+_OCTAL_MSG = "Error: Please enter valid octal values (0–7)."
+_HEX_MSG = "Error: Please enter valid hexadecimal values (0–9, A–F)."
+_FAIL = "Error: Something went wrong while converting "
+_BYTE_DIGITS_MSGS = {
+    "hex": "Error: Please enter hexadecimal bytes, two digits each (e.g. C3 A9).",
+    "binary": "Error: Please enter 8-bit binary bytes (e.g. 11000011 10101001).",
+}
+
+# (source, target): (bad value message, catch-all message)
+# Text modes have no "bad value" case, so any error there is the catch-all.
+_MODE_MSGS = {
+    ("text", "decimal"): (None, _FAIL + "text to Unicode."),
+    ("text", "binary"): (None, _FAIL + "text to binary."),
+    ("text", "octal"): (None, _FAIL + "text to octal."),
+    ("text", "hex"): (None, _FAIL + "text to hexadecimal."),
+
+    ("binary", "text"): (_BINARY_MSG + ".", _FAIL + "binary to text."),
+    ("binary", "decimal"): (_BINARY_MSG, _FAIL + "binary to Unicode."),
+    ("binary", "octal"): (_BINARY_MSG + ".", _FAIL + "binary to octal."),
+    ("binary", "hex"): (_BINARY_MSG, _FAIL + "binary to hexadecimal."),
+
+    ("decimal", "text"): ("Error: Please enter valid decimal numbers (e.g. 65 66 67).",
+                          _FAIL + "Unicode to text."),
+    ("decimal", "binary"): (_DECIMAL_MSG, _FAIL + "Unicode to binary."),
+    ("decimal", "octal"): (_DECIMAL_MSG, _FAIL + "decimal to octal."),
+    ("decimal", "hex"): (_DECIMAL_MSG, _FAIL + "decimal to hex."),
+
+    ("hex", "text"): (_HEX_MSG, _FAIL + "hex to text."),
+    ("hex", "decimal"): (_HEX_MSG, _FAIL + "hex to decimal."),
+    ("hex", "binary"): (_HEX_MSG, _FAIL + "hex to binary."),
+    ("hex", "octal"): (_HEX_MSG, _FAIL + "hexadecimal to octal."),
+
+    ("octal", "text"): (_OCTAL_MSG, _FAIL + "octal to text."),
+    ("octal", "binary"): (_OCTAL_MSG, _FAIL + "octal to binary."),
+    ("octal", "decimal"): (_OCTAL_MSG, _FAIL + "octal to decimal."),
+    ("octal", "hex"): (_OCTAL_MSG, _FAIL + "octal to hexadecimal."),
+
+    **{("text", base): (f"Error: Some characters can't be written as {label}.", _FAIL + f"text to {label}.")
+       for base, (_, label, _) in _ENCODED_BASES.items()},
+    **{(base, "text"): (_BYTE_DIGITS_MSGS[digits], _FAIL + f"{label} to text.")
+       for base, (_, label, digits) in _ENCODED_BASES.items()},
+
+    ("binary_number", "octal_number"): (_BINARY_MSG + ".", _FAIL + "the binary number to octal."),
+    ("binary_number", "decimal_number"): (_BINARY_MSG + ".", _FAIL + "the binary number to decimal."),
+    ("binary_number", "hex_number"): (_BINARY_MSG + ".", _FAIL + "the binary number to hexadecimal."),
+    ("octal_number", "binary_number"): (_OCTAL_MSG, _FAIL + "the octal number to binary."),
+    ("octal_number", "decimal_number"): (_OCTAL_MSG, _FAIL + "the octal number to decimal."),
+    ("octal_number", "hex_number"): (_OCTAL_MSG, _FAIL + "the octal number to hexadecimal."),
+    ("decimal_number", "binary_number"): (_DECIMAL_MSG, _FAIL + "the decimal number to binary."),
+    ("decimal_number", "octal_number"): (_DECIMAL_MSG, _FAIL + "the decimal number to octal."),
+    ("decimal_number", "hex_number"): (_DECIMAL_MSG, _FAIL + "the decimal number to hexadecimal."),
+    ("hex_number", "binary_number"): (_HEX_MSG, _FAIL + "the hex number to binary."),
+    ("hex_number", "octal_number"): (_HEX_MSG, _FAIL + "the hex number to octal."),
+    ("hex_number", "decimal_number"): (_HEX_MSG, _FAIL + "the hex number to decimal."),
+}
+
+# Modes that don't use the default parser/formatter/bad-digit message
+_PARSER_OVERRIDES = {
+    ("binary", "octal"): _parse_binary_any_width,
+    **{("text", base): _LazyCodes for base in _ENCODED_BASES},   # exactly as typed
+}
+_FORMATTER_OVERRIDES = {("text", "binary"): _format_binary_joined}
+_BAD_DIGITS_MSGS = {("octal", "text"): "Error: Please add spaces to octal values (0–7)."}
+
+# How to glue together the output of a formatter run block by block
+_JOIN_BLOCKS = {
+    _format_text: "".join,
+    _format_binary_joined: " ".join,
+    **{_FORMATTERS[base]: " ".join for base in _ENCODED_BASES},
+}
+_join_lists = CodeList.concat
+
+
+# ===========================
+# INPUT VALIDATION
+# ===========================
+# check_input(func, user) points at the token a mode rejects: its character
+# offset, line and column. _convert runs the same scan before parsing, so
+# bad input is turned down without converting everything in front of it.
+#
+# The input is checked in windows of VALIDATE_WINDOW characters. An ASCII
+# window is mapped through a 256-byte class table for its base (digit -> 'x',
+# whitespace -> ' ', anything else -> '!'), and a few C-level searches on the
+# result tell whether anything in it needs a closer look: a '!', a digit run
+# too long for a code point (Text targets) or a binary group that isn't 8
+# long. Only such windows are searched token by token, and every suspect is
+# checked with the same int()/chr() calls the parser and formatter make, so
+# the message is exactly the one the conversion gives, and tokens int()
+# accepts anyway ('0x41', '-5', '1_0') are let through.
+
+VALIDATE_WINDOW = 1 << 20
+
+_BASES = {"binary": 2, "decimal": 10, "octal": 8, "hex": 16}
+_DIGITS = {"binary": "01", "decimal": "0123456789", "octal": "01234567",
+           "hex": "0123456789abcdefABCDEF"}
+_TEXT_SAFE_DIGITS = {"decimal": 6, "octal": 6, "hex": 5}  # longest run that always fits chr()
+_ASCII_SPACE = "".join(c for c in map(chr, range(128)) if c.isspace())
+
+# Modes whose parser rejects the whole input for one stray character
+_WHOLE_INPUT_CLASSES = {
+    ("binary", "octal"): _NOT_BINARY_OR_SPACE,
+    **{("octal", target): _NOT_OCTAL_OR_SPACE for target in ("text", "binary", "decimal", "hex")},
+}
+
+_SPACE_BEFORE = re.compile(r"\s\S*\Z")   # last whitespace before a position
+_TOKEN_REST = re.compile(r"\S*")
+
+
+def _class_table(digits, spaces):
+    table = bytearray(b"!" * 256)
+    table[ord(" ")] = ord(" ")   # never a digit; keeps the table valid for any class
+    for c in digits:
+        table[ord(c)] = ord("x")
+    for c in spaces:
+        table[ord(c)] = ord(" ")
+    return bytes(table)
+
+
+def _suspect_pattern(source, target):
+    parts = [f"[^{_DIGITS[source]}\\s]"]
+    if source == "binary":
+        parts.append(r"(?<!\S)(?:\S{1,7}|\S{9,})(?!\S)")   # not 8 digits long
+    elif target == "text":
+        parts.append(f"[{_DIGITS[source]}]{{{_TEXT_SAFE_DIGITS[source] + 1},}}")
+    return re.compile("|".join(parts))
+
+
+# key -> (class table, longest clean digit run or None, token-by-token pattern)
+_TOKEN_CHECKS = {
+    key: (
+        _class_table(_DIGITS[key[0]], _ASCII_SPACE),
+        8 if key[0] == "binary" else _TEXT_SAFE_DIGITS.get(key[0]) if key[1] == "text" else None,
+        _suspect_pattern(*key),
+    )
+    for key in _MODE_MSGS
+    if key[0] in _BASES and key not in _PARSER_OVERRIDES
+}
+_WHOLE_INPUT_TABLES = {key: _class_table(_DIGITS[key[0]], " \t\n\r") for key in _WHOLE_INPUT_CLASSES}
+
+
+class BadToken:
+    """Where a mode's input goes wrong. offset counts characters (bytes for the bytes API)."""
+
+    def __init__(self, message, user, start, end):
+        self.message = message
+        self.offset = start
+        self.token = user[start:end]
+        self.line = user.count("\n", 0, start) + 1
+        self.column = start - user.rfind("\n", 0, start)
+
+    def __str__(self):
+        return f"{self.message} (line {self.line}, column {self.column}: {self.token!r})"
+
+    def __repr__(self):
+        return f"BadToken(offset={self.offset}, line={self.line}, column={self.column}, token={self.token!r})"
+
+
+def _windows(user):
+    """(start, stop) spans of about VALIDATE_WINDOW chars that never cut a token."""
+    pos = 0
+    while pos < len(user):
+        stop = _TOKEN_REST.match(user, min(pos + VALIDATE_WINDOW, len(user))).end()
+        yield pos, stop
+        pos = stop
+
+
+def _token_bounds(user, pos):
+    """Start and end of the whitespace-separated token around user[pos]."""
+    end = _TOKEN_REST.match(user, pos).end()
+    size = 64
+    while True:
+        lo = max(pos - size, 0)
+        found = _SPACE_BEFORE.search(user, lo, pos)
+        if found is not None:
+            return found.start() + 1, end
+        if lo == 0:
+            return 0, end
+        size *= 4
+
+
+def _first_stray(key, user, progress):
+    """Offset of the first character the whole-input check rejects, or None."""
+    table = _WHOLE_INPUT_TABLES[key]
+    for start, stop in _windows(user):
+        progress(start, len(user))
+        window = user[start:stop]
+        if window.isascii():
+            found = window.encode("ascii").translate(table).find(b"!")
+            if found >= 0:
+                return start + found
+        else:
+            found = _WHOLE_INPUT_CLASSES[key].search(window)
+            if found is not None:
+                return start + found.start()
+    return None
+
+
+def _looks_clean(key, window):
+    """True if nothing in this window can be a bad token (False may be a false alarm)."""
+    if not window.isascii():
+        return False
+    table, longest, _ = _TOKEN_CHECKS[key]
+    classes = window.encode("ascii").translate(table)
+    if b"!" in classes:
+        return False
+    if longest is not None and b"x" * (longest + 1) in classes:
+        return False
+    if key[0] == "binary":
+        # no group is longer than 8, so 8 digits per group means all are 8
+        groups = classes.count(b" x") + classes.startswith(b"x")
+        return len(classes) - classes.count(b" ") == 8 * groups
+    return True
+
+
+def _token_error(key, token):
+    """(phase, exception) the conversion would hit on this token, or None."""
+    source, target = key
+    if source == "binary" and len(token) != 8:
+        return "parse", _InputError(_GROUP_MSG)
     try:
-        if not isinstance(user, str): 
-            return "Error: Input must be a string of numbers."
-        if not user or user.isspace(): 
-            return "Error: Please enter something, not just spaces."
-
-        binary_list = []
-        for code in user.split():
-            number = int(code)  # converts string to number
-            binary_list.append(format(number, '08b'))  # converts to binary
-        return binary_list
-    except ValueError:
-        return "Error: Please enter valid decimal numbers."
-    except Exception:
-        return "Error: Something went wrong while converting Unicode to binary."
-    
-# Unicode/ASCII → Octal
-def unicode_to_octal(user):
+        n = int(token, _BASES[source])
+    except ValueError as e:
+        return "parse", e
+    if target == "text":
+        try:
+            chr(n)
+        except Exception as e:  # ValueError, or OverflowError for huge values
+            return "format", e
+    return None
+
+
+def _find_bad_token(key, user, progress=None):
+    """
+    BadToken for the error the conversion of non-empty `user` would report
+    first, or None. progress(done, total) is called before every window.
+    """
+    if progress is None:
+        progress = _no_progress
+    if key in _WHOLE_INPUT_CLASSES:
+        pos = _first_stray(key, user, progress)
+        if pos is not None:
+            start, end = (pos, pos + 1) if user[pos].isspace() else _token_bounds(user, pos)
+            return BadToken(_error_message(key, _BadDigits()), user, start, end)
+
+    if key not in _TOKEN_CHECKS:
+        return None
+    if key[0] == "binary":
+        try:
+            if _check_binary_shape(user) != user:
+                return None   # one spaced-out byte
+        except _InputError:
+            return None       # a whole-input problem; no single token to blame
+
+    # decimal is parsed completely before anything is formatted, so a token
+    # int() rejects wins over an earlier one chr() rejects
+    eager = key[0] == "decimal"
+    suspects = _TOKEN_CHECKS[key][2]
+    later = None
+    for pos, stop in _windows(user):
+        progress(pos, len(user))
+        if _looks_clean(key, user[pos:stop]):
+            continue
+        while True:
+            found = suspects.search(user, pos, stop)
+            if found is None:
+                break
+            start, end = _token_bounds(user, found.start())
+            problem = _token_error(key, user[start:end])
+            if problem is not None:
+                phase, exc = problem
+                if not eager or phase == "parse":
+                    return BadToken(_error_message(key, exc), user, start, end)
+                if later is None:
+                    later = BadToken(_error_message(key, exc), user, start, end)
+            pos = end
+    return later
+
+
+def check_input(func, user, progress=None):
+    """
+    The first token mode function `func` rejects in `user`, as a BadToken
+    whose message is what func(user) returns; None otherwise. None does not
+    always mean the input is valid: problems with the input as a whole
+    (empty, wrong total bit count) have no single token to point at.
+    progress works as for the mode functions.
+    """
+    key = _FUNC_KEYS.get(func)
+    if key is None or not isinstance(user, str) or not user or user.isspace():
+        return None
+    return _find_bad_token(key, user, progress)
+
+
+# ===========================
+# PROGRESS / CANCEL
+# ===========================
+# Every mode function takes an optional progress(done, total) callback
+# (from whatever thread runs the conversion). A conversion reports each
+# phase that can take long, each counting from 0 to its own total:
+#
+#   checking    before every VALIDATE_WINDOW characters of the input scan
+#   parsing     before every PROGRESS_BLOCK tokens (decimal, which parses
+#               everything up front; the other sources parse lazily)
+#   formatting  between blocks of PROGRESS_BLOCK code points
+#
+# Whole numbers are one value: progress(0, 1) at the start (and between the
+# pieces of a big decimal conversion), progress(1, 1) at the end.
+# normalize_input and check_input take the same callback. To stop early,
+# raise ConversionCancelled from the callback; it is passed through to the
+# caller.
+
+PROGRESS_BLOCK = 64 * 1024
+
+
+class ConversionCancelled(Exception):
+    """Raised from a progress callback to stop a conversion."""
+
+
+def _no_progress(done, total):
+    pass
+
+
+def _format_in_blocks(codes, fmt, progress):
+    total = len(codes)
+    progress(0, total)
+    blocks = []
+    for start in range(0, total, PROGRESS_BLOCK):
+        blocks.append(fmt(codes[start:start + PROGRESS_BLOCK]))
+        progress(min(start + PROGRESS_BLOCK, total), total)
+    return _JOIN_BLOCKS.get(fmt, _join_lists)(blocks)
+
+
+def _error_message(key, exc):
+    """The 'Error: ...' text a mode shows for an exception from its parser/formatter."""
+    value_msg, fail_msg = _MODE_MSGS[key]
+    if isinstance(exc, _InputError):
+        return str(exc)
+    if isinstance(exc, _BadDigits):
+        return _BAD_DIGITS_MSGS.get(key, value_msg)
+    if isinstance(exc, ValueError):
+        return value_msg or fail_msg
+    return fail_msg
+
+
+def _convert(user, source, target, progress=None):
+    """Run one mode: validate, parse, format. Errors come back as 'Error: ...'."""
+    key = (source, target)
     try:
         if not isinstance(user, str):
-            return "Error: Input must be a string of numbers."
+            return _TYPE_MSGS[source]
         if not user or user.isspace():
-            return "Error: Please enter something, not just spaces."
+            return _EMPTY_MSG
+
+        problem = _find_bad_token(key, user, progress)
+        if problem is not None:
+            return problem.message
+
+        parse = _PARSER_OVERRIDES.get(key, _PARSERS[source])
+        fmt = _FORMATTER_OVERRIDES.get(key, _FORMATTERS[target])
+        if progress is None:
+            return fmt(parse(user))
+        if source in _NUMBER_BASES:   # one value: no blocks, just a chance to cancel
+            tick = partial(progress, 0, 1)
+            return fmt(parse(user, tick), tick)
+        if parse is _parse_decimal:
+            return _format_in_blocks(_parse_decimal(user, progress), fmt, progress)
+        return _format_in_blocks(parse(user), fmt, progress)
+    except ConversionCancelled:
+        raise
+    except Exception as e:
+        return _error_message(key, e)
+
+
+# ===========================
+# INSTRUMENTATION
+# ===========================
+# Per-mode counters for finding out which modes are slow and how big the
+# inputs really are: calls, errors, input characters, output size (len() of
+# the result: characters, or items for list results), total time and a
+# latency histogram with power-of-two buckets (<1 µs, <2 µs, <4 µs, ...).
+#
+#   backend.enable_stats()        # or start with BINLATOR_STATS=1
+#   ... convert things ...
+#   backend.stats_snapshot()      # {"Hexadecimal - Text": {"calls": 12, ...}, ...}
+#
+# Counting happens in a wrapper that replaces _convert only while it is on,
+# so with stats off the mode functions run exactly the code they did before.
+# Every mode function call is counted (including each batch of a stream);
+# result cache hits and NumPy/parallel shortcuts that skip the mode
+# functions are not.
+
+STATS_ENV = "BINLATOR_STATS"
+_HISTOGRAM_BUCKETS = 32   # bucket i counts calls that took < 2**i µs (the last one: the rest)
+
+
+class _ModeStats:
+    __slots__ = ("calls", "errors", "input_chars", "output_size", "total_ns", "histogram")
+
+    def __init__(self):
+        self.calls = self.errors = self.input_chars = self.output_size = self.total_ns = 0
+        self.histogram = [0] * _HISTOGRAM_BUCKETS
+
+    def snapshot(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "input_chars": self.input_chars,
+            "output_size": self.output_size,
+            "total_s": self.total_ns / 1e9,
+            "mean_s": self.total_ns / 1e9 / self.calls if self.calls else 0.0,
+            "p50_s": self._percentile(0.50),
+            "p90_s": self._percentile(0.90),
+            "p99_s": self._percentile(0.99),
+            # (upper bound in seconds, count); None = no upper bound
+            "histogram": [
+                (2 ** i / 1e6 if i < _HISTOGRAM_BUCKETS - 1 else None, n)
+                for i, n in enumerate(self.histogram) if n
+            ],
+        }
+
+    def _percentile(self, fraction):
+        """Upper bound (seconds) of the bucket holding that fraction of the calls."""
+        seen = 0
+        for i, n in enumerate(self.histogram):
+            seen += n
+            if n and seen >= fraction * self.calls:
+                return 2 ** i / 1e6
+        return 0.0
+
+
+_mode_stats = {}
+_stats_lock = threading.Lock()
+_plain_convert = _convert
+
+
+def _counted_convert(user, source, target, progress=None):
+    start = time.perf_counter_ns()
+    result = _plain_convert(user, source, target, progress)
+    elapsed = time.perf_counter_ns() - start
+
+    error = isinstance(result, str) and result.startswith("Error:")
+    with _stats_lock:
+        stats = _mode_stats.get((source, target))
+        if stats is None:
+            stats = _mode_stats[(source, target)] = _ModeStats()
+        stats.calls += 1
+        stats.total_ns += elapsed
+        stats.histogram[min((elapsed // 1000).bit_length(), _HISTOGRAM_BUCKETS - 1)] += 1
+        if isinstance(user, str):
+            stats.input_chars += len(user)
+        if error:
+            stats.errors += 1
+        else:
+            stats.output_size += len(result)
+    return result
+
+
+def enable_stats(on=True):
+    """Turn the per-mode counters on or off (the counts so far are kept)."""
+    global _convert
+    _convert = _counted_convert if on else _plain_convert
+
+
+def stats_enabled():
+    return _convert is _counted_convert
+
+
+def stats_snapshot():
+    """Counters of every mode used so far, keyed by dropdown name."""
+    with _stats_lock:
+        return {_mode_name(*key): stats.snapshot() for key, stats in _mode_stats.items()}
+
+
+def reset_stats():
+    with _stats_lock:
+        _mode_stats.clear()
+
+
+if os.environ.get(STATS_ENV, "") not in ("", "0"):
+    enable_stats()
+
+
+# ===========================
+# TEXT-BASED MODES
+# ===========================
+
+# Text → Unicode/ASCII
+def text_to_unicode(user, progress=None):
+    return _convert(user, "text", "decimal", progress)
+
+# Text → Binary (one string, 8 bits per character)
+def text_to_binary(user, progress=None):
+    return _convert(user, "text", "binary", progress)
+
+# Text → Octal (CodeList of octal strings, no 0o prefix)
+def text_to_octal(user, progress=None):
+    return _convert(user, "text", "octal", progress)
+
+# Text → Hexadecimal
+def text_to_hex(user, progress=None):
+    return _convert(user, "text", "hex", progress)
+
+
+# ===========================
+# BINARY-BASED MODES
+# ===========================
+
+# Binary → Text
+def binary_to_text(user, progress=None):
+    return _convert(user, "binary", "text", progress)
+
+# Binary → Unicode/ASCII
+def binary_to_unicode(user, progress=None):
+    return _convert(user, "binary", "decimal", progress)
+
+# Binary → Octal (any number of bits per token)
+def binary_to_octal(user, progress=None):
+    return _convert(user, "binary", "octal", progress)
+
+# Binary → Hexadecimal
+def binary_to_hex(user, progress=None):
+    return _convert(user, "binary", "hex", progress)
 
-        out = []
-        for tok in user.split():
-            val = int(tok)            # string → int
-            out.append(format(val, "o"))  # decimal → octal
-        return out
-    except ValueError:
-        return "Error: Please enter valid decimal numbers."
-    except Exception:
-        return "Error: Something went wrong while converting decimal to octal."
 
+# ===========================
+# UNICODE/ASCII-BASED MODES
+# ===========================
+
+# Unicode/ASCII → Text
+def unicode_to_text(user, progress=None):
+    return _convert(user, "decimal", "text", progress)
+
+# Unicode/ASCII → Binary
+def unicode_to_binary(user, progress=None):
+    return _convert(user, "decimal", "binary", progress)
+
+# Unicode/ASCII → Octal
+def unicode_to_octal(user, progress=None):
+    return _convert(user, "decimal", "octal", progress)
 
 # Decimal (Unicode/ASCII) → Hexadecimal
-def decimal_to_hex(user):
-    try:
-        if not isinstance(user, str): 
-            return "Error: Input must be a string of numbers."
-        if not user or user.isspace(): 
-            return "Error: Please enter something, not just spaces."
-
-        hex_list = []
-        for num in user.split():
-            number = int(num)
-            hex_list.append(format(number, 'X'))  # converts decimal to hex
-        return hex_list
-    except ValueError:
-        return "Error: Please enter valid decimal numbers."
-    except Exception:
-        return "Error: Something went wrong while converting decimal to hex."
+def decimal_to_hex(user, progress=None):
+    return _convert(user, "decimal", "hex", progress)
 
 
 # ===========================
@@ -369,169 +1313,1645 @@ def decimal_to_hex(user):
 # ===========================
 
 # Hexadecimal → Text
-def hex_to_text(user):
-    try:
-        if not isinstance(user, str): 
-            return "Error: Input must be a string of hexadecimal values."
-        if not user or user.isspace(): 
-            return "Error: Please enter something, not just spaces."
-
-        text_result = ""
-        for num in user.split():
-            text_result += chr(int(num, 16))  # hex → decimal → character
-        return text_result
-    except ValueError:
-        return "Error: Please enter valid hexadecimal values (0–9, A–F)."
-    except Exception:
-        return "Error: Something went wrong while converting hex to text."
-
+def hex_to_text(user, progress=None):
+    return _convert(user, "hex", "text", progress)
 
 # Hexadecimal → Decimal (Unicode/ASCII)
-def hex_to_decimal(user):
-    try:
-        if not isinstance(user, str): 
-            return "Error: Input must be a string of hexadecimal values."
-        if not user or user.isspace(): 
-            return "Error: Please enter something, not just spaces."
-
-        dec_list = []
-        for num in user.split():
-            dec_list.append(int(num, 16))  # hex → decimal
-        return dec_list
-    except ValueError:
-        return "Error: Please enter valid hexadecimal values (0–9, A–F)."
-    except Exception:
-        return "Error: Something went wrong while converting hex to decimal."
-
+def hex_to_decimal(user, progress=None):
+    return _convert(user, "hex", "decimal", progress)
 
 # Hexadecimal → Binary
-def hex_to_binary(user):
-    try:
-        if not isinstance(user, str): 
-            return "Error: Input must be a string of hexadecimal values."
-        if not user or user.isspace(): 
-            return "Error: Please enter something, not just spaces."
-
-        binary_list = []
-        for h in user.split():
-            decimal_value = int(h, 16)  # hex → decimal
-            binary_list.append(format(decimal_value, '08b'))  # decimal → binary
-        return binary_list
-    except ValueError:
-        return "Error: Please enter valid hexadecimal values (0–9, A–F)."
-    except Exception:
-        return "Error: Something went wrong while converting hex to binary."
-    
+def hex_to_binary(user, progress=None):
+    return _convert(user, "hex", "binary", progress)
+
 # Hexadecimal → Octal
-def hex_to_octal(user):
-    try:
-        if not isinstance(user, str):
-            return "Error: Input must be a string of hexadecimal values."
-        if not user or user.isspace():
-            return "Error: Please enter something, not just spaces."
+def hex_to_octal(user, progress=None):
+    return _convert(user, "hex", "octal", progress)
 
-        out = []
-        for tok in user.split():
-            val = int(tok, 16)        # hex → decimal
-            out.append(format(val, "o"))   # decimal → octal
-        return out
-    except ValueError:
-        return "Error: Please enter valid hexadecimal values (0–9, A–F)."
-    except Exception:
-        return "Error: Something went wrong while converting hexadecimal to octal."
 
 # ===========================
 # OCTAL-BASED MODES
 # ===========================
 
+# Octal → Text (space-separated octal code points)
+def octal_to_text(user, progress=None):
+    return _convert(user, "octal", "text", progress)
+
+# Octal → Binary (8-bit padded per code point)
+def octal_to_binary(user, progress=None):
+    return _convert(user, "octal", "binary", progress)
+
+# Octal → Unicode/ASCII
+def octal_to_unicode(user, progress=None):
+    return _convert(user, "octal", "decimal", progress)
+
+# Octal → Hexadecimal (uppercase, no 0x)
+def octal_to_hex(user, progress=None):
+    return _convert(user, "octal", "hex", progress)
+
+
 # ===========================
-# OCTAL HELPERS
+# BYTE-ENCODING MODES
 # ===========================
 
-def _is_octal_or_space(s: str) -> bool:
-    """True only if s contains digits 0–7 and/or whitespace."""
-    for ch in s:
-        if ch not in ("0","1","2","3","4","5","6","7"," ", "\t", "\n", "\r"):
-            return False
-    return True
+# Text → UTF-8 Binary (8 bits per byte)
+def text_to_utf8_binary(user, progress=None):
+    return _convert(user, "text", "utf8_binary", progress)
 
-# Octal → Text (space-separated octal code points)
-def octal_to_text(user):
-    try:
-        if not isinstance(user, str):
-            return "Error: Input must be a string of octal values."
-        if not user or user.isspace():
-            return "Error: Please enter something, not just spaces."
-        if not _is_octal_or_space(user):
-            return "Error: Please add spaces to octal values (0–7)."
+# UTF-8 Binary → Text
+def utf8_binary_to_text(user, progress=None):
+    return _convert(user, "utf8_binary", "text", progress)
 
-        text = ""
-        tokens = user.split()  # each token is one code point in base 8
-        for tok in tokens:
-            val = int(tok, 8)   # octal → decimal (code point)
-            text += chr(val)    # decimal → character
-        return text
-    except ValueError:
-        return "Error: Please enter valid octal values (0–7)."
-    except Exception:
-        return "Error: Something went wrong while converting octal to text."
-    
-# Octal → Binary (8-bit padded per code point)
-def octal_to_binary(user):
-    try:
+# Text → UTF-8 Hexadecimal (two digits per byte)
+def text_to_utf8_hex(user, progress=None):
+    return _convert(user, "text", "utf8_hex", progress)
+
+# UTF-8 Hexadecimal → Text
+def utf8_hex_to_text(user, progress=None):
+    return _convert(user, "utf8_hex", "text", progress)
+
+# Text → UTF-16LE Binary (8 bits per byte)
+def text_to_utf16le_binary(user, progress=None):
+    return _convert(user, "text", "utf16le_binary", progress)
+
+# UTF-16LE Binary → Text
+def utf16le_binary_to_text(user, progress=None):
+    return _convert(user, "utf16le_binary", "text", progress)
+
+# Text → UTF-16LE Hexadecimal (two digits per byte)
+def text_to_utf16le_hex(user, progress=None):
+    return _convert(user, "text", "utf16le_hex", progress)
+
+# UTF-16LE Hexadecimal → Text
+def utf16le_hex_to_text(user, progress=None):
+    return _convert(user, "utf16le_hex", "text", progress)
+
+# Text → UTF-16BE Binary (8 bits per byte)
+def text_to_utf16be_binary(user, progress=None):
+    return _convert(user, "text", "utf16be_binary", progress)
+
+# UTF-16BE Binary → Text
+def utf16be_binary_to_text(user, progress=None):
+    return _convert(user, "utf16be_binary", "text", progress)
+
+# Text → UTF-16BE Hexadecimal (two digits per byte)
+def text_to_utf16be_hex(user, progress=None):
+    return _convert(user, "text", "utf16be_hex", progress)
+
+# UTF-16BE Hexadecimal → Text
+def utf16be_hex_to_text(user, progress=None):
+    return _convert(user, "utf16be_hex", "text", progress)
+
+# Text → UTF-32BE Binary (8 bits per byte)
+def text_to_utf32be_binary(user, progress=None):
+    return _convert(user, "text", "utf32be_binary", progress)
+
+# UTF-32BE Binary → Text
+def utf32be_binary_to_text(user, progress=None):
+    return _convert(user, "utf32be_binary", "text", progress)
+
+# Text → UTF-32BE Hexadecimal (two digits per byte)
+def text_to_utf32be_hex(user, progress=None):
+    return _convert(user, "text", "utf32be_hex", progress)
+
+# UTF-32BE Hexadecimal → Text
+def utf32be_hex_to_text(user, progress=None):
+    return _convert(user, "utf32be_hex", "text", progress)
+
+
+# ===========================
+# WHOLE-NUMBER MODES
+# ===========================
+# One value, so there are no blocks to report progress for: progress()
+# is called with (0, 1) at the start and (1, 1) at the end (see "PROGRESS /
+# CANCEL").
+
+def _convert_number(user, source, target, progress=None):
+    if progress is not None:
+        progress(0, 1)
+    result = _convert(user, source, target, progress)
+    if progress is not None:
+        progress(1, 1)
+    return result
+
+
+# Binary Number → Octal Number
+def binary_number_to_octal(user, progress=None):
+    return _convert_number(user, "binary_number", "octal_number", progress)
+
+# Binary Number → Decimal Number
+def binary_number_to_decimal(user, progress=None):
+    return _convert_number(user, "binary_number", "decimal_number", progress)
+
+# Binary Number → Hexadecimal Number
+def binary_number_to_hex(user, progress=None):
+    return _convert_number(user, "binary_number", "hex_number", progress)
+
+# Octal Number → Binary Number
+def octal_number_to_binary(user, progress=None):
+    return _convert_number(user, "octal_number", "binary_number", progress)
+
+# Octal Number → Decimal Number
+def octal_number_to_decimal(user, progress=None):
+    return _convert_number(user, "octal_number", "decimal_number", progress)
+
+# Octal Number → Hexadecimal Number
+def octal_number_to_hex(user, progress=None):
+    return _convert_number(user, "octal_number", "hex_number", progress)
+
+# Decimal Number → Binary Number
+def decimal_number_to_binary(user, progress=None):
+    return _convert_number(user, "decimal_number", "binary_number", progress)
+
+# Decimal Number → Octal Number
+def decimal_number_to_octal(user, progress=None):
+    return _convert_number(user, "decimal_number", "octal_number", progress)
+
+# Decimal Number → Hexadecimal Number
+def decimal_number_to_hex(user, progress=None):
+    return _convert_number(user, "decimal_number", "hex_number", progress)
+
+# Hexadecimal Number → Binary Number
+def hex_number_to_binary(user, progress=None):
+    return _convert_number(user, "hex_number", "binary_number", progress)
+
+# Hexadecimal Number → Octal Number
+def hex_number_to_octal(user, progress=None):
+    return _convert_number(user, "hex_number", "octal_number", progress)
+
+# Hexadecimal Number → Decimal Number
+def hex_number_to_decimal(user, progress=None):
+    return _convert_number(user, "hex_number", "decimal_number", progress)
+
+
+# ===========================
+# MODE NAMES
+# ===========================
+# Dropdown names ("Source - Target") -> function, built from the grid above.
+# The GUI's fn_map and any other front end use this.
+
+def normalize_mode(s: str) -> str:
+    """
+    Make combobox text consistent so it matches fn_map keys even if the UI
+    has extra/missing spaces or uses en/em dashes.
+    """
+    s = (s or "")
+    # unify different dashes to a plain hyphen
+    s = s.replace("–", "-").replace("—", "-")
+    # collapse multiple spaces
+    s = re.sub(r"\s+", " ", s)
+    # ensure single spaces around the hyphen (but not the one in "UTF-8")
+    s = re.sub(r"\s*-(?!\d)\s*", " - ", s)
+    return s.strip()
+
+
+_SOURCE_LABELS = {
+    "text": "Text",
+    "binary": "Binary (ASCII Bytes)",
+    "decimal": "Unicode/ASCII",
+    "octal": "Octal",
+    "hex": "Hexadecimal",
+    **{base: f"{label} {'Hexadecimal' if digits == 'hex' else 'Binary'}"
+       for base, (_, label, digits) in _ENCODED_BASES.items()},
+    "binary_number": "Binary Number",
+    "octal_number": "Octal Number",
+    "decimal_number": "Decimal Number",
+    "hex_number": "Hexadecimal Number",
+}
+_TARGET_LABELS = {
+    "text": "Text",
+    "decimal": "Unicode/ASCII",
+    "binary": "Binary",
+    "octal": "Octal",
+    "hex": "Hexadecimal",
+    **{base: _SOURCE_LABELS[base] for base in _ENCODED_BASES},
+    **{base: _SOURCE_LABELS[base] for base in _NUMBER_BASES},
+}
+
+_MODE_FUNCS = {
+    ("text", "decimal"): text_to_unicode,
+    ("text", "binary"): text_to_binary,
+    ("text", "octal"): text_to_octal,
+    ("text", "hex"): text_to_hex,
+    ("binary", "text"): binary_to_text,
+    ("binary", "decimal"): binary_to_unicode,
+    ("binary", "octal"): binary_to_octal,
+    ("binary", "hex"): binary_to_hex,
+    ("decimal", "text"): unicode_to_text,
+    ("decimal", "binary"): unicode_to_binary,
+    ("decimal", "octal"): unicode_to_octal,
+    ("decimal", "hex"): decimal_to_hex,
+    ("hex", "text"): hex_to_text,
+    ("hex", "decimal"): hex_to_decimal,
+    ("hex", "binary"): hex_to_binary,
+    ("hex", "octal"): hex_to_octal,
+    ("octal", "text"): octal_to_text,
+    ("octal", "binary"): octal_to_binary,
+    ("octal", "decimal"): octal_to_unicode,
+    ("octal", "hex"): octal_to_hex,
+    ("text", "utf8_binary"): text_to_utf8_binary,
+    ("utf8_binary", "text"): utf8_binary_to_text,
+    ("text", "utf8_hex"): text_to_utf8_hex,
+    ("utf8_hex", "text"): utf8_hex_to_text,
+    ("text", "utf16le_binary"): text_to_utf16le_binary,
+    ("utf16le_binary", "text"): utf16le_binary_to_text,
+    ("text", "utf16le_hex"): text_to_utf16le_hex,
+    ("utf16le_hex", "text"): utf16le_hex_to_text,
+    ("text", "utf16be_binary"): text_to_utf16be_binary,
+    ("utf16be_binary", "text"): utf16be_binary_to_text,
+    ("text", "utf16be_hex"): text_to_utf16be_hex,
+    ("utf16be_hex", "text"): utf16be_hex_to_text,
+    ("text", "utf32be_binary"): text_to_utf32be_binary,
+    ("utf32be_binary", "text"): utf32be_binary_to_text,
+    ("text", "utf32be_hex"): text_to_utf32be_hex,
+    ("utf32be_hex", "text"): utf32be_hex_to_text,
+    ("binary_number", "octal_number"): binary_number_to_octal,
+    ("binary_number", "decimal_number"): binary_number_to_decimal,
+    ("binary_number", "hex_number"): binary_number_to_hex,
+    ("octal_number", "binary_number"): octal_number_to_binary,
+    ("octal_number", "decimal_number"): octal_number_to_decimal,
+    ("octal_number", "hex_number"): octal_number_to_hex,
+    ("decimal_number", "binary_number"): decimal_number_to_binary,
+    ("decimal_number", "octal_number"): decimal_number_to_octal,
+    ("decimal_number", "hex_number"): decimal_number_to_hex,
+    ("hex_number", "binary_number"): hex_number_to_binary,
+    ("hex_number", "octal_number"): hex_number_to_octal,
+    ("hex_number", "decimal_number"): hex_number_to_decimal,
+}
+_FUNC_KEYS = {fn: key for key, fn in _MODE_FUNCS.items()}
+
+# Bases with one value per character/token (the modes live translation,
+# format detection and auto-grouping know about)
+_CLASSIC_BASES = ("text", "decimal", "binary", "octal", "hex")
+# Sources that can't be cut into pieces converted on their own (a
+# character's bytes, or one number, would be cut apart)
+_UNSPLIT_SOURCES = {*_ENCODED_BASES, *_NUMBER_BASES}
+
+
+def _mode_name(source, target):
+    return f"{_SOURCE_LABELS[source]} - {_TARGET_LABELS[target]}"
+
+
+MODES = {
+    _mode_name(source, target): _MODE_FUNCS[(source, target)]
+    for source in _SOURCE_LABELS
+    for target in _TARGET_LABELS
+    if (source, target) in _MODE_FUNCS
+}
+
+
+# ===========================
+# FORMAT DETECTION
+# ===========================
+# Guesses what kind of input something is, for bulk jobs that get a mix of
+# dumps and for the "Auto - ..." dropdown entries:
+#
+#   detect_format("48 65 6C 6C 6F")  -> Detection('hex', width=2, confidence=0.91)
+#   auto_mode("text", data)          -> (hex_to_text, Detection(...))
+#
+# Only the first DETECT_SAMPLE characters are looked at, so a 10-byte and a
+# 10-GB input cost the same. One translate() through a precomputed table
+# turns the sample into character classes ('1' = 0/1, '3' = other octal
+# digit, '5' = 8/9, '7' = hex letter, '9' = anything else, ' ' = space or
+# ,;), so the highest class in a token is the smallest base that can read
+# it. Each source gets a score from the token classes and widths; the
+# confidence is the winner's share of all the scores.
+
+DETECT_SAMPLE = 4096   # characters (or bytes) looked at
+
+_DETECT_CLASSES = bytearray(b"9" * 256)
+for _chars, _cls in ((b"01", b"1"), (b"234567", b"3"), (b"89", b"5"),
+                     (b"abcdefABCDEF", b"7"), (b" \t\n\r\x0b\x0c,;", b" ")):
+    for _c in _chars:
+        _DETECT_CLASSES[_c] = _cls[0]
+_DETECT_CLASSES = bytes(_DETECT_CLASSES)
+
+_BIN, _OCT, _DEC, _HEX, _OTHER = b"13579"
+_UNIFORM = 0.9   # share of tokens with the usual width that counts as "all the same width"
+_OCTAL_RUN = 8   # numbers without an 8 or 9 that make decimal unlikely
+
+# "Auto - Target" dropdown names -> target
+AUTO_MODES = {
+    f"Auto - {label}": target for target, label in _TARGET_LABELS.items()
+    if target in _CLASSIC_BASES
+}
+
+
+class Detection:
+    """What detect_format() found."""
+
+    def __init__(self, source, width, confidence, scores):
+        self.source = source          # "text", "binary", "decimal", "octal" or "hex"
+        self.width = width            # usual digits per token (None for text)
+        self.confidence = confidence  # 0.0–1.0
+        self.scores = scores          # source -> score the confidence was worked out from
+
+    @property
+    def label(self):
+        """Dropdown name of the source, e.g. 'Hexadecimal'."""
+        return _SOURCE_LABELS[self.source]
+
+    def __repr__(self):
+        return f"Detection({self.source!r}, width={self.width}, confidence={self.confidence:.2f})"
+
+
+def _numeric_scores(top, width, uniform, count, separators):
+    """Scores of the number bases for `count` tokens whose highest class is `top`."""
+    same = uniform >= _UNIFORM
+    if top == _BIN:
+        return {"binary": 1.0 if width % 8 == 0 else 0.7, "decimal": 0.1, "hex": 0.05}
+    if top == _HEX:
+        return {"hex": 1.0}
+    scores = {
+        "decimal": 0.9 if separators else 0.4 if same and width == 2 else 0.9,
+        "hex": 0.1 if separators else 0.6 if same and width == 2 else 0.1,
+    }
+    if top == _OCT:
+        # Decimal codes of real text nearly always have an 8 or 9 somewhere
+        # ('h' = 104, 'l' = 108), so a longer run without one is octal.
+        # Short ones: '110 151 041' is octal, '72 105 33' decimal.
+        octal = count >= _OCTAL_RUN or same and width == 3 or count == 1 and width % 3 == 0
+        scores["octal"] = 0.9 if octal else 0.2
+        if octal and not separators:
+            scores["decimal"] = 0.3
+    return scores
+
+
+def detect_format(data):
+    """Detection for a str or bytes-like input (only the first DETECT_SAMPLE characters are read)."""
+    if isinstance(data, str):
+        sample = data[:DETECT_SAMPLE].encode("ascii", "replace")   # non-ASCII -> '?', a text character
+    else:
+        data = memoryview(data).cast("B")
+        sample = bytes(data[:DETECT_SAMPLE])
+    classes = sample.translate(_DETECT_CLASSES)
+    if len(data) > DETECT_SAMPLE and classes.rfind(b" ") > 0:
+        classes = classes[:classes.rfind(b" ")]   # the last token may go on after the sample
+
+    tokens = classes.split()
+    if not tokens:
+        return Detection("text", None, 0.0, {})
+    n = len(tokens)
+    if not classes.translate(None, b" 79"):
+        return Detection("text", None, 1.0, {"text": 1.0})   # letters only ('cafe', 'a'): words, not hex
+    needs = Counter(map(max, tokens))
+    other = needs.pop(_OTHER, 0)
+
+    scores = {"text": other / n}
+    width = None
+    if needs:
+        widths = Counter(len(t) for t in tokens if max(t) != _OTHER)
+        width, count = widths.most_common(1)[0]
+        numeric = n - other
+        separators = b"," in sample or b";" in sample
+        for source, score in _numeric_scores(max(needs), width, count / numeric, numeric,
+                                             separators).items():
+            scores[source] = score * numeric / n
+
+    source = max(scores, key=scores.get)
+    if source == "text":
+        width = None
+    elif source == "binary" and width % 8 == 0:
+        width = 8   # one long unspaced run of bits is still bytes
+    return Detection(source, width, scores[source] / sum(scores.values()), scores)
+
+
+def auto_mode(target, data):
+    """
+    (mode function, Detection) for converting `data` to `target` ("text",
+    "decimal", ...). The function is None when the input already looks like
+    the target.
+    """
+    found = detect_format(data)
+    source = found.source
+    if not found.confidence:
+        # nothing to go on: any mode gives the usual "Please enter something" error
+        source = "decimal" if target == "text" else "text"
+    return _MODE_FUNCS.get((source, target)), found
+
+
+# ===========================
+# RESULT CACHE
+# ===========================
+# The same payloads (samples, test vectors, headers) get converted again and
+# again. result_cache.call(func, user) returns a stored result for an input
+# it has seen before with the same mode, and runs func otherwise.
+#
+# Entries are keyed by (mode, hash of the input), so big inputs aren't kept
+# alive by the cache. Results are strings or read-only CodeLists, so a hit
+# hands out the stored object itself.
+# Safe to share between threads (GUI, workers, the HTTP server).
+
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _result_size(result):
+    """Rough memory use of a cached result, in bytes."""
+    return sys.getsizeof(result)
+
+
+class ResultCache:
+    """LRU cache of mode results with a byte budget and hit/miss/eviction counters."""
+
+    def __init__(self, max_bytes=CACHE_MAX_BYTES):
+        self._entries = OrderedDict()  # key -> (result, size); oldest first
+        self._lock = threading.Lock()
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(func, user):
+        digest = hashlib.blake2b(user.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        return func.__name__, len(user), digest
+
+    def call(self, func, user, progress=None, run=None):
+        """
+        func(user, progress), answered from the cache when possible.
+        run(func, user, progress) is used instead of calling func directly
+        when given (e.g. backend_parallel.convert).
+        """
         if not isinstance(user, str):
-            return "Error: Input must be a string of octal values."
-        if not user or user.isspace():
-            return "Error: Please enter something, not just spaces."
-        if not _is_octal_or_space(user):
-            return "Error: Please enter valid octal values (0–7)."
-
-        out = []
-        for bry in user.split():
-            val = int(bry, 8)               # octal → decimal
-            out.append(format(val, "08b"))  # decimal → 8-bit binary
-        return out
-    except ValueError:
-        return "Error: Please enter valid octal values (0–7)."
-    except Exception:
-        return "Error: Something went wrong while converting octal to binary."
-    
+            return func(user, progress)
+
+        key = self._key(func, user)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is not None:
+            return entry[0]
+
+        result = run(func, user, progress) if run is not None else func(user, progress)
+        self._store(key, result)
+        return result
+
+    def _store(self, key, result):
+        size = _result_size(result) + 100  # + key and bookkeeping
+        with self._lock:
+            if size > self.max_bytes:
+                return  # would push out everything else
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]  # another thread stored it meanwhile
+            self._entries[key] = (result, size)
+            self.bytes += size
+            self._evict()
+
+    def _evict(self):
+        while self.bytes > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def resize(self, max_bytes):
+        """Change the byte budget (evicts right away if it shrank)."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+result_cache = ResultCache()
 
-# Octal → Unicode/ASCII
-def octal_to_unicode(user):
-    try:
+
+# ===========================
+# BATCH MODE
+# ===========================
+# For many small independent inputs, e.g. every value of a database column:
+#
+#   results, status = convert_batch(text_to_hex, ["Hi", " ", "Yo"])
+#   # results -> [['48', '69'], 'Error: Please enter something, not just spaces.', ['59', '6F']]
+#   # status  -> array('B', [0, 1, 0])   (STATUS_OK, STATUS_EMPTY, STATUS_OK)
+#
+# results[i] is exactly what func(inputs[i]) returns, and status[i] says how
+# it went without looking at the text. The mode is looked up once per batch,
+# and records below NUMPY_MIN_SIZE go through plain map() pipelines that skip
+# what only pays off on big inputs (NumPy checks, lazy sequences, progress
+# blocks). The validation scan is skipped too: it only makes errors come
+# back sooner, the message is the same. A bad record never stops the rest.
+
+STATUS_OK = 0
+STATUS_EMPTY = 1        # empty or only whitespace
+STATUS_NOT_STRING = 2   # not a str
+STATUS_INVALID = 3      # not valid input for the mode ("Please enter valid ...", wrong grouping)
+STATUS_FAILED = 4       # anything else ("Something went wrong ...")
+
+
+def _record_octal(user):
+    if _NOT_OCTAL_OR_SPACE.search(user):
+        raise _BadDigits()
+    tokens = user.split()
+    codes = _table_values(tokens, _OCTAL_VALUES)
+    return codes if codes is not None else map(int, tokens, repeat(8))
+
+
+def _record_hex(user):
+    tokens = user.split()
+    data = _table_bytes(tokens, _HEX_VALUES)
+    return data if data is not None else map(int, tokens, repeat(16))
+
+
+# Small record -> iterable of code points (errors are raised while iterating
+# where the normal parser is lazy, so they come out at the same token)
+_RECORD_PARSERS = {
+    "text": lambda user: map(ord, _prepare_text(user)),
+    "binary": _parse_binary,
+    "decimal": _parse_decimal,
+    "octal": _record_octal,
+    "hex": _record_hex,
+    **{base: _PARSERS[base] for base in _ENCODED_BASES},   # already one bulk decode
+    **{base: _PARSERS[base] for base in _NUMBER_BASES},
+}
+_RECORD_FORMATTERS = {
+    "text": _codes_to_text,
+    "decimal": lambda codes: CodeList(list(codes), "decimal"),   # too small to be worth packing
+    "binary": lambda codes: CodeList(list(codes), "binary"),
+    "octal": lambda codes: CodeList(list(codes), "octal"),
+    "hex": lambda codes: CodeList(list(codes), "hex"),
+    **{base: _FORMATTERS[base] for base in _ENCODED_BASES},
+    **{base: _FORMATTERS[base] for base in _NUMBER_BASES},
+}
+_RECORD_FORMATTER_OVERRIDES = {
+    ("text", "binary"): lambda codes: " ".join(map(_BIN_TABLE.__getitem__, codes)),
+}
+
+
+def _error_status(key, exc):
+    """STATUS_* code that goes with _error_message(key, exc)."""
+    if isinstance(exc, _InputError) or isinstance(exc, ValueError) and _MODE_MSGS[key][0]:
+        return STATUS_INVALID
+    return STATUS_FAILED
+
+
+def convert_batch(func, inputs):
+    """
+    Run mode function `func` on every item of `inputs` (any iterable).
+    Returns (results, status): a list with func(item) for each item, and an
+    array('B') of STATUS_* codes in the same order.
+    """
+    key = source, target = _FUNC_KEYS[func]
+    big_parse = _PARSER_OVERRIDES.get(key, _PARSERS[source])
+    big_fmt = _FORMATTER_OVERRIDES.get(key, _FORMATTERS[target])
+    parse = _PARSER_OVERRIDES.get(key, _RECORD_PARSERS[source])
+    fmt = _RECORD_FORMATTER_OVERRIDES.get(key, _RECORD_FORMATTERS[target])
+    type_msg = _TYPE_MSGS[source]
+
+    results = []
+    status = array("B")
+    add_result = results.append
+    add_status = status.append
+    for user in inputs:
         if not isinstance(user, str):
-            return "Error: Input must be a string of octal values."
-        if not user or user.isspace():
-            return "Error: Please enter something, not just spaces."
-        if not _is_octal_or_space(user):
-            return "Error: Please enter valid octal values (0–7)."
-
-        out = []
-        for tok in user.split():
-            out.append(int(tok, 8))  # octal → decimal
-        return out
-    except ValueError:
-        return "Error: Please enter valid octal values (0–7)."
-    except Exception:
-        return "Error: Something went wrong while converting octal to decimal."
-    
-# Octal → Hexadecimal (uppercase, no 0x)
-def octal_to_hex(user):
+            add_result(type_msg)
+            add_status(STATUS_NOT_STRING)
+        elif not user or user.isspace():
+            add_result(_EMPTY_MSG)
+            add_status(STATUS_EMPTY)
+        else:
+            try:
+                if len(user) < NUMPY_MIN_SIZE:
+                    add_result(fmt(parse(user)))
+                else:
+                    add_result(big_fmt(big_parse(user)))
+                add_status(STATUS_OK)
+            except Exception as e:
+                add_result(_error_message(key, e))
+                add_status(_error_status(key, e))
+    return results, status
+
+
+# ===========================
+# STREAMING MODES
+# ===========================
+# Same conversions as above, but for inputs too big to hold in memory.
+# Each *_stream function takes a str, a text file object or any iterable of
+# str chunks, and yields output chunks. Joined together, the chunks are the
+# same text the GUI shows for the whole input (CodeLists rendered with
+# spaces), wherever the chunk boundaries fall. Problems are raised as
+# ConversionError with the message the mode function gives for the whole
+# input; output yielded before the bad spot has already gone out by then.
+#
+# Tokens (binary/decimal/octal/hex) may be separated by any whitespace,
+# including newlines, and may be cut anywhere by the chunk boundaries.
+# They are converted a batch at a time. What the mode functions check on
+# the input as a whole (only whitespace, a character Octal or a UTF-x hex
+# dump rejects anywhere, the bit count and spacing of 8-bit binary) is
+# tallied chunk by chunk and decided at the end, so a bad token is only
+# reported before the end of the input when nothing after it could change
+# the message.
+
+STREAM_CHUNK_SIZE = 64 * 1024  # characters read per step from files/strings
+
+
+class ConversionError(ValueError):
+    """
+    Raised by the streaming and bytes APIs. str(err) is the usual
+    'Error: ...' text; err.location is a BadToken when the bytes API knows
+    the bad token (the streaming API doesn't keep input positions).
+    """
+
+    def __init__(self, message, location=None):
+        super().__init__(message)
+        self.location = location
+
+
+def _iter_chunks(source, chunk_size, mode_fn):
+    """Turn a str / file object / iterable of str into str chunks."""
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+        return
+
+    read = getattr(source, "read", None)
+    if read is not None:
+        chunks = iter(lambda: read(chunk_size), None)
+    else:
+        chunks = iter(source)
+
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            # Let the mode itself pick its "must be a string" message
+            if not chunk:
+                return  # end of a binary-mode file
+            raise ConversionError(mode_fn(chunk))
+        if not chunk:
+            if read is not None:
+                return  # end of file
+            continue
+        yield chunk
+
+
+def _token_batches(chunks):
+    """
+    Yield lists of whitespace-separated tokens. A token cut in half by a
+    chunk boundary is glued back together before it is yielded.
+    """
+    carry = []  # pieces of a token that is still being read
+    for chunk in chunks:
+        tokens = chunk.split()
+        if not tokens:
+            # whitespace-only chunk -> the carried token is complete
+            if carry:
+                yield ["".join(carry)]
+                carry = []
+            continue
+
+        if carry:
+            if chunk[0].isspace():
+                tokens.insert(0, "".join(carry))
+            else:
+                carry.append(tokens[0])
+                if len(tokens) == 1 and not chunk[-1].isspace():
+                    continue  # still inside the same long token
+                tokens[0] = "".join(carry)
+            carry = []
+
+        if not chunk[-1].isspace():
+            carry = [tokens.pop()]  # last token may go on in the next chunk
+        if tokens:
+            yield tokens
+
+    if carry:
+        yield ["".join(carry)]
+
+
+def _normalized_text(chunks):
+    """
+    Yield the text the way the text modes see it: trimmed, whitespace runs
+    collapsed to one space, and 'H e l l o' glued into 'Hello'.
+
+    Output is only held back while every word so far is a single character
+    (that is the only time the 'H e l l o' rule can still apply).
+    """
+    started = False        # emitted (or held) any character yet
+    pending_space = False  # whitespace seen since the last character
+    spaced = True          # every word so far is one character long
+    word_len = 0
+    held = []
+
+    for chunk in chunks:
+        words = chunk.split()
+        if not words:
+            pending_space = True
+            continue
+
+        parts = []
+        for i, word in enumerate(words):
+            gap = i > 0 or pending_space or chunk[0].isspace()
+            if gap and started:
+                parts.append(" ")
+                word_len = 0
+            parts.append(word)
+            word_len += len(word)
+            started = True
+            if word_len > 1:
+                spaced = False
+        pending_space = chunk[-1].isspace()
+
+        piece = "".join(parts)
+        if spaced:
+            held.append(piece)
+            continue
+        if held:
+            piece = "".join(held) + piece
+            held = []
+        yield piece
+
+    if held:
+        text = "".join(held)
+        letters = text.replace(" ", "")
+        yield letters if len(letters) >= 2 else text
+
+
+def _text_stream(mode_fn, target):
+    """Build a streaming version of a Text → X mode."""
+    fmt = _FORMATTERS[target]
+
+    def stream(source, chunk_size=STREAM_CHUNK_SIZE):
+        first = True
+        for piece in _normalized_text(_iter_chunks(source, chunk_size, mode_fn)):
+            out = fmt(_LazyCodes(piece)).render()
+            yield out if first else " " + out
+            first = False
+        if first:
+            raise ConversionError(mode_fn(""))
+
+    stream.__name__ = mode_fn.__name__ + "_stream"
+    stream.__doc__ = f"Streaming version of {mode_fn.__name__}()."
+    return stream
+
+
+# Characters a mode rejects anywhere in the input, but str.split() would
+# quietly take for a separator
+_STREAM_STRAYS = {
+    **_WHOLE_INPUT_CLASSES,
+    **{(base, "text"): re.compile(r"[^\S \t\n\r\x0b\x0c]")   # bytes.fromhex() skips only these
+       for base, (_, _, digits) in _ENCODED_BASES.items() if digits == "hex"},
+}
+
+
+class _WholeInputChecks:
+    """
+    The whole-input checks of a mode that reads digit tokens, tallied
+    chunk by chunk as watch() passes the chunks on.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.strays = _STREAM_STRAYS.get(key)
+        self.shaped = key[0] == "binary" and key not in _PARSER_OVERRIDES   # 8-bit groups
+        self.started = False       # anything but whitespace so far
+        self.stray = False         # a character self.strays matches
+        self.bits = 0              # characters other than ' ' (shaped only)
+        self.head = []             # ... themselves, while there are at most 8
+        self.spaced = False        # a ' ' between two non-whitespace characters
+        self.space_after = False   # a ' ' after the last non-whitespace character
+
+    def watch(self, chunks):
+        for chunk in chunks:
+            if self.strays is not None and not self.stray:
+                self.stray = self.strays.search(chunk) is not None
+            body = chunk.strip()
+            if self.shaped:
+                self._count_bits(chunk, body)
+            if body:
+                self.started = True
+            yield chunk
+
+    def _count_bits(self, chunk, body):
+        if self.head is not None:
+            self.head.append(chunk.replace(" ", ""))
+        self.bits += len(chunk) - chunk.count(" ")
+        if self.bits > 8:
+            self.head = None
+        if not body:
+            self.space_after = self.space_after or " " in chunk
+            return
+        lead = chunk[:len(chunk) - len(chunk.lstrip())]
+        if self.started and (self.space_after or " " in lead) or " " in body:
+            self.spaced = True
+        self.space_after = " " in chunk[len(chunk.rstrip()):]
+
+    @property
+    def single_byte(self):
+        """Exactly 8 bits: the mode reads them as one byte, spaces or not."""
+        return self.shaped and self.bits == 8
+
+    def error(self):
+        """The whole-input message for everything seen, or None."""
+        if not self.started:
+            return _EMPTY_MSG
+        if self.stray:
+            return _error_message(self.key, _BadDigits())
+        if self.shaped:
+            return _binary_shape_error(self.bits, lambda: self.spaced)
+        return None
+
+
+def _held_back(batches, checks):
+    """Binary token batches, held back while there are at most 8 bits."""
+    held = []
+    for tokens in batches:
+        if checks.bits <= 8:
+            held += tokens
+            continue
+        if held:
+            tokens = held + tokens
+            held = []
+        yield tokens
+    if held and checks.bits > 8:
+        yield held
+
+
+def _stream_batch(key, mode_fn, tokens):
+    """
+    mode_fn on a batch of tokens -> (result, None), or (None, message)
+    with the message the whole input gives at the batch's first bad token.
+    """
+    if key[0] == "binary" and key not in _PARSER_OVERRIDES and not all(map((8).__eq__, map(len, tokens))):
+        # the batch on its own would fail the bit count check instead
+        cut = next(i for i, tok in enumerate(tokens) if len(tok) != 8)
+        error = _stream_batch(key, mode_fn, tokens[:cut])[1] if cut else None
+        return None, error or _GROUP_MSG
+    result = mode_fn(" ".join(tokens))
+    if isinstance(result, str) and result.startswith("Error:"):
+        return None, result
+    return result, None
+
+
+def _decimal_parse_error(key, tokens):
+    """Message for the first token of a decimal batch int() rejects, or None."""
     try:
-        if not isinstance(user, str):
-            return "Error: Input must be a string of octal values."
-        if not user or user.isspace():
-            return "Error: Please enter something, not just spaces."
-        if not _is_octal_or_space(user):
-            return "Error: Please enter valid octal values (0–7)."
-
-        out = []
-        for tok in user.split():
-            val = int(tok, 8)           # octal → decimal
-            out.append(format(val, "X"))  # decimal → HEX uppercase
-        return out
-    except ValueError:
-        return "Error: Please enter valid octal values (0–7)."
-    except Exception:
-        return "Error: Something went wrong while converting octal to hexadecimal."
+        _parse_decimal(" ".join(tokens))
+    except Exception as e:
+        return _error_message(key, e)
+    return None
+
+
+def _token_stream(mode_fn, key):
+    """Build a streaming version of a Binary/Decimal/Octal/Hex → X mode."""
+    def stream(source, chunk_size=STREAM_CHUNK_SIZE):
+        checks = _WholeInputChecks(key)
+        batches = _token_batches(checks.watch(_iter_chunks(source, chunk_size, mode_fn)))
+        if checks.shaped:
+            batches = _held_back(batches, checks)
+        # without whole-input checks, the first bad token is the answer...
+        final = checks.strays is None and not checks.shaped
+        parse_pending = False   # ...unless decimal still has to be fully parsed
+        first = True
+        error = None
+
+        for tokens in batches:
+            if checks.stray and checks.started:
+                break
+            if error is None:
+                result, error = _stream_batch(key, mode_fn, tokens)
+                if error is None:
+                    if isinstance(result, CodeList):
+                        result = result.render()
+                        if not first:
+                            result = " " + result
+                    yield result
+                    first = False
+                    continue
+                # decimal is parsed completely before anything is formatted,
+                # so a later token int() rejects beats this one
+                parse_pending = key[0] == "decimal" and _decimal_parse_error(key, tokens) is None
+            elif parse_pending:
+                parse_error = _decimal_parse_error(key, tokens)
+                if parse_error is not None:
+                    error, parse_pending = parse_error, False
+            if final and not parse_pending:
+                break
+
+        message = checks.error()
+        if message is None and checks.single_byte:
+            result = mode_fn("".join(checks.head))
+            if isinstance(result, str) and result.startswith("Error:"):
+                raise ConversionError(result)
+            yield result.render() if isinstance(result, CodeList) else result
+            return
+        message = message or error
+        if message is not None:
+            raise ConversionError(message)
+
+    stream.__name__ = mode_fn.__name__ + "_stream"
+    stream.__doc__ = f"Streaming version of {mode_fn.__name__}()."
+    return stream
+
+
+def _encode_stream(mode_fn, target):
+    """Build a streaming version of a Text → UTF-x mode (chunks are encoded as they come)."""
+    fmt = _FORMATTERS[target]
+
+    def stream(source, chunk_size=STREAM_CHUNK_SIZE):
+        first = True
+        held = []   # leading whitespace: the whole input may still turn out empty
+        for chunk in _iter_chunks(source, chunk_size, mode_fn):
+            if first and chunk.isspace():
+                held.append(chunk)
+                continue
+            try:
+                out = fmt(_LazyCodes("".join(held) + chunk))
+            except Exception as e:
+                raise ConversionError(_error_message(("text", target), e)) from None
+            held = []
+            yield out if first else " " + out
+            first = False
+        if first:
+            raise ConversionError(mode_fn(""))
+
+    stream.__name__ = mode_fn.__name__ + "_stream"
+    stream.__doc__ = f"Streaming version of {mode_fn.__name__}()."
+    return stream
+
+
+def _paired_first(batches):
+    """The same tokens, but the first batch has two of them when the input does."""
+    held = []
+    for tokens in batches:
+        if held is not None:
+            held += tokens
+            if len(held) < 2:
+                continue
+            tokens, held = held, None
+        yield tokens
+    if held:
+        yield held
+
+
+def _decode_stream(mode_fn, base):
+    """
+    Build a streaming version of a UTF-x → Text mode. An incremental decoder
+    keeps the bytes of a character that is cut by a batch boundary.
+    """
+    codec, _, digits = _ENCODED_BASES[base]
+
+    def stream(source, chunk_size=STREAM_CHUNK_SIZE):
+        checks = _WholeInputChecks((base, "text"))
+        batches = _token_batches(checks.watch(_iter_chunks(source, chunk_size, mode_fn)))
+        if digits == "binary":
+            batches = _paired_first(batches)   # one unspaced run of bytes is fine on its own
+        decoder = codecs.getincrementaldecoder(codec)()
+        first = True
+        error = None   # bytes that don't decode: bad digits further on still come first
+        for tokens in batches:
+            if checks.stray and checks.started:
+                break
+            try:
+                if digits == "binary" and not first and len(tokens) == 1 and len(tokens[0]) != 8:
+                    raise ValueError("each group must be 8 bits")
+                data = _digits_to_bytes(" ".join(tokens), digits)
+            except ValueError:
+                raise ConversionError(_BYTE_DIGITS_MSGS[digits]) from None
+            first = False
+            if error is not None:
+                continue
+            try:
+                text = decoder.decode(data)
+            except UnicodeDecodeError:
+                error = _invalid_bytes_msg(base)
+                continue
+            if text:
+                yield text
+
+        message = checks.error() or error
+        if message is None:
+            try:
+                text = decoder.decode(b"", True)   # a character cut off at the very end
+            except UnicodeDecodeError:
+                message = _invalid_bytes_msg(base)
+        if message is not None:
+            raise ConversionError(message)
+        if text:
+            yield text
+
+    stream.__name__ = mode_fn.__name__ + "_stream"
+    stream.__doc__ = f"Streaming version of {mode_fn.__name__}()."
+    return stream
+
+
+def _number_stream(mode_fn):
+    """Build a streaming version of a whole-number mode (the value needs all of the input)."""
+    def stream(source, chunk_size=STREAM_CHUNK_SIZE):
+        digits = "".join("".join(chunk.split()) for chunk in _iter_chunks(source, chunk_size, mode_fn))
+        result = mode_fn(digits)
+        if result.startswith("Error:"):
+            raise ConversionError(result)
+        yield result
+
+    stream.__name__ = mode_fn.__name__ + "_stream"
+    stream.__doc__ = f"Streaming version of {mode_fn.__name__}()."
+    return stream
+
+
+def _make_stream(key, mode_fn):
+    source, target = key
+    if source in _NUMBER_BASES:
+        return _number_stream(mode_fn)
+    if source in _ENCODED_BASES:
+        return _decode_stream(mode_fn, source)
+    if target in _ENCODED_BASES:
+        return _encode_stream(mode_fn, target)
+    if source == "text":
+        return _text_stream(mode_fn, target)
+    return _token_stream(mode_fn, key)
+
+
+_STREAMS = {key: _make_stream(key, fn) for key, fn in _MODE_FUNCS.items()}
+
+# Dropdown names -> streaming function (same keys as MODES)
+STREAM_MODES = {_mode_name(*key): fn for key, fn in _STREAMS.items()}
+
+# Text-based
+text_to_unicode_stream = _STREAMS[("text", "decimal")]
+text_to_binary_stream = _STREAMS[("text", "binary")]
+text_to_octal_stream = _STREAMS[("text", "octal")]
+text_to_hex_stream = _STREAMS[("text", "hex")]
+
+# Binary-based
+binary_to_text_stream = _STREAMS[("binary", "text")]
+binary_to_unicode_stream = _STREAMS[("binary", "decimal")]
+binary_to_octal_stream = _STREAMS[("binary", "octal")]
+binary_to_hex_stream = _STREAMS[("binary", "hex")]
+
+# Unicode/ASCII-based
+unicode_to_text_stream = _STREAMS[("decimal", "text")]
+unicode_to_binary_stream = _STREAMS[("decimal", "binary")]
+unicode_to_octal_stream = _STREAMS[("decimal", "octal")]
+decimal_to_hex_stream = _STREAMS[("decimal", "hex")]
+
+# Hexadecimal-based
+hex_to_text_stream = _STREAMS[("hex", "text")]
+hex_to_decimal_stream = _STREAMS[("hex", "decimal")]
+hex_to_binary_stream = _STREAMS[("hex", "binary")]
+hex_to_octal_stream = _STREAMS[("hex", "octal")]
+
+# Octal-based
+octal_to_text_stream = _STREAMS[("octal", "text")]
+octal_to_binary_stream = _STREAMS[("octal", "binary")]
+octal_to_unicode_stream = _STREAMS[("octal", "decimal")]
+octal_to_hex_stream = _STREAMS[("octal", "hex")]
+
+# UTF byte encodings
+text_to_utf8_binary_stream = _STREAMS[("text", "utf8_binary")]
+utf8_binary_to_text_stream = _STREAMS[("utf8_binary", "text")]
+text_to_utf8_hex_stream = _STREAMS[("text", "utf8_hex")]
+utf8_hex_to_text_stream = _STREAMS[("utf8_hex", "text")]
+text_to_utf16le_binary_stream = _STREAMS[("text", "utf16le_binary")]
+utf16le_binary_to_text_stream = _STREAMS[("utf16le_binary", "text")]
+text_to_utf16le_hex_stream = _STREAMS[("text", "utf16le_hex")]
+utf16le_hex_to_text_stream = _STREAMS[("utf16le_hex", "text")]
+text_to_utf16be_binary_stream = _STREAMS[("text", "utf16be_binary")]
+utf16be_binary_to_text_stream = _STREAMS[("utf16be_binary", "text")]
+text_to_utf16be_hex_stream = _STREAMS[("text", "utf16be_hex")]
+utf16be_hex_to_text_stream = _STREAMS[("utf16be_hex", "text")]
+text_to_utf32be_binary_stream = _STREAMS[("text", "utf32be_binary")]
+utf32be_binary_to_text_stream = _STREAMS[("utf32be_binary", "text")]
+text_to_utf32be_hex_stream = _STREAMS[("text", "utf32be_hex")]
+utf32be_hex_to_text_stream = _STREAMS[("utf32be_hex", "text")]
+
+# Whole numbers
+binary_number_to_octal_stream = _STREAMS[("binary_number", "octal_number")]
+binary_number_to_decimal_stream = _STREAMS[("binary_number", "decimal_number")]
+binary_number_to_hex_stream = _STREAMS[("binary_number", "hex_number")]
+octal_number_to_binary_stream = _STREAMS[("octal_number", "binary_number")]
+octal_number_to_decimal_stream = _STREAMS[("octal_number", "decimal_number")]
+octal_number_to_hex_stream = _STREAMS[("octal_number", "hex_number")]
+decimal_number_to_binary_stream = _STREAMS[("decimal_number", "binary_number")]
+decimal_number_to_octal_stream = _STREAMS[("decimal_number", "octal_number")]
+decimal_number_to_hex_stream = _STREAMS[("decimal_number", "hex_number")]
+hex_number_to_binary_stream = _STREAMS[("hex_number", "binary_number")]
+hex_number_to_octal_stream = _STREAMS[("hex_number", "octal_number")]
+hex_number_to_decimal_stream = _STREAMS[("hex_number", "decimal_number")]
+
+
+# ===========================
+# INPUT NORMALIZER
+# ===========================
+# Optional clean-up of pasted dumps before a mode runs (the GUI does it on
+# every Translate, the CLI with --normalize):
+#
+#   binary   keep only 0s and 1s, regroup them into 8-bit groups
+#            ('0100100001101001' -> '01001000 01101001')
+#   octal    keep only digits 0–7, regroup them into 3-digit groups
+#   decimal  commas/semicolons become spaces, other non-digits are dropped,
+#            runs of spaces collapse ('72,105;  33' -> '72 105 33')
+#   text, hex are left as they are
+#
+# normalize_input(func, user) does a whole string and returns user itself
+# when the rule doesn't fit (binary digits that aren't a multiple of 8, so
+# Binary → Octal still gets '101 11'). normalize_stream(func, source) does
+# the same for a str, text file or iterable of chunks, and can be put in
+# front of a streaming mode:
+#
+#   binary_to_text_stream(normalize_stream(binary_to_text, open("dump.txt")))
+#
+# A stream can't take back what it already passed on, so there a short
+# last group is passed on as it is and the mode reports it. Each chunk
+# costs a bytes.translate() (or regex) pass and one join: linear time, no
+# per-character Python loop. normalize_input works in blocks the same way,
+# so a big input doesn't turn into one object per group or token
+# (test_backend_normalize.py checks the time grows linearly).
+
+_GROUP_WIDTHS = {"binary": 8, "octal": 3}
+_NOT_GROUP_DIGITS = {"binary": re.compile("[^01]+"), "octal": re.compile("[^0-7]+")}
+_NOT_GROUP_BYTES = {   # the same for ASCII text, as a bytes.translate() delete table
+    source: bytes(c for c in range(256) if chr(c) not in _DIGITS[source]) for source in _GROUP_WIDTHS
+}
+_NOT_DECIMAL_KEPT = re.compile(r"[^\d\s,;]+")
+_SEPARATORS_TO_SPACE = str.maketrans(",;", "  ")
+# ... and for ASCII text: one bytes.translate() that does both
+_SEPARATOR_BYTES_TO_SPACE = bytes.maketrans(b",;", b"  ")
+_NOT_DECIMAL_BYTES = bytes(c for c in range(256) if not (chr(c).isdigit() or chr(c).isspace() or chr(c) in ",;"))
+
+
+def _kept_digits(match):
+    # \d is only 0–9 and other decimal digits; isdigit() also keeps e.g. '²'
+    return "".join(filter(str.isdigit, match.group()))
+
+
+def _clean_decimal(chunk):
+    if chunk.isascii():
+        data = chunk.encode("ascii").translate(_SEPARATOR_BYTES_TO_SPACE, _NOT_DECIMAL_BYTES)
+        return data.decode("ascii")
+    return _NOT_DECIMAL_KEPT.sub(_kept_digits, chunk).translate(_SEPARATORS_TO_SPACE)
+
+
+def _only_digits(source, text):
+    """text without everything that isn't a digit of binary/octal `source`."""
+    if text.isascii():
+        return text.encode("ascii").translate(None, _NOT_GROUP_BYTES[source]).decode("ascii")
+    return _NOT_GROUP_DIGITS[source].sub("", text)
+
+
+def _group_digits(digits, width, progress=_no_progress):
+    # a block of groups at a time, so a big input never has one object per group
+    block = width * STREAM_CHUNK_SIZE
+    blocks = []
+    for start in range(0, len(digits), block):
+        progress(start, len(digits))
+        blocks.append(" ".join([digits[i:i + width] for i in range(start, min(start + block, len(digits)), width)]))
+    return " ".join(blocks)
+
+
+def _reported_chunks(user, chunk_size, func, progress):
+    """_iter_chunks for a str, calling progress(done, total) before every chunk."""
+    done = 0
+    for chunk in _iter_chunks(user, chunk_size, func):
+        progress(done, len(user))
+        done += len(chunk)
+        yield chunk
+
+
+def normalize_input(func, user, progress=None):
+    """
+    user cleaned up for mode function `func` (see above), or user itself.
+    progress works as for the mode functions.
+    """
+    source = _FUNC_KEYS[func][0]
+    if not isinstance(user, str):
+        return user
+    if progress is None:
+        progress = _no_progress
+    if source in _GROUP_WIDTHS:
+        width = _GROUP_WIDTHS[source]
+        digits = _only_digits(source, user)
+        if not digits or len(digits) % width:
+            return user
+        return _group_digits(digits, width, progress)
+    if source == "decimal":
+        chunks = _reported_chunks(user, STREAM_CHUNK_SIZE, func, progress)
+        return "".join(_decimal_chunks(chunks)) or user
+    return user
+
+
+def _grouped_chunks(chunks, source):
+    width = _GROUP_WIDTHS[source]
+    carry = ""   # digits of a group that isn't complete yet
+    first = True
+    for chunk in chunks:
+        digits = carry + _only_digits(source, chunk)
+        cut = len(digits) - len(digits) % width
+        carry = digits[cut:]
+        if cut:
+            out = _group_digits(digits[:cut], width)
+            yield out if first else " " + out
+            first = False
+    if carry:
+        yield carry if first else " " + carry
+
+
+def _decimal_chunks(chunks):
+    # chunks left empty by the clean-up are skipped, so '7', 'a', '2' -> '72'
+    first = True
+    for tokens in _token_batches(filter(None, map(_clean_decimal, chunks))):
+        out = " ".join(tokens)
+        yield out if first else " " + out
+        first = False
+
+
+def normalize_stream(func, source, chunk_size=STREAM_CHUNK_SIZE):
+    """Normalized chunks of `source` (a str, text file object or iterable of str) for `func`."""
+    kind = _FUNC_KEYS[func][0]
+    chunks = _iter_chunks(source, chunk_size, func)
+    if kind in _GROUP_WIDTHS:
+        return _grouped_chunks(chunks, kind)
+    if kind == "decimal":
+        return _decimal_chunks(chunks)
+    return chunks
+
+
+# ===========================
+# BYTES MODES
+# ===========================
+# Same conversions for data that is already bytes (from sockets, files or
+# mmap): the input can be any buffer (bytes, bytearray, memoryview, mmap, ...)
+# and the output comes back as bytes or is written into a buffer you pass.
+#
+#   n = hex_to_text_bytes(b"48 69", out=my_bytearray)   # appends b"Hi"
+#
+# - Binary/decimal/octal/hex input is ASCII digits. Big evenly spaced input
+#   is parsed by NumPy straight from the buffer; anything else goes through
+#   the normal parser (for ASCII data the str conversion is a plain copy).
+#   Results and error checks are the same as the str functions.
+# - Text input is raw bytes: every byte is one character (0–255) and no
+#   whitespace is cleaned up, so binary files convert as they are.
+# - Text output is encoded with `encoding` (default latin-1: one byte per
+#   character, the reverse of the raw input above).
+# Problems are raised as ConversionError with the usual "Error: ..." text.
+
+# source -> (base, digits per token) for NumPy's evenly-spaced parser
+_FIXED_LAYOUTS = {"binary": (2, 8), "octal": (8, 3), "hex": (16, 2)}
+
+
+def _raw_codes(view):
+    """Raw bytes -> code points (0–255), without copying when possible."""
+    if _numpy_wanted(view):
+        return _np_engine.np.frombuffer(view, dtype=_np_engine.np.uint8)
+    return view  # a memoryview of unsigned bytes iterates as ints
+
+
+def _write_output(data, out):
+    """Return data, or put it into `out` and return the number of bytes."""
+    if out is None:
+        return data
+    if isinstance(out, bytearray):
+        out += data
+        return len(data)
+    target = memoryview(out).cast("B")
+    if len(data) > len(target):
+        raise ValueError(f"output buffer too small: need {len(data)} bytes, have {len(target)}")
+    target[:len(data)] = data
+    return len(data)
+
+
+def convert_bytes(func, data, out=None, encoding="latin-1"):
+    """
+    Run mode function `func` on a bytes-like input. Returns the output as
+    bytes, or writes it into `out` (a bytearray is appended to, any other
+    writable buffer is filled from the start) and returns the byte count.
+    """
+    source, target = key = _FUNC_KEYS[func]
+    view = memoryview(data).cast("B")
+    if not len(view):
+        raise ConversionError(_EMPTY_MSG)
+
+    if source == "text":
+        fmt = _FORMATTER_OVERRIDES.get(key, _FORMATTERS[target])
+        result = fmt(_raw_codes(view))
+    else:
+        codes = None
+        if source in _FIXED_LAYOUTS and key not in _PARSER_OVERRIDES and _numpy_wanted(view):
+            codes = _np_engine.parse_fixed(view, *_FIXED_LAYOUTS[source])
+        if codes is not None:
+            result = _FORMATTERS[target](codes)
+        else:
+            text = str(view, "latin-1")  # non-ASCII bytes fail like any bad character
+            result = func(text)
+            if isinstance(result, str) and result.startswith("Error:"):
+                raise ConversionError(result, check_input(func, text))  # offsets are byte offsets
+
+    return _write_output(_encode_result(result, encoding), out)
+
+
+def _encode_result(result, encoding):
+    """Formatter output (str or CodeList) -> bytes."""
+    if isinstance(result, str):
+        try:
+            return result.encode(encoding)
+        except UnicodeEncodeError:
+            raise ConversionError(
+                f"Error: Some characters can't be written as {encoding} (try encoding='utf-8')."
+            ) from None
+    return result.render().encode("ascii")
+
+
+def _bytes_mode(mode_fn):
+    def convert(data, out=None, encoding="latin-1"):
+        return convert_bytes(mode_fn, data, out, encoding)
+
+    convert.__name__ = mode_fn.__name__ + "_bytes"
+    convert.__doc__ = f"Bytes version of {mode_fn.__name__}() (see convert_bytes)."
+    return convert
+
+
+_BYTES = {key: _bytes_mode(fn) for key, fn in _MODE_FUNCS.items()}
+
+# Dropdown names -> bytes function (same keys as MODES)
+BYTES_MODES = {_mode_name(*key): fn for key, fn in _BYTES.items()}
+
+# Text-based
+text_to_unicode_bytes = _BYTES[("text", "decimal")]
+text_to_binary_bytes = _BYTES[("text", "binary")]
+text_to_octal_bytes = _BYTES[("text", "octal")]
+text_to_hex_bytes = _BYTES[("text", "hex")]
+
+# Binary-based
+binary_to_text_bytes = _BYTES[("binary", "text")]
+binary_to_unicode_bytes = _BYTES[("binary", "decimal")]
+binary_to_octal_bytes = _BYTES[("binary", "octal")]
+binary_to_hex_bytes = _BYTES[("binary", "hex")]
+
+# Unicode/ASCII-based
+unicode_to_text_bytes = _BYTES[("decimal", "text")]
+unicode_to_binary_bytes = _BYTES[("decimal", "binary")]
+unicode_to_octal_bytes = _BYTES[("decimal", "octal")]
+decimal_to_hex_bytes = _BYTES[("decimal", "hex")]
+
+# Hexadecimal-based
+hex_to_text_bytes = _BYTES[("hex", "text")]
+hex_to_decimal_bytes = _BYTES[("hex", "decimal")]
+hex_to_binary_bytes = _BYTES[("hex", "binary")]
+hex_to_octal_bytes = _BYTES[("hex", "octal")]
+
+# Octal-based
+octal_to_text_bytes = _BYTES[("octal", "text")]
+octal_to_binary_bytes = _BYTES[("octal", "binary")]
+octal_to_unicode_bytes = _BYTES[("octal", "decimal")]
+octal_to_hex_bytes = _BYTES[("octal", "hex")]
+
+# UTF byte encodings
+text_to_utf8_binary_bytes = _BYTES[("text", "utf8_binary")]
+utf8_binary_to_text_bytes = _BYTES[("utf8_binary", "text")]
+text_to_utf8_hex_bytes = _BYTES[("text", "utf8_hex")]
+utf8_hex_to_text_bytes = _BYTES[("utf8_hex", "text")]
+text_to_utf16le_binary_bytes = _BYTES[("text", "utf16le_binary")]
+utf16le_binary_to_text_bytes = _BYTES[("utf16le_binary", "text")]
+text_to_utf16le_hex_bytes = _BYTES[("text", "utf16le_hex")]
+utf16le_hex_to_text_bytes = _BYTES[("utf16le_hex", "text")]
+text_to_utf16be_binary_bytes = _BYTES[("text", "utf16be_binary")]
+utf16be_binary_to_text_bytes = _BYTES[("utf16be_binary", "text")]
+text_to_utf16be_hex_bytes = _BYTES[("text", "utf16be_hex")]
+utf16be_hex_to_text_bytes = _BYTES[("utf16be_hex", "text")]
+text_to_utf32be_binary_bytes = _BYTES[("text", "utf32be_binary")]
+utf32be_binary_to_text_bytes = _BYTES[("utf32be_binary", "text")]
+text_to_utf32be_hex_bytes = _BYTES[("text", "utf32be_hex")]
+utf32be_hex_to_text_bytes = _BYTES[("utf32be_hex", "text")]
+
+# Whole numbers
+binary_number_to_octal_bytes = _BYTES[("binary_number", "octal_number")]
+binary_number_to_decimal_bytes = _BYTES[("binary_number", "decimal_number")]
+binary_number_to_hex_bytes = _BYTES[("binary_number", "hex_number")]
+octal_number_to_binary_bytes = _BYTES[("octal_number", "binary_number")]
+octal_number_to_decimal_bytes = _BYTES[("octal_number", "decimal_number")]
+octal_number_to_hex_bytes = _BYTES[("octal_number", "hex_number")]
+decimal_number_to_binary_bytes = _BYTES[("decimal_number", "binary_number")]
+decimal_number_to_octal_bytes = _BYTES[("decimal_number", "octal_number")]
+decimal_number_to_hex_bytes = _BYTES[("decimal_number", "hex_number")]
+hex_number_to_binary_bytes = _BYTES[("hex_number", "binary_number")]
+hex_number_to_octal_bytes = _BYTES[("hex_number", "octal_number")]
+hex_number_to_decimal_bytes = _BYTES[("hex_number", "decimal_number")]
+
+
+# ===========================
+# LIVE (INCREMENTAL) TRANSLATION
+# ===========================
+# For updating the output while the input is being typed. The input is cut
+# into blocks of LIVE_BLOCK tokens (words for the text modes); each block
+# remembers the output pieces of its tokens. An edit only re-converts the
+# blocks around the changed characters and returns the matching patch for
+# the output text.
+#
+# Tokens are converted one by one the same way the *_stream functions do it,
+# so any whitespace separates tokens and the GUI's auto-grouping is not
+# applied.
+
+LIVE_BLOCK = 256  # tokens per block
+
+_TOKEN_RE = re.compile(r"\S+")
+_ASTRAL_RE = re.compile("[\U00010000-\U0010FFFF]")  # chars that are 2 units in UTF-16 / Qt
+
+
+class _LiveBlock:
+    __slots__ = ("in_len", "pieces", "out_len", "multi", "error", "astral_in", "astral_out")
+
+
+class LiveTranslation:
+    """
+    Output of one mode, kept in sync with an input that is edited in place.
+
+        live = LiveTranslation("Hexadecimal - Text")
+        live.reset("48 69")              # live.output == "Hi"
+        patch = live.edit("48 69 21", 5, 0)
+        # patch == (2, 0, "!"): replace 0 output chars at 2 with "!"
+
+    edit() returns None when the whole output has to be redrawn from
+    live.output. While live.error is set, live.output is "".
+    """
+
+    def __init__(self, mode):
+        func = MODES.get(normalize_mode(mode)) if isinstance(mode, str) else mode
+        keys = [key for key, fn in _MODE_FUNCS.items() if fn is func]
+        if not keys:
+            raise ValueError(f"unknown mode: {mode!r}")
+        self._func = func
+        self._source, self._target = keys[0]
+        if self._source not in _CLASSIC_BASES or self._target not in _CLASSIC_BASES:
+            # byte sequences and whole numbers don't split into independent tokens
+            raise ValueError(f"no live translation for {_mode_name(*keys[0])!r}")
+
+        if self._source == "text":
+            # words are converted separately; the single space between two
+            # words becomes its own converted character
+            self._word_fmt = _FORMATTERS[self._target]
+            self._word_sep = " " + self._render(self._word_fmt([ord(" ")])) + " "
+        else:
+            self._word_sep = "" if self._target == "text" else " "
+
+        self.text = ""
+        self._blocks = self._build("", 0, 0)
+
+    # ---- public ----
+
+    def reset(self, text):
+        """Convert a whole new input."""
+        self.text = text
+        self._blocks = self._build(text, 0, len(text))
+
+    def edit(self, text, prefix, suffix):
+        """
+        The input is now `text`. Its first `prefix` and last `suffix`
+        characters are unchanged since the last call. Returns
+        (output position, characters removed, new text) or None.
+        """
+        old_len = len(self.text)
+        if prefix < 0 or suffix < 0 or prefix + suffix > min(old_len, len(text)):
+            self.reset(text)
+            return None
+
+        was_ok = self.error is None
+        old_sep = self._sep()
+
+        # blocks touching the edit, plus one character on each side so a
+        # token that was split or merged by the edit is re-read whole
+        lo, hi = prefix - 1, old_len - suffix + 1
+        first = last = None
+        pos = start = end = 0
+        for idx, blk in enumerate(self._blocks):
+            blk_end = pos + blk.in_len
+            if blk_end > lo and pos < hi:
+                if first is None:
+                    first, start = idx, pos
+                last, end = idx, blk_end
+            elif pos >= hi:
+                break
+            pos = blk_end
+        if first is None:
+            self.reset(text)
+            return None
+
+        delta = len(text) - old_len
+        old_mid = self._blocks[first:last + 1]
+        new_mid = self._build(text, start, end + delta)
+        self._blocks[first:last + 1] = new_mid
+        self.text = text
+
+        sep = self._sep()
+        if not was_ok or self.error is not None or sep != old_sep:
+            return None  # output is (or was) not shown, or every separator changed
+
+        before = sum(len(b.pieces) for b in self._blocks[:first])
+        after = sum(len(b.pieces) for b in self._blocks[first + len(new_mid):])
+        out_start = sum(b.out_len for b in self._blocks[:first]) + max(before - 1, 0) * len(sep)
+
+        def middle_len(blocks):
+            count = sum(len(b.pieces) for b in blocks)
+            parts = count + (before > 0) + (after > 0)
+            return sum(b.out_len for b in blocks) + max(parts - 1, 0) * len(sep)
+
+        pieces = [""] if before else []
+        for b in new_mid:
+            pieces.extend(b.pieces)
+        if after:
+            pieces.append("")
+        return out_start, middle_len(old_mid), sep.join(pieces)
+
+    @property
+    def output(self):
+        if self.error is not None:
+            return ""
+        return self._sep().join(chain.from_iterable(b.pieces for b in self._blocks))
+
+    @property
+    def error(self):
+        """First 'Error: ...' message in the input, or None."""
+        for b in self._blocks:
+            if b.error is not None:
+                return b.error
+        return None
+
+    @property
+    def input_has_astral(self):
+        """True if the input has characters outside the BMP (2 UTF-16 units each)."""
+        return any(b.astral_in for b in self._blocks)
+
+    @property
+    def output_has_astral(self):
+        return any(b.astral_out for b in self._blocks)
+
+    # ---- internals ----
+
+    @staticmethod
+    def _render(result):
+        return result.render()
+
+    def _sep(self):
+        if self._source == "text":
+            words = sum(len(b.pieces) for b in self._blocks)
+            multi = sum(b.multi for b in self._blocks)
+            if words >= 2 and multi == 0:
+                return " "  # 'H e l l o' rule: letters are glued together
+        return self._word_sep
+
+    def _build(self, text, start, end):
+        """Blocks covering text[start:end] (start is at a token or at 0)."""
+        matches = list(_TOKEN_RE.finditer(text, start, end))
+        if not matches:
+            return [self._block(text, start, end, [])]
+
+        blocks = []
+        for k in range(0, len(matches), LIVE_BLOCK):
+            group = matches[k:k + LIVE_BLOCK]
+            blk_start = start if k == 0 else group[0].start()
+            nxt = k + LIVE_BLOCK
+            blk_end = matches[nxt].start() if nxt < len(matches) else end
+            blocks.append(self._block(text, blk_start, blk_end, [m.group() for m in group]))
+        return blocks
+
+    def _block(self, text, start, end, tokens):
+        b = _LiveBlock()
+        b.in_len = end - start
+        b.astral_in = _ASTRAL_RE.search(text, start, end) is not None
+        b.error = None
+        b.multi = 0
+
+        if self._source == "text":
+            fmt = self._word_fmt
+            b.pieces = [self._render(fmt(map(ord, word))) for word in tokens]
+            b.multi = sum(1 for word in tokens if len(word) > 1)
+        else:
+            b.pieces = self._convert_tokens(tokens, b)
+
+        b.out_len = sum(map(len, b.pieces))
+        b.astral_out = self._target == "text" and _ASTRAL_RE.search("".join(b.pieces)) is not None
+        return b
+
+    def _convert_tokens(self, tokens, b):
+        if not tokens:
+            return []
+        result = self._func(" ".join(tokens))
+        if not (isinstance(result, str) and result.startswith("Error:")) and len(result) == len(tokens):
+            return list(result) if isinstance(result, str) else list(map(str, result))
+
+        # find the bad token (or convert one by one when the tokens only
+        # made sense together, e.g. '0100000 1' read as one byte)
+        pieces = []
+        for tok in tokens:
+            result = self._func(tok)
+            if isinstance(result, str) and result.startswith("Error:"):
+                b.error = result
+                return []
+            pieces.append(result if isinstance(result, str) else self._render(result))
+        return pieces
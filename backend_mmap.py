@@ -0,0 +1,308 @@
+# ==========================================================
+# BINLATOR memory-mapped file conversion
+# ==========================================================
+# File-to-file conversion for captures too big to hold in memory:
+#
+#   import backend, backend_mmap
+#   backend_mmap.convert_file(backend.binary_to_text, "capture.txt", "capture.bin")
+#
+# The output is the same bytes backend.convert_bytes() gives for the whole
+# input file (raw-byte text input, latin-1 text output by default). The
+# input is mmapped and cut into pieces that are converted by a process pool
+# (see backend_parallel.py); every worker writes its own region of the
+# output file, so nothing is merged or held in memory.
+#
+# - Fixed-width modes (e.g. Text → Binary: 1 byte in, "dddddddd " out) with
+#   evenly spaced input: the output offset of every element is known up
+#   front, so the output file is sized once and the pieces are written
+#   straight away.
+# - Everything else (and fixed-width modes whose input isn't evenly spaced)
+#   takes two passes: convert each piece once to learn its output size,
+#   then again to write it at its offset.
+#
+# - UTF-x byte dumps (UTF-8 Hexadecimal → Text, ...) and whole numbers are
+#   converted in one go, since they can't be cut into pieces.
+#
+# Problems are raised as ConversionError with the message the whole-input
+# conversion would give; the output file is removed.
+
+import mmap
+import os
+import re
+
+import backend
+from backend_parallel import CHUNKS_PER_WORKER, _chunk_parser, _get_pool, worker_count
+
+MAX_PIECE = 32 * 1024 * 1024  # input bytes per piece (bounds each worker's memory)
+
+# Whitespace as the bytes modes see it (str.split() after latin-1 decoding)
+_WS = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f\x85\xa0"
+_WS_RE = re.compile(b"[" + re.escape(_WS) + b"]")
+_NON_WS_RE = re.compile(b"[^" + re.escape(_WS) + b"]")
+_OTHER_WS_RE = re.compile(b"[" + re.escape(_WS[1:]) + b"]")  # all but the plain space
+
+# (source, target) -> (input bytes per element, digits per token (None = raw
+# text byte), output bytes per element including its separator). Only valid
+# for latin-1 text output.
+_FIXED = {
+    ("text", "binary"): (1, None, 9),
+    ("binary", "text"): (9, 8, 1),
+    ("hex", "text"): (3, 2, 1),
+    ("hex", "binary"): (3, 2, 9),
+    ("octal", "text"): (4, 3, 1),
+}
+
+# Which errors the whole-input run would hit first: parsing is finished for
+# the whole input before formatting starts, and encoding comes last.
+_PHASES = ("parse", "format", "encode")
+
+
+# ===========================
+# WORKER SIDE
+# ===========================
+
+def _read(path, start, end):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        return m[start:end]
+
+
+def _write_at(path, offset, data):
+    with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as m:
+        m[offset:offset + len(data)] = data
+
+
+def _convert_piece(key, chunk, encoding):
+    """One piece -> ("ok", bytes) or (phase, error message)."""
+    source, target = key
+    if source == "text":
+        codes = backend._raw_codes(memoryview(chunk))
+    else:
+        try:
+            codes = _chunk_parser(key)(chunk.decode("latin-1"))
+        except Exception as e:
+            return "parse", backend._error_message(key, e)
+
+    fmt = backend._FORMATTER_OVERRIDES.get(key, backend._FORMATTERS[target])
+    try:
+        result = fmt(codes)
+    except Exception as e:
+        return "format", backend._error_message(key, e)
+    try:
+        return "ok", backend._encode_result(result, encoding)
+    except backend.ConversionError as e:
+        return "encode", str(e)
+
+
+def _exact_layout(chunk, width):
+    """True if chunk is 'dd dd dd' with every token `width` long and single spaces."""
+    step = width + 1
+    if (len(chunk) + 1) % step:
+        return False
+    seps = chunk[width::step]
+    return (
+        seps == b" " * len(seps)
+        and chunk.count(b" ") == len(seps)
+        and not _OTHER_WS_RE.search(chunk)
+    )
+
+
+def _fixed_job(key, in_path, out_path, start, end, offset, expected, last, encoding):
+    chunk = _read(in_path, start, end)
+    width = _FIXED[key][1]
+    if width is not None:
+        if not last:
+            if chunk[-1:] != b" ":
+                return "layout", None
+            chunk = chunk[:-1]  # separator in front of the next piece
+        if not _exact_layout(chunk, width):
+            return "layout", None
+
+    status, data = _convert_piece(key, chunk, encoding)
+    if status != "ok":
+        return status, data
+    if not last and key[1] != "text":
+        data += b" "
+    if len(data) != expected:
+        return "layout", None
+    _write_at(out_path, offset, data)
+    return "ok", None
+
+
+def _size_job(key, in_path, start, end, encoding):
+    """Pass 1: output size of one piece. Returns (status, size or message, spaces)."""
+    chunk = _read(in_path, start, end)
+    spaces = chunk.count(b" ")
+    if key[0] != "text" and not _NON_WS_RE.search(chunk):
+        return "empty", 0, spaces
+    status, data = _convert_piece(key, chunk, encoding)
+    return status, len(data) if status == "ok" else data, spaces
+
+
+def _fill_job(key, in_path, out_path, start, end, offset, sep_before, encoding):
+    """Pass 2: convert one piece again and write it at its offset."""
+    status, data = _convert_piece(key, _read(in_path, start, end), encoding)
+    if status != "ok":  # can't happen after a clean pass 1
+        raise backend.ConversionError(data)
+    _write_at(out_path, offset, b" " + data if sep_before else data)
+
+
+# ===========================
+# CALLER SIDE
+# ===========================
+
+def _run(job, args_list, workers):
+    if workers < 2 or len(args_list) < 2:
+        return [job(*args) for args in args_list]
+    pool = _get_pool(workers)
+    return [f.result() for f in [pool.submit(job, *args) for args in args_list]]
+
+
+def _first_error(results):
+    """Message of the error the whole-input run would report, or None."""
+    for phase in _PHASES:
+        for result in results:
+            if result[0] == phase:
+                return result[1]
+    return None
+
+
+def _allocate(path, size):
+    with open(path, "wb") as f:
+        f.truncate(size)
+
+
+def _try_fixed(key, m, in_path, out_path, workers, encoding):
+    """Fixed-width strategy. Returns bytes written, or None if the input isn't evenly laid out."""
+    in_step, width, out_step = _FIXED[key]
+    size = len(m)
+    if width is not None and (size + 1) % in_step:
+        return None
+    count = size if width is None else (size + 1) // in_step
+    total = count * out_step - (0 if key[1] == "text" else 1)
+
+    per_piece = max(min(-(-count // (workers * CHUNKS_PER_WORKER)), MAX_PIECE // in_step), 1)
+    jobs = []
+    for first in range(0, count, per_piece):
+        stop = min(first + per_piece, count)
+        last = stop == count
+        expected = (stop - first) * out_step - (1 if last and key[1] != "text" else 0)
+        jobs.append((key, in_path, out_path, first * in_step, min(stop * in_step, size),
+                     first * out_step, expected, last, encoding))
+
+    _allocate(out_path, total)
+    results = _run(_fixed_job, jobs, workers)
+    if any(status == "layout" for status, _ in results):
+        return None
+    message = _first_error(results)
+    if message is not None:
+        raise backend.ConversionError(message)
+    return total
+
+
+def _cut_points(m, piece, text_source):
+    cuts = [0]
+    while cuts[-1] + piece < len(m):
+        pos = cuts[-1] + piece
+        if not text_source:
+            found = _WS_RE.search(m, pos)
+            if found is None:
+                break
+            pos = found.start()
+        cuts.append(pos)
+    cuts.append(len(m))
+    return cuts
+
+
+def _binary_shape_error(m, spaces):
+    """
+    backend._binary_shape_error() for a whole file, from the space count
+    the pieces reported (the file is never turned into one str).
+    """
+    size = len(m)
+
+    def spaced():
+        # spaces inside user.strip(): all spaces minus those in the whitespace at either end
+        start = _NON_WS_RE.search(m).start()
+        end = size
+        while m[end - 1] in _WS:
+            end -= 1
+        return spaces != m[:start].count(b" ") + m[end:].count(b" ")
+
+    return backend._binary_shape_error(size - spaces, spaced)
+
+
+def _two_pass(key, m, in_path, out_path, workers, encoding):
+    piece = max(min(-(-len(m) // (workers * CHUNKS_PER_WORKER)), MAX_PIECE), 1)
+    cuts = _cut_points(m, piece, key[0] == "text")
+    spans = list(zip(cuts, cuts[1:]))
+
+    sizes = _run(_size_job, [(key, in_path, a, b, encoding) for a, b in spans], workers)
+    if all(status == "empty" for status, _, _ in sizes):
+        raise backend.ConversionError(backend._EMPTY_MSG)
+
+    if key[0] == "binary" and key not in backend._PARSER_OVERRIDES:
+        message = _binary_shape_error(m, sum(spaces for _, _, spaces in sizes))
+        if message is not None:
+            raise backend.ConversionError(message)
+        if len(m) - sum(spaces for _, _, spaces in sizes) == 8:
+            return None  # a single spaced-out byte: let the caller do it in one go
+
+    message = _first_error(sizes)
+    if message is not None:
+        raise backend.ConversionError(message)
+
+    # output offsets; non-text outputs get one space between pieces
+    jobs = []
+    offset = 0
+    for (a, b), (status, size, _) in zip(spans, sizes):
+        if status == "empty":
+            continue
+        sep = bool(jobs) and key[1] != "text"
+        jobs.append((key, in_path, out_path, a, b, offset, sep, encoding))
+        offset += size + sep
+
+    _allocate(out_path, offset)
+    if offset:
+        _run(_fill_job, jobs, workers)
+    return offset
+
+
+def _convert_whole(func, m, encoding):
+    """backend.convert_bytes() on the whole map."""
+    try:
+        return backend.convert_bytes(func, m, encoding=encoding)
+    except backend.ConversionError as e:
+        error = backend.ConversionError(str(e), e.location)
+    # raised out here, so no traceback keeps convert_bytes' view of the map alive
+    # (the map couldn't be closed while it is)
+    raise error
+
+
+def convert_file(func, in_path, out_path, workers=None, encoding="latin-1"):
+    """
+    Convert file in_path into out_path with mode function `func` (same
+    result as backend.convert_bytes on the whole file). Returns the number
+    of bytes written.
+    """
+    key = backend._FUNC_KEYS[func]
+    workers = workers or worker_count()
+    try:
+        with open(in_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise backend.ConversionError(backend._EMPTY_MSG)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                written = None
+                if key in _FIXED and encoding == "latin-1":
+                    written = _try_fixed(key, m, in_path, out_path, workers, encoding)
+                if written is None and key[0] not in backend._UNSPLIT_SOURCES:
+                    written = _two_pass(key, m, in_path, out_path, workers, encoding)
+                if written is None:
+                    data = _convert_whole(func, m, encoding)
+                    with open(out_path, "wb") as out:
+                        out.write(data)
+                    written = len(data)
+        return written
+    except backend.ConversionError:
+        if os.path.exists(out_path):
+            os.remove(out_path)
+        raise
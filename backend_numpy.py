@@ -0,0 +1,146 @@
+# ==========================================================
+# BINLATOR NumPy batch engine (optional)
+# ==========================================================
+# Vectorized versions of the hot loops in backend.py. backend.py only uses
+# this module when NumPy is installed and the input is big enough; the
+# results are exactly the same as the pure-Python path.
+#
+# Importing this module raises ImportError when NumPy is missing.
+
+import numpy as np
+
+
+BLOCK = 1 << 16  # code points handled per NumPy step (keeps temp arrays small)
+
+_SPACE = ord(" ")
+
+# ASCII byte -> digit value (99 = not a digit in any base we use)
+_DIGIT_VALUE = np.full(256, 99, dtype=np.uint8)
+for _i, _ch in enumerate(b"0123456789"):
+    _DIGIT_VALUE[_ch] = _i
+for _i, _ch in enumerate(b"ABCDEF"):
+    _DIGIT_VALUE[_ch] = 10 + _i
+    _DIGIT_VALUE[_ch + 32] = 10 + _i   # lowercase a–f
+
+# digit value -> ASCII byte (uppercase, like format(n, "X"))
+_DIGIT_CHARS = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+
+_SHIFT = {2: 1, 8: 3, 16: 4}  # bits per digit for each supported base
+
+
+# ===========================
+# INPUT SIDE
+# ===========================
+
+def text_codes(text):
+    """str -> array of code points (same numbers ord() would give)."""
+    if text.isascii():
+        return np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    return np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+
+
+def parse_fixed(text, base, width):
+    """
+    Parse 'dddd dddd ...' where every token is exactly `width` digits of
+    `base` and tokens are separated by exactly one space. `text` is a str
+    or any bytes-like object (read in place, not copied).
+
+    Returns an array of values, or None if the text is not in that exact
+    layout (the caller then uses the normal per-token parser).
+    """
+    if isinstance(text, str):
+        try:
+            text = text.encode("ascii")
+        except UnicodeEncodeError:
+            return None
+    raw = np.frombuffer(text, dtype=np.uint8)
+
+    step = width + 1
+    if len(raw) < width or (len(raw) + 1) % step:
+        return None
+
+    # every token but the last has its separator after it; the last one is
+    # handled as a row of its own, so nothing has to be appended to the input
+    count = (len(raw) + 1) // step
+    grid = raw[:(count - 1) * step].reshape(-1, step)
+    last = raw[(count - 1) * step:].reshape(1, width)
+    weights = base ** np.arange(width - 1, -1, -1, dtype=np.uint32)
+
+    out = np.empty(count, dtype=np.uint32)
+    for start in range(0, len(grid), BLOCK):
+        rows = grid[start:start + BLOCK]
+        if not (rows[:, width] == _SPACE).all():
+            return None
+        values = _DIGIT_VALUE[rows[:, :width]]
+        if (values >= base).any():
+            return None
+        out[start:start + len(rows)] = values @ weights
+
+    values = _DIGIT_VALUE[last]
+    if (values >= base).any():
+        return None
+    out[-1] = (values @ weights)[0]
+    return out
+
+
+# ===========================
+# OUTPUT SIDE
+# ===========================
+
+def to_text(codes):
+    """Code points -> str (same as joining chr() of each)."""
+    if len(codes) and int(codes.max()) < 256:
+        return codes.astype(np.uint8).tobytes().decode("latin-1")
+    return codes.astype("<u4").tobytes().decode("utf-32-le", "surrogatepass")
+
+
+def _digit_grid(codes, base, min_width):
+    """
+    Codes -> 2-D byte grid. Each row is one number in a fixed slot followed
+    by a space; when some number needs more than min_width digits, unused
+    leading slots are filled with spaces instead of zeros.
+    """
+    shift = _SHIFT[base]
+    top = int(codes.max())
+    ndig = max(min_width, -(-top.bit_length() // shift), 1)
+
+    cols = np.arange(ndig - 1, -1, -1, dtype=np.uint32) * shift
+    digits = (codes.astype(np.uint32)[:, None] >> cols) & (base - 1)
+
+    grid = np.full((len(codes), ndig + 1), _SPACE, dtype=np.uint8)
+    grid[:, :ndig] = _DIGIT_CHARS[digits]
+
+    if ndig > min_width:
+        # frexp exponent == bit length for positive numbers (0 for zero)
+        bits = np.frexp(codes.astype(np.float64))[1]
+        needed = np.maximum(-(-bits // shift), min_width)
+        blank = np.arange(ndig) < (ndig - needed)[:, None]
+        grid[:, :ndig][blank] = _SPACE
+    return grid
+
+
+_small_grids = {}  # (base, min_width) -> grid rows for 0–255
+
+
+def _small_grid(base, min_width):
+    key = (base, min_width)
+    if key not in _small_grids:
+        _small_grids[key] = _digit_grid(np.arange(256, dtype=np.uint32), base, min_width)
+    return _small_grids[key]
+
+
+def to_joined_digits(codes, base, min_width=1):
+    """
+    Codes -> 'd d d ...' digit strings joined by single spaces, the same as
+    ' '.join(format(n, spec) for n in codes).
+    """
+    pieces = []
+    for start in range(0, len(codes), BLOCK):
+        block = codes[start:start + BLOCK]
+        if int(block.max()) < 256:
+            grid = _small_grid(base, min_width)[block]   # one table lookup per code
+        else:
+            grid = _digit_grid(block, base, min_width)
+        text = grid.tobytes().decode("ascii")
+        pieces.append(" ".join(text.split()) if grid.shape[1] - 1 > min_width else text[:-1])
+    return " ".join(pieces)
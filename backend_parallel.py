@@ -0,0 +1,224 @@
+# ==========================================================
+# BINLATOR parallel driver (multi-core)
+# ==========================================================
+# Runs one backend mode on a big input using several processes:
+#
+#   import backend, backend_parallel
+#   out = backend_parallel.convert(backend.hex_to_text, huge_dump)
+#
+# The input is split on safe boundaries (whitespace for binary, octal,
+# decimal and hex; any character for text), the pieces are converted in a
+# process pool and the results are put back together in order. Input and
+# output go through multiprocessing.shared_memory instead of being pickled.
+#
+# The result is exactly what the plain backend function returns, including
+# "Error: ..." messages: inputs below PARALLEL_MIN_SIZE, UTF-x byte dumps
+# and whole numbers (which can't be cut into pieces), and any input where
+# a piece fails, are simply run by the normal serial function.
+
+import os
+import re
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+
+import backend
+
+PARALLEL_MIN_SIZE = 2 * 1024 * 1024  # characters; smaller inputs run serially
+CHUNKS_PER_WORKER = 4                # more pieces than workers evens out the load
+
+# ASCII whitespace bytes (what str.split() splits on). In UTF-8 these never
+# appear inside a multi-byte character, so cutting there is always safe.
+_WHITESPACE_BYTE = re.compile(rb"[ \t\n\r\x0b\x0c\x1c-\x1f]")
+
+_KEYS = {fn: key for key, fn in backend._MODE_FUNCS.items()}   # function -> (source, target)
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()   # convert() may be called from several threads (binlator_server)
+
+
+def worker_count():
+    return os.cpu_count() or 1
+
+
+def _get_pool(workers):
+    """One pool for the whole program (starting processes is the slow part)."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            _shutdown()
+            # "spawn" everywhere: forking a process that runs GUI threads is unsafe
+            _pool = ProcessPoolExecutor(workers, mp_context=get_context("spawn"))
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown():
+    """Stop the worker processes (they are started again on the next big input)."""
+    with _pool_lock:
+        _shutdown()
+
+
+def _shutdown():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+# ===========================
+# WORKER SIDE
+# ===========================
+
+def _chunk_parser(key):
+    """Parser for one piece; whole-input checks were already done by the caller."""
+    source = key[0]
+    if source == "text":
+        return backend._PARSER_OVERRIDES.get(key, backend._text_codes)
+    if source == "binary" and key not in backend._PARSER_OVERRIDES:
+        return backend._parse_binary_groups
+    return backend._PARSER_OVERRIDES.get(key, backend._PARSERS[source])
+
+
+def _to_shared(data):
+    shm = SharedMemory(create=True, size=max(len(data), 1))
+    shm.buf[:len(data)] = data
+    name = shm.name
+    shm.close()
+    return name
+
+
+def _convert_chunk(in_name, start, end, key):
+    """Convert input bytes [start, end) of the shared block. Returns (kind, shm name, size, target)."""
+    shm = SharedMemory(name=in_name)
+    try:
+        text = bytes(shm.buf[start:end]).decode("utf-8", "surrogatepass")
+    finally:
+        shm.close()
+
+    fmt = backend._FORMATTER_OVERRIDES.get(key, backend._FORMATTERS[key[1]])
+    out = fmt(_chunk_parser(key)(text))
+
+    if isinstance(out, str):
+        kind, data = "str", out.encode("utf-8", "surrogatepass")
+    elif isinstance(out._values, array):
+        kind, data = "u32", out._values.tobytes()   # the packed values as they are
+    else:   # a value that doesn't fit 32 bits
+        kind, data = "ints", " ".join(map(str, out._values)).encode("ascii")
+    return kind, _to_shared(data), len(data), key[1]
+
+
+# ===========================
+# CALLER SIDE
+# ===========================
+
+def _read_result(kind, name, size, target):
+    shm = SharedMemory(name=name)
+    try:
+        data = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+        shm.unlink()
+
+    if kind == "str":
+        return data.decode("utf-8", "surrogatepass")
+    if kind == "u32":
+        values = array("I")
+        values.frombytes(data)
+    else:
+        values = list(map(int, data.decode("ascii").split())) if data else []
+    return backend.CodeList(values, target)
+
+
+def _cut_points(data, pieces, text_source):
+    """Byte offsets that split data into about `pieces` safe parts."""
+    step = max(len(data) // pieces, 1)
+    cuts = [0]
+    while cuts[-1] + step < len(data):
+        pos = cuts[-1] + step
+        if text_source:
+            while pos < len(data) and data[pos] & 0xC0 == 0x80:   # UTF-8 continuation byte
+                pos += 1
+        else:
+            found = _WHITESPACE_BYTE.search(data, pos)
+            pos = found.start() if found else len(data)
+        if pos >= len(data):
+            break
+        cuts.append(pos)
+    cuts.append(len(data))
+    return cuts
+
+
+def _prepare(user, key):
+    """The whole-input part of parsing (raises like the serial parser would)."""
+    if key[0] == "text" and key not in backend._PARSER_OVERRIDES:
+        return backend._prepare_text(user)
+    if key[0] == "binary" and key not in backend._PARSER_OVERRIDES:
+        return backend._check_binary_shape(user)
+    return user
+
+
+def _discard(futures):
+    """Cancel what hasn't started; free the output of what already ran."""
+    for future in futures:
+        if not future.cancel():
+            try:
+                _read_result(*future.result())
+            except Exception:
+                pass
+
+
+def convert(func, user, progress=None, workers=None, min_size=None):
+    """
+    Same as func(user, progress) for one of the backend mode functions,
+    but converts big inputs on several cores. progress(done, total) is
+    called as pieces finish (done/total count input bytes).
+    """
+    key = _KEYS.get(func)
+    workers = workers or worker_count()
+    if min_size is None:
+        min_size = PARALLEL_MIN_SIZE
+    if (key is None or workers < 2 or not isinstance(user, str)
+            or len(user) < min_size or user.isspace()
+            or key[0] in backend._UNSPLIT_SOURCES):
+        return func(user, progress)
+
+    try:
+        prepared = _prepare(user, key)
+    except backend._InputError:
+        return func(user, progress)   # serial path reports the error
+
+    data = prepared.encode("utf-8", "surrogatepass")
+    cuts = _cut_points(data, workers * CHUNKS_PER_WORKER, key[0] == "text")
+
+    shm = SharedMemory(create=True, size=max(len(data), 1))
+    futures = []
+    try:
+        shm.buf[:len(data)] = data
+        pool = _get_pool(workers)
+        futures = [pool.submit(_convert_chunk, shm.name, a, b, key) for a, b in zip(cuts, cuts[1:])]
+
+        if progress is not None:
+            progress(0, len(data))
+        parts = []
+        for i, future in enumerate(futures):
+            try:
+                parts.append(_read_result(*future.result()))
+            except Exception:
+                # a bad piece: let the serial function produce the exact error
+                _discard(futures[i + 1:])
+                futures = []
+                return func(user, progress)
+            if progress is not None:
+                progress(cuts[i + 1], len(data))
+        futures = []
+    finally:
+        _discard(futures)   # only left over when cancelled
+        shm.close()
+        shm.unlink()
+
+    fmt = backend._FORMATTER_OVERRIDES.get(key, backend._FORMATTERS[key[1]])
+    return backend._JOIN_BLOCKS.get(fmt, backend._join_lists)(parts)
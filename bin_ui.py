@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'BIN UI.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1262, 687)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.pushButton = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton.setGeometry(QtCore.QRect(740, 560, 131, 31))
+        self.pushButton.setStyleSheet("QPushButton {\n"
+"    background-color: #ff69b4;       /* Main pink color */\n"
+"    color: white;\n"
+"    font-family: \"Times New Roman\";\n"
+"    font-size: 11pt;\n"
+"    font-weight: bold;\n"
+"    border: none;\n"
+"    border-radius: 10px;\n"
+"    padding: 6px 12px;\n"
+"\n"
+"    /* Black shadow effect */\n"
+"    border-bottom: 3px solid black;   /* gives a dark depth illusion */\n"
+"    border-right: 2px solid black;    /* subtle side shadow */\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background-color: #ff85c1;        /* lighter on hover */\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"    background-color: #e75480;        /* darker pink when pressed */\n"
+"    border-bottom: 1px solid #000000; /* smaller shadow when pressed */\n"
+"    border-right: 1px solid #000000;\n"
+"    margin-top: 2px;                  /* moves down slightly for realism */\n"
+"}\n"
+"")
+        self.pushButton.setObjectName("pushButton")
+        self.comboBox = QtWidgets.QComboBox(self.centralwidget)
+        self.comboBox.setGeometry(QtCore.QRect(400, 80, 581, 41))
+        self.comboBox.setStyleSheet("QComboBox {\n"
+"    background-color: #ffffff;\n"
+"    color: #000000;\n"
+"    font-family: \"Times New Roman\";\n"
+"    font-size: 11pt;\n"
+"    border: 2px solid #ff69b4;\n"
+"    border-radius: 15px;\n"
+"    padding: 6px;\n"
+"}\n"
+"\n"
+"QComboBox:focus {\n"
+"    border: 2px solid #e75480;\n"
+"    background-color: #fff5fa;\n"
+"}\n"
+"")
+        self.comboBox.setObjectName("comboBox")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.textEdit = QtWidgets.QTextEdit(self.centralwidget)
+        self.textEdit.setGeometry(QtCore.QRect(400, 170, 811, 131))
+        self.textEdit.setStyleSheet("QTextEdit {\n"
+"    background-color: #ffffff;\n"
+"    color: #000000;\n"
+"    font-family: \"Times New Roman\";\n"
+"    font-size: 11pt;\n"
+"    border: 2px solid #ff69b4;\n"
+"    border-radius: 15px;\n"
+"    padding: 6px;\n"
+"}\n"
+"\n"
+"QTextEdit:focus {\n"
+"    border: 2px solid #e75480;\n"
+"    background-color: #fff5fa;\n"
+"}\n"
+"")
+        self.textEdit.setObjectName("textEdit")
+        self.pushButton_2 = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_2.setGeometry(QtCore.QRect(760, 600, 91, 31))
+        self.pushButton_2.setStyleSheet("QPushButton {\n"
+"    background-color: #ff69b4;       /* Main pink color */\n"
+"    color: white;\n"
+"    font-family: \"Times New Roman\";\n"
+"    font-size: 11pt;\n"
+"    font-weight: bold;\n"
+"    border: none;\n"
+"    border-radius: 10px;\n"
+"    padding: 6px 12px;\n"
+"\n"
+"    /* Black shadow effect */\n"
+"    border-bottom: 3px solid black;   /* gives a dark depth illusion */\n"
+"    border-right: 2px solid black;    /* subtle side shadow */\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background-color: #ff85c1;        /* lighter on hover */\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"    background-color: #e75480;        /* darker pink when pressed */\n"
+"    border-bottom: 1px solid #000000; /* smaller shadow when pressed */\n"
+"    border-right: 1px solid #000000;\n"
+"    margin-top: 2px;                  /* moves down slightly for realism */\n"
+"}\n"
+"")
+        self.pushButton_2.setObjectName("pushButton_2")
+        self.label = QtWidgets.QLabel(self.centralwidget)
+        self.label.setGeometry(QtCore.QRect(100, 240, 191, 71))
+        self.label.setStyleSheet("color: rgb(255, 70, 166);\n"
+"\n"
+"font: 15pt \"Times New Roman\";")
+        self.label.setObjectName("label")
+        self.label_2 = QtWidgets.QLabel(self.centralwidget)
+        self.label_2.setGeometry(QtCore.QRect(400, 50, 231, 31))
+        self.label_2.setStyleSheet("color: rgb(255, 70, 166);\n"
+"\n"
+"font: 13pt \"Times New Roman\";")
+        self.label_2.setObjectName("label_2")
+        self.label_3 = QtWidgets.QLabel(self.centralwidget)
+        self.label_3.setGeometry(QtCore.QRect(400, 130, 231, 31))
+        self.label_3.setStyleSheet("color: rgb(255, 70, 166);\n"
+"\n"
+"font: 13pt \"Times New Roman\";\n"
+"")
+        self.label_3.setObjectName("label_3")
+        self.label_4 = QtWidgets.QLabel(self.centralwidget)
+        self.label_4.setGeometry(QtCore.QRect(400, 360, 231, 31))
+        self.label_4.setStyleSheet("color: rgb(255, 70, 166);\n"
+"\n"
+"font: 13pt \"Times New Roman\";")
+        self.label_4.setObjectName("label_4")
+        self.textBrowser = QtWidgets.QTextBrowser(self.centralwidget)
+        self.textBrowser.setGeometry(QtCore.QRect(400, 390, 811, 131))
+        self.textBrowser.setStyleSheet("QTextBrowser {\n"
+"    background-color: #ffffff;\n"
+"    color: #000000;\n"
+"    font-family: \"Times New Roman\";\n"
+"    font-size: 11pt;\n"
+"    border: 2px solid #ff69b4;\n"
+"    border-radius: 15px;\n"
+"    padding: 6px;\n"
+"}\n"
+"\n"
+"QTextBrowser:focus {\n"
+"    border: 2px solid #e75480;\n"
+"    background-color: #fff5fa;\n"
+"}\n"
+"")
+        self.textBrowser.setObjectName("textBrowser")
+        self.label_5 = QtWidgets.QLabel(self.centralwidget)
+        self.label_5.setGeometry(QtCore.QRect(50, 190, 301, 71))
+        self.label_5.setStyleSheet("color: rgb(255, 70, 166);\n"
+"\n"
+"font: 35pt \"Times New Roman\";")
+        self.label_5.setObjectName("label_5")
+        self.pushButton_3 = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_3.setGeometry(QtCore.QRect(1070, 540, 131, 31))
+        self.pushButton_3.setStyleSheet("QPushButton {\n"
+"    background-color: #ff69b4;       /* Main pink color */\n"
+"    color: white;\n"
+"    font-family: \"Times New Roman\";\n"
+"    font-size: 11pt;\n"
+"    font-weight: bold;\n"
+"    border: none;\n"
+"    border-radius: 10px;\n"
+"    padding: 6px 12px;\n"
+"\n"
+"    /* Black shadow effect */\n"
+"    border-bottom: 3px solid black;   /* gives a dark depth illusion */\n"
+"    border-right: 2px solid black;    /* subtle side shadow */\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background-color: #ff85c1;        /* lighter on hover */\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"    background-color: #e75480;        /* darker pink when pressed */\n"
+"    border-bottom: 1px solid #000000; /* smaller shadow when pressed */\n"
+"    border-right: 1px solid #000000;\n"
+"    margin-top: 2px;                  /* moves down slightly for realism */\n"
+"}\n"
+"")
+        self.pushButton_3.setObjectName("pushButton_3")
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1262, 26))
+        self.menubar.setObjectName("menubar")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.pushButton.setText(_translate("MainWindow", "Translate"))
+        self.comboBox.setItemText(0, _translate("MainWindow", "Select"))
+        self.comboBox.setItemText(1, _translate("MainWindow", "Text - Unicode/ASCII"))
+        self.comboBox.setItemText(2, _translate("MainWindow", "Text - Binary"))
+        self.comboBox.setItemText(3, _translate("MainWindow", "Text - Octal"))
+        self.comboBox.setItemText(4, _translate("MainWindow", "Text - Hexadecimal"))
+        self.comboBox.setItemText(5, _translate("MainWindow", "Binary (ASCII Bytes) - Text"))
+        self.comboBox.setItemText(6, _translate("MainWindow", "Binary (ASCII Bytes) - Unicode/ASCII"))
+        self.comboBox.setItemText(7, _translate("MainWindow", "Binary (ASCII Bytes) - Octal"))
+        self.comboBox.setItemText(8, _translate("MainWindow", "Binary (ASCII Bytes) - Hexadecimal"))
+        self.comboBox.setItemText(9, _translate("MainWindow", "Unicode/ASCII - Text"))
+        self.comboBox.setItemText(10, _translate("MainWindow", "Unicode/ASCII -Binary"))
+        self.comboBox.setItemText(11, _translate("MainWindow", "Unicode/ASCII - Hexadecimal"))
+        self.comboBox.setItemText(12, _translate("MainWindow", "Unicode/ASCII - Octal"))
+        self.comboBox.setItemText(13, _translate("MainWindow", "Octal - Text"))
+        self.comboBox.setItemText(14, _translate("MainWindow", "Octal - Binary"))
+        self.comboBox.setItemText(15, _translate("MainWindow", "Octal - Unicode/ASCII"))
+        self.comboBox.setItemText(16, _translate("MainWindow", "Octal - Hexadecimal"))
+        self.comboBox.setItemText(17, _translate("MainWindow", "Hexadecimal - Text"))
+        self.comboBox.setItemText(18, _translate("MainWindow", "Hexadecimal - Binary"))
+        self.comboBox.setItemText(19, _translate("MainWindow", "Hexadecimal - Unicode/ASCII"))
+        self.comboBox.setItemText(20, _translate("MainWindow", "Hexadecimal - Octal"))
+        self.comboBox.setItemText(21, _translate("MainWindow", "Text - UTF-8 Hexadecimal"))
+        self.comboBox.setItemText(22, _translate("MainWindow", "UTF-8 Hexadecimal - Text"))
+        self.comboBox.setItemText(23, _translate("MainWindow", "Text - UTF-8 Binary"))
+        self.comboBox.setItemText(24, _translate("MainWindow", "UTF-8 Binary - Text"))
+        self.comboBox.setItemText(25, _translate("MainWindow", "Text - UTF-16LE Hexadecimal"))
+        self.comboBox.setItemText(26, _translate("MainWindow", "UTF-16LE Hexadecimal - Text"))
+        self.comboBox.setItemText(27, _translate("MainWindow", "Text - UTF-16LE Binary"))
+        self.comboBox.setItemText(28, _translate("MainWindow", "UTF-16LE Binary - Text"))
+        self.comboBox.setItemText(29, _translate("MainWindow", "Text - UTF-16BE Hexadecimal"))
+        self.comboBox.setItemText(30, _translate("MainWindow", "UTF-16BE Hexadecimal - Text"))
+        self.comboBox.setItemText(31, _translate("MainWindow", "Text - UTF-16BE Binary"))
+        self.comboBox.setItemText(32, _translate("MainWindow", "UTF-16BE Binary - Text"))
+        self.comboBox.setItemText(33, _translate("MainWindow", "Text - UTF-32BE Hexadecimal"))
+        self.comboBox.setItemText(34, _translate("MainWindow", "UTF-32BE Hexadecimal - Text"))
+        self.comboBox.setItemText(35, _translate("MainWindow", "Text - UTF-32BE Binary"))
+        self.comboBox.setItemText(36, _translate("MainWindow", "UTF-32BE Binary - Text"))
+        self.comboBox.setItemText(37, _translate("MainWindow", "Binary Number - Octal Number"))
+        self.comboBox.setItemText(38, _translate("MainWindow", "Binary Number - Decimal Number"))
+        self.comboBox.setItemText(39, _translate("MainWindow", "Binary Number - Hexadecimal Number"))
+        self.comboBox.setItemText(40, _translate("MainWindow", "Octal Number - Binary Number"))
+        self.comboBox.setItemText(41, _translate("MainWindow", "Octal Number - Decimal Number"))
+        self.comboBox.setItemText(42, _translate("MainWindow", "Octal Number - Hexadecimal Number"))
+        self.comboBox.setItemText(43, _translate("MainWindow", "Decimal Number - Binary Number"))
+        self.comboBox.setItemText(44, _translate("MainWindow", "Decimal Number - Octal Number"))
+        self.comboBox.setItemText(45, _translate("MainWindow", "Decimal Number - Hexadecimal Number"))
+        self.comboBox.setItemText(46, _translate("MainWindow", "Hexadecimal Number - Binary Number"))
+        self.comboBox.setItemText(47, _translate("MainWindow", "Hexadecimal Number - Octal Number"))
+        self.comboBox.setItemText(48, _translate("MainWindow", "Hexadecimal Number - Decimal Number"))
+        self.comboBox.setItemText(49, _translate("MainWindow", "Auto - Text"))
+        self.comboBox.setItemText(50, _translate("MainWindow", "Auto - Unicode/ASCII"))
+        self.comboBox.setItemText(51, _translate("MainWindow", "Auto - Binary"))
+        self.comboBox.setItemText(52, _translate("MainWindow", "Auto - Octal"))
+        self.comboBox.setItemText(53, _translate("MainWindow", "Auto - Hexadecimal"))
+        self.pushButton_2.setText(_translate("MainWindow", "Reset"))
+        self.label.setText(_translate("MainWindow", "Binary Translator"))
+        self.label_2.setText(_translate("MainWindow", "Mode of Translation"))
+        self.label_3.setText(_translate("MainWindow", "Input"))
+        self.label_4.setText(_translate("MainWindow", "Translated Output"))
+        self.label_5.setText(_translate("MainWindow", "BINLATOR"))
+        self.pushButton_3.setText(_translate("MainWindow", "Copy Output"))
+
+
+# Hash of the .ui this module was generated from (see build_ui.py)
+UI_SOURCE_HASH = "4f931547422c7326d402f6919b15ebdf34dbbb9a"
@@ -0,0 +1,349 @@
+# ==========================================================
+# BINLATOR Command Line (no GUI)
+# ==========================================================
+# Runs any dropdown mode from a shell, using only backend.py (no PyQt5).
+#
+#   echo Hi | python -m binlator "Text - Binary"
+#   python -m binlator hex_to_text dump1.txt dump2.txt -o decoded/
+#   python -m binlator --list
+#   python -m binlator text_to_hex --raw firmware.bin
+#   python -m binlator binary_to_text --mmap capture.txt -o decoded/
+#   python -m binlator binary_to_text --normalize pasted_dump.txt
+#   python -m binlator "Auto - Text" dumps/*.txt -o decoded/
+#
+# Input is streamed, so big files don't have to fit in memory. With --raw,
+# files are read and written as bytes instead (see "BYTES MODES" in
+# backend.py): a binary file goes in byte for byte, and Hex/Binary/... →
+# Text writes raw bytes back out. --mmap does the same file to file on all
+# cores (see backend_mmap.py), without the trailing newline. --normalize
+# regroups binary/octal digits and tidies decimal codes first, like the GUI
+# does (see "INPUT NORMALIZER" in backend.py). "Auto - <Target>" modes pick
+# the source of every input from its first few KB (backend.detect_format)
+# and skip inputs that already look like the target.
+#
+# With -o, each output is named after its input (inputs from different
+# directories that share a name keep those directories) and only appears
+# once its input converted without errors.
+#
+# Conversion errors name the place of the bad token as file:line:column.
+# Exit status: 0 when every input was converted, 1 when any input failed,
+# 3 when none failed but an "Auto - <Target>" mode skipped some (2 is a
+# usage error).
+# BINLATOR_PROFILE=cprofile or =sample profiles a run (see binlator_profile.py).
+
+import argparse
+import contextlib
+import os
+import re
+import sys
+import time
+
+import backend
+import binlator_profile
+
+EXIT_FAILED = 1    # some input could not be converted
+EXIT_SKIPPED = 3   # nothing failed, but an "Auto - ..." mode skipped some input
+
+
+def find_mode(name, modes=None):
+    """
+    Dropdown name ('Text - Binary') or function name ('text_to_binary') ->
+    stream function (or the matching entry of `modes`, e.g. BYTES_MODES).
+    """
+    if modes is None:
+        modes = backend.STREAM_MODES
+    func = modes.get(backend.normalize_mode(name))
+    if func is not None:
+        return func
+    for mode, fn in backend.MODES.items():
+        if fn.__name__ == name:
+            return modes[mode]
+    return None
+
+
+def convert_file(stream, src, dst):
+    """Stream one input file object into one output file object. Returns (chars in, chars out)."""
+    counted = _CountingReader(src)
+    written = 0
+    for chunk in stream(counted):
+        dst.write(chunk)
+        written += len(chunk)
+    dst.write("\n")
+    return counted.count, written + 1
+
+
+class _CountingReader:
+    """Wraps a file object and counts the characters read from it."""
+
+    def __init__(self, f):
+        self._f = f
+        self.count = 0
+
+    def read(self, size=-1):
+        chunk = self._f.read(size)
+        self.count += len(chunk)
+        return chunk
+
+
+def convert_raw(convert, src, dst):
+    """Bytes version of convert_file(): whole binary file in, bytes out."""
+    data = src.read()
+    out = bytearray()
+    convert(data, out)
+    out += b"\n"
+    dst.write(out)
+    return len(data), len(out)
+
+
+def _output_paths(out_dir, paths):
+    """
+    Input path ('-' = stdin) -> its output file in out_dir. Outputs are
+    named after their input; when inputs from different directories share
+    a name, each keeps its path below the inputs' common directory instead
+    (a/x.txt, b/x.txt -> out_dir/a/x.txt, out_dir/b/x.txt).
+    Raises ValueError when such inputs have no common directory.
+    """
+    full = {path: os.path.abspath("stdin.txt" if path == "-" else path) for path in paths}
+    inputs = set(full.values())
+    if len({os.path.basename(name) for name in inputs}) == len(inputs):
+        return {path: os.path.join(out_dir, os.path.basename(name)) for path, name in full.items()}
+    try:
+        root = os.path.commonpath([os.path.dirname(name) for name in inputs])
+    except ValueError:   # different drives
+        raise ValueError("inputs with the same name on different drives") from None
+    return {path: os.path.join(out_dir, os.path.relpath(name, root)) for path, name in full.items()}
+
+
+@contextlib.contextmanager
+def _replacing(out_path):
+    """
+    Gives the path to write out_path's content to (out_path + '.part') and
+    renames that file to out_path when the block finishes, so a failed
+    conversion leaves no half-written output (and an older output of the
+    same name stays as it was).
+    """
+    part = out_path + ".part"
+    try:
+        yield part
+        os.replace(part, out_path)
+    except BaseException:
+        if os.path.exists(part):
+            os.remove(part)
+        raise
+
+
+def _convert_path(path, out_path, stream, convert, args):
+    """Open one input ('-' = stdin) and its output (None = stdout), then run convert()."""
+    stdin = sys.stdin.buffer if args.raw else sys.stdin
+    if path == "-":
+        src = stdin
+    elif args.raw:
+        src = open(path, "rb")
+    else:
+        src = open(path, encoding=args.encoding)
+
+    try:
+        if out_path is not None:
+            with _replacing(out_path) as part:
+                if args.raw:
+                    dst = open(part, "wb")
+                else:
+                    dst = open(part, "w", encoding=args.encoding)
+                with dst:
+                    return convert(stream, src, dst)
+        return convert(stream, src, sys.stdout.buffer if args.raw else sys.stdout)
+    finally:
+        if src is not stdin:
+            src.close()
+
+
+def _mode_stream(func, args):
+    """What runs `func` on one input with these options (see convert_file/convert_raw)."""
+    if args.mmap:
+        return func   # backend_mmap takes the plain mode function
+    stream = find_mode(func.__name__, backend.BYTES_MODES if args.raw else None)
+    if args.normalize:
+        return lambda src: stream(backend.normalize_stream(func, src))
+    return stream
+
+
+def _sample(path, args):
+    """The first DETECT_SAMPLE characters of an input, without using up stdin."""
+    if path == "-":
+        data = sys.stdin.buffer.peek(backend.DETECT_SAMPLE)[:backend.DETECT_SAMPLE]
+    else:
+        with open(path, "rb") as f:
+            data = f.read(backend.DETECT_SAMPLE)
+    return data if args.raw else data.decode(args.encoding, "ignore")
+
+
+_LAST_SPACE = re.compile(r"\s\S*\Z")
+_LONGEST_TOKEN = 64 * backend.STREAM_CHUNK_SIZE   # give up on finding a place past this
+
+
+def _token_windows(f):
+    """
+    (text, offset, line, column) windows of about STREAM_CHUNK_SIZE
+    characters from a file, each cut after whitespace so no token is split;
+    offset, line and column are where the window starts. Stops (ValueError)
+    at a token longer than _LONGEST_TOKEN, so memory stays bounded.
+    """
+    offset, line, column, rest = 0, 1, 1, ""
+    while True:
+        chunk = f.read(backend.STREAM_CHUNK_SIZE)
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode("latin-1")
+        if not chunk:
+            if rest:
+                yield rest, offset, line, column
+            return
+        found = _LAST_SPACE.search(chunk)   # (rest has no whitespace)
+        if found is None:
+            rest += chunk
+            if len(rest) > _LONGEST_TOKEN:
+                raise ValueError("token too long to look up")
+            continue
+        text, rest = rest + chunk[:found.start() + 1], chunk[found.start() + 1:]
+        yield text, offset, line, column
+        offset += len(text)
+        newlines = text.count("\n")
+        line += newlines
+        column = len(text) - text.rfind("\n") if newlines else column + len(text)
+
+
+def _find_in_file(path, error, args, func):
+    """BadToken (positions in the whole file) for the error, looked up window by window."""
+    mode = "rb" if args.raw else "r"
+    with open(path, mode, encoding=None if args.raw else args.encoding) as f:
+        for text, offset, line, column in _token_windows(f):
+            bad = backend.check_input(func, text)
+            if bad is not None and bad.message == str(error):
+                bad.offset += offset
+                if bad.line == 1:
+                    bad.column += column - 1
+                bad.line += line - 1
+                return bad
+    return None
+
+
+def _error_place(path, error, args, func):
+    """'path:line:column: ...' of the bad token behind a ConversionError, or just path."""
+    bad = error.location
+    if bad is None and path != "-" and not args.normalize:   # (no positions in a cleaned-up copy)
+        # Streams don't keep input positions: look the error up in the file
+        # again (one fast scan, only on failure), a window at a time, so the
+        # file never has to fit in memory. Only trusted when it finds the
+        # same error the conversion stopped at.
+        try:
+            bad = _find_in_file(path, error, args, func)
+        except (OSError, ValueError):   # (UnicodeDecodeError is a ValueError)
+            return path
+    if bad is None:
+        return path
+    token = bad.token if len(bad.token) <= 40 else bad.token[:40] + "..."
+    return f"{path}:{bad.line}:{bad.column}: {token!r}"
+
+
+@binlator_profile.profiled
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="binlator",
+        description="Convert text/binary/decimal/octal/hex without the GUI.",
+        epilog=f"exit status: 0 all inputs converted, {EXIT_FAILED} some input failed, "
+               f"{EXIT_SKIPPED} none failed but some were skipped by an Auto mode, 2 usage error",
+    )
+    parser.add_argument("mode", nargs="?", help='mode name, e.g. "Text - Binary" or text_to_binary')
+    parser.add_argument("files", nargs="*", help="input files (default: read stdin)")
+    parser.add_argument("-o", "--output-dir", help="write one output file per input here instead of stdout")
+    parser.add_argument("--encoding", default="utf-8", help="encoding of input and output files (default: utf-8)")
+    parser.add_argument("--raw", action="store_true", help="read and write files as raw bytes (not streamed)")
+    parser.add_argument("--mmap", action="store_true",
+                        help="file to file with mmap and all cores, like --raw (needs -o and input files)")
+    parser.add_argument("--normalize", action="store_true",
+                        help="regroup binary/octal digits and tidy decimal codes first (streamed input only)")
+    parser.add_argument("--stats", action="store_true", help="print throughput to stderr when done")
+    parser.add_argument("--list", action="store_true", help="list available modes and exit")
+    args = parser.parse_intermixed_args(argv)  # options may sit between mode and files
+
+    if args.list:
+        for mode, fn in backend.MODES.items():
+            print(f"{mode:40} {fn.__name__}")
+        for mode in backend.AUTO_MODES:
+            print(f"{mode:40} (source detected per input)")
+        return 0
+
+    if not args.mode:
+        parser.error("a mode is required (see --list)")
+    auto_target = backend.AUTO_MODES.get(backend.normalize_mode(args.mode))
+    func = find_mode(args.mode, backend.MODES)
+    if func is None and auto_target is None:
+        parser.error(f"unknown mode: {args.mode!r} (see --list)")
+    if args.mmap:
+        if not (args.output_dir and args.files):
+            parser.error("--mmap needs input files and -o")
+        import backend_mmap  # only needed here
+        args.raw = True
+    if args.normalize and args.raw:
+        parser.error("--normalize can't be used with --raw or --mmap")
+    convert = convert_raw if args.raw else convert_file
+
+    jobs = args.files or ["-"]
+    out_paths = {}
+    if args.output_dir:
+        try:
+            out_paths = _output_paths(args.output_dir, jobs)
+        except ValueError as e:
+            parser.error(f"can't name the outputs in {args.output_dir!r}: {e}")
+        for out_path in set(out_paths.values()):
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    total_in = total_out = 0
+    failed = skipped = 0
+    started = time.perf_counter()
+
+    for path in jobs:
+        try:
+            if auto_target is not None:
+                func, found = backend.auto_mode(auto_target, _sample(path, args))
+                if func is None:
+                    print(f"binlator: {path}: skipped, it already looks like {found.label}", file=sys.stderr)
+                    skipped += 1
+                    continue
+            stream = _mode_stream(func, args)
+            if args.mmap:
+                n_in = os.path.getsize(path)
+                with _replacing(out_paths[path]) as part:
+                    n_out = backend_mmap.convert_file(stream, path, part)
+            else:
+                n_in, n_out = _convert_path(path, out_paths.get(path), stream, convert, args)
+        except backend.ConversionError as e:
+            print(f"binlator: {_error_place(path, e, args, func)}: {e}", file=sys.stderr)
+            failed += 1
+            continue
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"binlator: {path}: {e}", file=sys.stderr)
+            failed += 1
+            continue
+
+        total_in += n_in
+        total_out += n_out
+
+    sys.stdout.flush()
+    if args.stats:
+        elapsed = time.perf_counter() - started
+        rate = total_in / elapsed / 1e6 if elapsed > 0 else 0.0
+        unit = "bytes" if args.raw else "chars"
+        print(
+            f"binlator: {len(jobs) - failed - skipped}/{len(jobs)} inputs"
+            f"{f' ({skipped} skipped)' if skipped else ''}, "
+            f"{total_in:,} {unit} in, {total_out:,} {unit} out, "
+            f"{elapsed:.3f} s, {rate:.2f} M {unit}/s",
+            file=sys.stderr,
+        )
+    if failed:
+        return EXIT_FAILED
+    return EXIT_SKIPPED if skipped else 0
+
+
+if __name__ == "__main__":
+    binlator_profile.start_session("cli")
+    sys.exit(main())
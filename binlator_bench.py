@@ -0,0 +1,398 @@
+# ==========================================================
+# BINLATOR benchmarks
+# ==========================================================
+# Times every mode over representative inputs, so changes to backend.py
+# can be judged by numbers instead of feel:
+#
+#   python -m binlator_bench run -o baseline.json          # measure, save
+#   python -m binlator_bench compare baseline.json         # measure again, flag regressions
+#   python -m binlator_bench compare old.json new.json --tolerance 0.05
+#   python -m binlator_bench scaling --sizes 1K,1M,100M    # fail on worse-than-linear growth
+#
+# Every mode runs on the corpora that fit its source base (ASCII, Latin-1
+# and emoji/non-BMP text; binary, decimal, octal and hex dumps; the same
+# dumps with messy whitespace; UTF-x byte dumps of the ASCII and emoji
+# text; the dumps read as one whole number) at several sizes. For each case we record
+# throughput (MB/s of UTF-8 input), per-call latency (best of --repeat
+# rounds) and peak memory of one call (tracemalloc). The results are JSON:
+# {"meta": {...}, "results": {"text_to_hex/ascii/64K": {...}, ...}}.
+#
+# compare exits with status 1 when a case got slower (or uses more memory)
+# by more than the tolerance; scaling exits with 1 when the time per byte
+# of any mode grows by more than --limit between two sizes.
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import backend
+
+DEFAULT_SIZES = "1K,64K,1M"
+SCALING_SIZES = "1K,1M,100M"
+MIN_ROUND_TIME = 0.05   # seconds; small inputs are called in a loop for at least this long
+DEFAULT_TOLERANCE = 0.10
+DEFAULT_SCALING_LIMIT = 2.0
+
+# Whole-number decimal conversion is about n**1.6 by design (Karatsuba), so
+# its time per byte may grow by (size ratio)**0.6 on top of the limit. It
+# takes minutes at 100M, so scaling only times it when asked to by name.
+_GROWTH_EXPONENTS = {"decimal_number": 0.6}
+
+_BLOCK_CHARS = 64 * 1024   # corpora repeat one random block of about this size
+_SEED = 2024
+
+
+# ===========================
+# CORPORA
+# ===========================
+
+def _words(rng, alphabet, chars):
+    """Space-separated random words drawn from alphabet, about `chars` long."""
+    words = []
+    total = 0
+    while total < chars:
+        word = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 9)))
+        words.append(word)
+        total += len(word) + 1
+    return " ".join(words)
+
+
+def _messy_spaces(rng, tokens, allowed=" \t\n\r"):
+    """Tokens joined by random runs of whitespace, with some at both ends."""
+    gap = lambda: "".join(rng.choice(allowed) for _ in range(rng.randint(1, 4)))
+    return gap() + "".join(token + gap() for token in tokens)
+
+
+_ASCII = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.,;:!?'-"
+_LATIN1 = _ASCII[:26] + "".join(map(chr, range(0xC0, 0x100)))
+_EMOJI = _ASCII[:26] + "日本語漢字" + "".join(map(chr, range(0x1F600, 0x1F640))) + "𝐀𝐁𝐂𝔸𝔹"
+
+
+def _build_blocks():
+    """(source base, corpus name) -> one block of input."""
+    rng = random.Random(_SEED)
+    ascii_text = _words(rng, _ASCII, _BLOCK_CHARS)
+    latin1_text = _words(rng, _LATIN1, _BLOCK_CHARS)
+    emoji_text = _words(rng, _EMOJI, _BLOCK_CHARS)
+    blocks = {
+        ("text", "ascii"): ascii_text,
+        ("text", "latin1"): latin1_text,
+        ("text", "emoji"): emoji_text,
+        ("text", "whitespace"): _messy_spaces(rng, ascii_text.split(), " \t\n\r\x0b\x0c"),
+    }
+
+    dumps = {
+        "binary": {"dump": backend.text_to_binary(ascii_text).split()},
+        "decimal": {"dump": backend.text_to_unicode(ascii_text),
+                    "emoji": backend.text_to_unicode(emoji_text)},
+        "octal": {"dump": backend.text_to_octal(latin1_text)},
+        "hex": {"dump": backend.text_to_hex(latin1_text),
+                "emoji": backend.text_to_hex(emoji_text)},
+    }
+    for source, corpora in dumps.items():
+        for name, tokens in corpora.items():
+            blocks[(source, name)] = " ".join(map(str, tokens))
+        blocks[(source, "whitespace")] = _messy_spaces(rng, list(map(str, corpora["dump"])))
+
+    for base in backend._ENCODED_BASES:
+        encode = backend._MODE_FUNCS[("text", base)]
+        for name in ("ascii", "emoji"):
+            blocks[(base, name)] = encode(blocks[("text", name)])
+
+    for base in backend._NUMBER_BASES:   # spaces don't matter to whole-number modes
+        blocks[(base, "dump")] = blocks[(base[:-len("_number")], "dump")]
+    return blocks
+
+
+_blocks = None
+
+
+def _get_blocks():
+    global _blocks
+    if _blocks is None:
+        _blocks = _build_blocks()
+    return _blocks
+
+
+def corpus(source, name, size):
+    """Input of about `size` characters, cut after a whole token/word."""
+    block = _get_blocks()[(source, name)]
+    if source in backend._ENCODED_BASES:
+        # encode a shorter text corpus, so no character's bytes are cut apart
+        chars = size * len(_get_blocks()[("text", name)]) // len(block)
+        return backend._MODE_FUNCS[("text", source)](corpus("text", name, chars))
+    text = (block + " ") * (size // (len(block) + 1) + 1)
+    cut = text.rfind(" ", 0, size + 1)
+    return text[:cut if cut > 0 else size]
+
+
+def corpus_names(source):
+    return [name for src, name in _get_blocks() if src == source]
+
+
+# ===========================
+# MEASURING
+# ===========================
+
+def parse_size(text):
+    """'64K' -> 65536, '1M' -> 1048576, '500' -> 500."""
+    text = text.strip().upper()
+    scale = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}.get(text[-1:], 1)
+    return int(float(text.rstrip("KMG")) * scale)
+
+
+def size_label(size):
+    for unit, scale in (("G", 1 << 30), ("M", 1 << 20), ("K", 1 << 10)):
+        if size >= scale and size % scale == 0:
+            return f"{size // scale}{unit}"
+    return str(size)
+
+
+def time_call(func, user, repeat):
+    """Best per-call time over `repeat` rounds (each round lasts at least MIN_ROUND_TIME)."""
+    start = time.perf_counter()
+    result = func(user)
+    once = time.perf_counter() - start
+    if isinstance(result, str) and result.startswith("Error:"):
+        raise ValueError(f"{func.__name__} rejects its benchmark input: {result}")
+    loops = max(int(MIN_ROUND_TIME / once) if once > 0 else 1000, 1)
+
+    best = once
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func(user)
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+
+def peak_memory(func, user):
+    """Peak bytes allocated by one call (the input itself not included)."""
+    tracemalloc.start()
+    try:
+        func(user)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(func, user, repeat):
+    latency = time_call(func, user, repeat)
+    size = len(user.encode("utf-8", "surrogatepass"))
+    return {
+        "input_bytes": size,
+        "latency_s": latency,
+        "mb_per_s": size / latency / 1e6 if latency > 0 else 0.0,
+        "peak_bytes": peak_memory(func, user),
+    }
+
+
+def _selected_modes(names):
+    modes = {fn.__name__: (key, fn) for key, fn in backend._MODE_FUNCS.items()}
+    if not names:
+        return modes
+    wanted = {}
+    for name in names:
+        fn = backend.MODES.get(backend.normalize_mode(name))
+        name = fn.__name__ if fn is not None else name
+        if name not in modes:
+            raise SystemExit(f"binlator_bench: unknown mode: {name!r}")
+        wanted[name] = modes[name]
+    return wanted
+
+
+def run_suite(sizes, modes=None, corpora=None, repeat=5, only=None, log=None):
+    """
+    Measure every (mode, corpus, size). `only` limits the run to those
+    result keys (used by compare). Returns the JSON-ready result dict.
+    """
+    results = {}
+    for name, ((source, _), func) in _selected_modes(modes).items():
+        for corpus_name in corpus_names(source):
+            if corpora and corpus_name not in corpora:
+                continue
+            for size in sizes:
+                key = f"{name}/{corpus_name}/{size_label(size)}"
+                if only is not None and key not in only:
+                    continue
+                results[key] = measure(func, corpus(source, corpus_name, size), repeat)
+                if log is not None:
+                    log(key, results[key])
+    return {"meta": _meta(sizes, repeat), "results": results}
+
+
+def _meta(sizes, repeat):
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": numpy_version if backend.USE_NUMPY else None,
+        "sizes": [size_label(s) for s in sizes],
+        "repeat": repeat,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def _print_case(key, row):
+    print(
+        f"{key:42} {row['mb_per_s']:9.2f} MB/s {row['latency_s'] * 1e3:11.3f} ms"
+        f" {row['peak_bytes'] / 1e6:9.2f} MB peak",
+        file=sys.stderr,
+    )
+
+
+# ===========================
+# COMPARING
+# ===========================
+
+def compare(old, new, tolerance=DEFAULT_TOLERANCE, memory_tolerance=None):
+    """
+    Cases that got worse beyond the tolerance, as a list of
+    (key, what, old value, new value, change). Keys missing from either
+    side are skipped.
+    """
+    if memory_tolerance is None:
+        memory_tolerance = tolerance
+    worse = []
+    for key, before in old["results"].items():
+        after = new["results"].get(key)
+        if after is None:
+            continue
+        for what, limit in (("latency_s", tolerance), ("peak_bytes", memory_tolerance)):
+            a, b = before[what], after[what]
+            change = (b - a) / a if a else 0.0
+            if change > limit:
+                worse.append((key, what, a, b, change))
+    return worse
+
+
+def _change_summary(old, new):
+    changes = []
+    for key, before in old["results"].items():
+        after = new["results"].get(key)
+        if after is not None and before["latency_s"]:
+            changes.append(after["latency_s"] / before["latency_s"])
+    if not changes:
+        return "no cases in common"
+    changes.sort()
+    median = changes[len(changes) // 2]
+    return f"{len(changes)} cases, median time ratio {median:.3f} (min {changes[0]:.3f}, max {changes[-1]:.3f})"
+
+
+# ===========================
+# SCALING
+# ===========================
+
+def scaling(sizes, modes=None, limit=DEFAULT_SCALING_LIMIT, repeat=1, log=None):
+    """
+    Time every mode on its main corpus at each size. Returns the modes whose
+    time per byte grew by more than `limit` from one size to the next, as
+    (mode, small size, big size, growth).
+    """
+    failures = []
+    for name, ((source, target), func) in _selected_modes(modes).items():
+        exponent = max(_GROWTH_EXPONENTS.get(source, 0), _GROWTH_EXPONENTS.get(target, 0))
+        if exponent and not modes:
+            continue
+        corpus_name = corpus_names(source)[0]
+        per_byte = []
+        for size in sizes:
+            user = corpus(source, corpus_name, size)
+            seconds = time_call(func, user, repeat)
+            per_byte.append(seconds / len(user))
+            del user
+            if log is not None:
+                log(f"{name}/{corpus_name}/{size_label(size)}", seconds)
+        for (small, a), (big, b) in zip(zip(sizes, per_byte), zip(sizes[1:], per_byte[1:])):
+            if b / a > limit * (big / small) ** exponent:
+                failures.append((name, small, big, b / a))
+    return failures
+
+
+# ===========================
+# COMMAND LINE
+# ===========================
+
+def _sizes(text):
+    return sorted(parse_size(part) for part in text.split(",") if part.strip())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="binlator_bench", description="Benchmark the BINLATOR modes.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="measure and print (or save) the results")
+    run.add_argument("-o", "--output", help="write the results here as JSON")
+    run.add_argument("--sizes", default=DEFAULT_SIZES, help=f"input sizes (default: {DEFAULT_SIZES})")
+
+    cmp = commands.add_parser("compare", help="flag cases that got worse than a baseline")
+    cmp.add_argument("baseline", help="results JSON from an earlier run")
+    cmp.add_argument("current", nargs="?", help="results JSON to check (default: measure now)")
+    cmp.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                     help=f"allowed slowdown, 0.10 = 10%% (default: {DEFAULT_TOLERANCE})")
+    cmp.add_argument("--memory-tolerance", type=float, help="allowed peak memory growth (default: --tolerance)")
+    cmp.add_argument("-o", "--output", help="also save the new measurements here")
+
+    scale = commands.add_parser("scaling", help="fail if time grows faster than the input")
+    scale.add_argument("--sizes", default=SCALING_SIZES, help=f"input sizes (default: {SCALING_SIZES})")
+    scale.add_argument("--limit", type=float, default=DEFAULT_SCALING_LIMIT,
+                       help=f"allowed growth of the time per byte between sizes (default: {DEFAULT_SCALING_LIMIT})")
+
+    for command in (run, cmp, scale):
+        command.add_argument("--modes", nargs="+", help="only these modes (function or dropdown names)")
+        command.add_argument("--repeat", type=int, default=5 if command is not scale else 1,
+                             help="timing rounds per case; the best one counts")
+    for command in (run, cmp):
+        command.add_argument("--corpora", nargs="+", help="only these corpora (e.g. ascii dump whitespace)")
+    args = parser.parse_args(argv)
+
+    if args.command == "scaling":
+        log = lambda key, seconds: print(f"{key:42} {seconds * 1e3:11.3f} ms", file=sys.stderr)
+        failures = scaling(_sizes(args.sizes), args.modes, args.limit, args.repeat, log)
+        for name, small, big, growth in failures:
+            print(f"binlator_bench: {name}: time per byte x{growth:.2f} "
+                  f"from {size_label(small)} to {size_label(big)}")
+        return 1 if failures else 0
+
+    if args.command == "run":
+        results = run_suite(_sizes(args.sizes), args.modes, args.corpora, args.repeat, log=_print_case)
+        text = json.dumps(results, indent=2, sort_keys=True)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        old = json.load(f)
+    if args.current:
+        with open(args.current, encoding="utf-8") as f:
+            new = json.load(f)
+    else:
+        sizes = sorted({parse_size(s) for s in old["meta"]["sizes"]})
+        new = run_suite(sizes, args.modes, args.corpora, args.repeat,
+                        only=set(old["results"]), log=_print_case)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(json.dumps(new, indent=2, sort_keys=True) + "\n")
+
+    worse = compare(old, new, args.tolerance, args.memory_tolerance)
+    for key, what, a, b, change in worse:
+        unit, scale = ("ms", 1e3) if what == "latency_s" else ("MB", 1e-6)
+        label = "slower" if what == "latency_s" else "more memory"
+        print(f"REGRESSION {key:42} {change:+7.1%} {label} ({a * scale:.3f} -> {b * scale:.3f} {unit})")
+    print(f"binlator_bench: {_change_summary(old, new)}; {len(worse)} regression(s)")
+    return 1 if worse else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+# ==========================================================
+# BINLATOR opt-in profiling
+# ==========================================================
+# Off unless the BINLATOR_PROFILE environment variable is set:
+#
+#   BINLATOR_PROFILE=cprofile python "UI TRANS.py"
+#   BINLATOR_PROFILE=sample python -m binlator hex_to_text dump.txt
+#
+# cprofile  Functions wrapped with @profiled (MainWindow.translate, the
+#           translation worker, the CLI's main) run under cProfile. When
+#           the program exits, all their profiles are merged into one
+#           binlator-<program>-<pid>.prof (open with pstats or snakeviz).
+# sample    A background thread records the call stack of every thread
+#           every BINLATOR_PROFILE_INTERVAL ms (default 5). At exit the
+#           counts are written as binlator-<program>-<pid>.folded
+#           ("a;b;c 12" lines, for flamegraph.pl or speedscope).
+#
+# Files go to BINLATOR_PROFILE_DIR (default: the current directory). With
+# the variable unset, profiled() returns the function itself and
+# start_session() does nothing, so there is no cost at all.
+
+import atexit
+import functools
+import os
+import sys
+import threading
+from collections import Counter
+
+PROFILE_ENV = "BINLATOR_PROFILE"
+MODE = os.environ.get(PROFILE_ENV, "").strip().lower()   # "", "cprofile" or "sample"
+
+_profiles = []     # finished cProfile.Profile objects
+_session = None    # program name once start_session() ran
+
+
+def profiled(func):
+    """func, run under cProfile when BINLATOR_PROFILE=cprofile (otherwise func itself)."""
+    if MODE != "cprofile":
+        return func
+    import cProfile
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            _profiles.append(profile)
+
+    return wrapper
+
+
+def _output_path(suffix):
+    folder = os.environ.get("BINLATOR_PROFILE_DIR", ".")
+    return os.path.join(folder, f"binlator-{_session}-{os.getpid()}.{suffix}")
+
+
+def _dump_cprofile():
+    if not _profiles:
+        return
+    import pstats
+    stats = pstats.Stats(_profiles[0])
+    if len(_profiles) > 1:
+        stats.add(*_profiles[1:])
+    path = _output_path("prof")
+    stats.dump_stats(path)
+    print(f"binlator: profile of {len(_profiles)} call(s) written to {path}", file=sys.stderr)
+
+
+class _Sampler(threading.Thread):
+    """Counts the call stacks of all other threads at a fixed interval."""
+
+    def __init__(self, interval):
+        super().__init__(name="binlator-sampler", daemon=True)
+        self.interval = interval
+        self.stacks = Counter()
+        self._done = threading.Event()
+
+    def run(self):
+        me = threading.get_ident()
+        while not self._done.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                names = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(names))] += 1
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+    def dump(self):
+        path = _output_path("folded")
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        total = sum(self.stacks.values())
+        print(f"binlator: {total} stack samples written to {path}", file=sys.stderr)
+
+
+def start_session(program):
+    """Call once at startup: starts sampling (if asked for) and writes the results at exit."""
+    global _session
+    if not MODE or _session is not None:
+        return
+    _session = program
+    if MODE == "cprofile":
+        atexit.register(_dump_cprofile)
+    elif MODE == "sample":
+        interval = float(os.environ.get("BINLATOR_PROFILE_INTERVAL", "5")) / 1000
+        sampler = _Sampler(interval)
+        sampler.start()
+        atexit.register(lambda: (sampler.stop(), sampler.dump()))
+    else:
+        print(f"binlator: unknown {PROFILE_ENV}={MODE!r} (use cprofile or sample)", file=sys.stderr)
@@ -0,0 +1,416 @@
+# ==========================================================
+# BINLATOR HTTP service (localhost)
+# ==========================================================
+# Lets other tools use the conversions over HTTP instead of carrying their
+# own copy of backend.py. Standard library only (asyncio):
+#
+#   python -m binlator_server --port 8765
+#
+#   GET  /modes                      -> list of modes and their paths
+#   POST /convert/text_to_binary     body: the input text
+#   POST /convert/Text%20-%20Binary  (dropdown names work too)
+#   POST /batch                      body: {"requests": [{"mode": ..., "input": ...}, ...]}
+#
+# /convert streams: the body is converted while it is still arriving
+# (Content-Length or chunked) and the output is sent back chunked. An input
+# error found within the first HOLD_OUTPUT bytes of output gives "400" with
+# the usual "Error: ..." text; one found later cuts the connection, so a
+# client never mistakes a partial result for a whole one.
+# /batch errors also carry the offset, line, column and token of the bad
+# token when there is one.
+#
+# Conversions run on a thread pool, so the event loop keeps serving other
+# connections. Connections are kept alive (HTTP/1.1).
+#
+# The threads share one interpreter lock, so CPU-bound conversions don't
+# run side by side. /batch hands items of backend_parallel.PARALLEL_MIN_SIZE
+# characters or more to backend_parallel's process pool, which converts
+# them on all cores; smaller items take less time than shipping them to
+# another process. A /convert stream is converted one chunk at a time as
+# the body arrives and always runs in its thread: concurrent streams share
+# one core. For big single inputs use /batch (or binlator --mmap).
+
+import argparse
+import asyncio
+import codecs
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote
+
+import backend
+import backend_parallel
+import binlator_profile
+from binlator import find_mode
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+READ_SIZE = 64 * 1024             # bytes read from the socket per step
+MAX_HEADER_SIZE = 64 * 1024
+MAX_BATCH_BODY = 64 * 1024 * 1024  # /batch reads its whole body, so cap it
+KEEP_ALIVE_TIMEOUT = 60           # seconds an idle connection stays open
+HOLD_OUTPUT = 64 * 1024           # output bytes held back before committing to "200"
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error",
+}
+
+
+class _BadRequest(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def find_function(name):
+    """Dropdown name or function name -> backend mode function (or None)."""
+    func = backend.MODES.get(backend.normalize_mode(name))
+    if func is not None:
+        return func
+    for func in backend.MODES.values():
+        if func.__name__ == name:
+            return func
+    return None
+
+
+@binlator_profile.profiled
+def run_batch(items):
+    """Convert a list of {"mode": ..., "input": ...}. One result dict per item."""
+    results = []
+    for item in items:
+        if not isinstance(item, dict) or "mode" not in item:
+            results.append({"error": 'Error: Each request needs a "mode" and an "input".'})
+            continue
+        func = find_function(str(item["mode"]))
+        if func is None:
+            results.append({"error": f"Error: Unknown mode {item['mode']!r}."})
+            continue
+        # (big inputs go to the process pool, see the top of this file)
+        output = backend.result_cache.call(func, item.get("input"), run=backend_parallel.convert)
+        if isinstance(output, str) and output.startswith("Error:"):
+            result = {"error": output}
+            bad = backend.check_input(func, item.get("input"))
+            if bad is not None:
+                result.update(offset=bad.offset, line=bad.line, column=bad.column, token=bad.token)
+            results.append(result)
+        else:
+            results.append({"output": output if isinstance(output, str) else output.tolist()})
+    return results
+
+
+# ===========================
+# HTTP plumbing
+# ===========================
+
+class _Request:
+    def __init__(self, reader, method, target, version, headers):
+        self.reader = reader
+        self.method = method
+        self.path = unquote(target.split("?", 1)[0])
+        self.version = version
+        self.headers = headers
+        chunked = "chunked" in headers.get("transfer-encoding", "").lower()
+        self.body_done = not chunked and headers.get("content-length", "0").strip() == "0"
+
+    @property
+    def keep_alive(self):
+        conn = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return conn == "keep-alive"
+        return conn != "close"
+
+    async def body_chunks(self):
+        """Yield the request body as it arrives (Content-Length or chunked)."""
+        reader = self.reader
+        if "chunked" in self.headers.get("transfer-encoding", "").lower():
+            while True:
+                line = await reader.readline()
+                try:
+                    size = int(line.split(b";")[0].strip(), 16)
+                except ValueError:
+                    raise _BadRequest("Error: Bad chunked body.") from None
+                if size == 0:
+                    while (await reader.readline()).strip():
+                        pass  # skip trailers
+                    break
+                data = await reader.readexactly(size)
+                await reader.readexactly(2)  # CRLF after each chunk
+                yield data
+        else:
+            try:
+                remaining = int(self.headers.get("content-length", "0"))
+            except ValueError:
+                raise _BadRequest("Error: Bad Content-Length.") from None
+            while remaining > 0:
+                data = await reader.read(min(remaining, READ_SIZE))
+                if not data:
+                    raise ConnectionError("client went away mid-body")
+                remaining -= len(data)
+                self.body_done = remaining <= 0
+                yield data
+        self.body_done = True
+
+    async def read_body(self, limit):
+        parts = []
+        size = 0
+        async for data in self.body_chunks():
+            size += len(data)
+            if size > limit:
+                raise _BadRequest("Error: Request body too large.", 413)
+            parts.append(data)
+        return b"".join(parts)
+
+
+async def _read_request(reader):
+    """Parse the request line and headers. Returns None when the client closed."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if e.partial.strip():
+            raise _BadRequest("Error: Incomplete request.") from None
+        return None
+    except asyncio.LimitOverrunError:
+        raise _BadRequest("Error: Headers too large.", 413) from None
+
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise _BadRequest("Error: Bad request line.") from None
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    return _Request(reader, method, target, version, headers)
+
+
+class _Response:
+    """Writes one response; the status line goes out with the first data."""
+
+    def __init__(self, writer, keep_alive):
+        self.writer = writer
+        self.keep_alive = keep_alive
+        self.started = False
+        self.held = []        # output not sent yet (see write_chunk)
+        self.held_size = 0
+
+    def _head(self, status, content_type, extra):
+        lines = [f"HTTP/1.1 {status} {_REASONS[status]}", f"Content-Type: {content_type}"]
+        lines += extra
+        lines.append("Connection: " + ("keep-alive" if self.keep_alive else "close"))
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        self.started = True
+
+    async def send(self, status, body, content_type="text/plain; charset=utf-8"):
+        """Whole response at once."""
+        data = body.encode("utf-8")
+        self._head(status, content_type, [f"Content-Length: {len(data)}"])
+        self.writer.write(data)
+        await self.writer.drain()
+
+    async def send_json(self, status, obj):
+        await self.send(status, json.dumps(obj, ensure_ascii=False), "application/json; charset=utf-8")
+
+    async def write_chunk(self, text, drain=True):
+        """
+        One piece of a streamed response. The first HOLD_OUTPUT bytes are
+        held back, so a small request that fails still gets a clean 400.
+        """
+        data = text.encode("utf-8")
+        if not self.started:
+            self.held.append(data)
+            self.held_size += len(data)
+            if self.held_size < HOLD_OUTPUT:
+                return
+            self._head(200, "text/plain; charset=utf-8", ["Transfer-Encoding: chunked"])
+            data = b"".join(self.held)
+            self.held = []
+        if data:
+            self.writer.write(b"%X\r\n%s\r\n" % (len(data), data))
+            if drain:
+                await self.writer.drain()
+
+    async def end_chunks(self):
+        if not self.started:
+            # everything fit in the held part: send it as a normal response
+            data = b"".join(self.held)
+            self._head(200, "text/plain; charset=utf-8", [f"Content-Length: {len(data)}"])
+            self.writer.write(data)
+        else:
+            self.writer.write(b"0\r\n\r\n")
+        await self.writer.drain()
+
+
+# ===========================
+# Server
+# ===========================
+
+class ConversionServer:
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None):
+        self.host = host
+        self.port = port
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix="binlator")
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._serve, self.host, self.port, limit=MAX_HEADER_SIZE)
+        self.port = self.server.sockets[0].getsockname()[1]  # the real one if port=0
+        return self
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _serve(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), KEEP_ALIVE_TIMEOUT)
+                except _BadRequest as e:
+                    await _Response(writer, False).send(e.status, str(e))
+                    break
+                if request is None:
+                    break
+
+                response = _Response(writer, request.keep_alive)
+                try:
+                    await self._dispatch(request, response)
+                except _BadRequest as e:
+                    if response.started:
+                        break
+                    # the connection can only be reused if the body was read to the end
+                    response.keep_alive = response.keep_alive and request.body_done
+                    await response.send(e.status, str(e))
+                    if not response.keep_alive:
+                        break
+                    continue
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception as e:  # a bug here, not a bad request
+                    if not response.started:
+                        response.keep_alive = False
+                        await response.send(500, f"Error: {e}")
+                    break
+                if not (response.keep_alive and request.body_done):
+                    break
+        except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request, response):
+        path, method = request.path, request.method
+
+        if path == "/modes":
+            if method != "GET":
+                raise _BadRequest("Error: Use GET.", 405)
+            await response.send_json(200, {"modes": [
+                {"name": name, "function": func.__name__, "path": "/convert/" + func.__name__}
+                for name, func in backend.MODES.items()
+            ]})
+
+        elif path == "/batch":
+            if method != "POST":
+                raise _BadRequest("Error: Use POST.", 405)
+            body = await request.read_body(MAX_BATCH_BODY)
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                raise _BadRequest("Error: Body must be JSON.") from None
+            items = payload.get("requests") if isinstance(payload, dict) else payload
+            if not isinstance(items, list):
+                raise _BadRequest('Error: Expected {"requests": [...]}.')
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(self.executor, run_batch, items)
+            await response.send_json(200, {"results": results})
+
+        elif path.startswith("/convert/"):
+            if method != "POST":
+                raise _BadRequest("Error: Use POST.", 405)
+            stream = find_mode(path[len("/convert/"):])
+            if stream is None:
+                raise _BadRequest(f"Error: Unknown mode {path[len('/convert/'):]!r}.", 404)
+            await self._convert_streaming(stream, request, response)
+
+        else:
+            raise _BadRequest("Error: Not found.", 404)
+
+    async def _convert_streaming(self, stream, request, response):
+        """
+        Run the stream function on a worker thread. It pulls body text from,
+        and pushes output to, this event loop one chunk at a time.
+
+        Most clients send the whole body before they read anything, so the
+        output only waits for the client (drain) once the body is in;
+        waiting earlier would stall both sides.
+        """
+        loop = asyncio.get_running_loop()
+        body = request.body_chunks()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+
+        async def next_text():
+            async for data in body:
+                text = decoder.decode(data)
+                if text:
+                    return text
+            return decoder.decode(b"", final=True) or None
+
+        def pull():
+            while True:
+                text = asyncio.run_coroutine_threadsafe(next_text(), loop).result()
+                if text is None:
+                    return
+                yield text
+
+        def run():
+            for piece in stream(pull()):
+                send = response.write_chunk(piece, drain=request.body_done)
+                asyncio.run_coroutine_threadsafe(send, loop).result()
+
+        try:
+            await loop.run_in_executor(self.executor, binlator_profile.profiled(run))
+        except backend.ConversionError as e:
+            raise _BadRequest(str(e)) from None
+        except UnicodeDecodeError:
+            raise _BadRequest("Error: Body must be UTF-8 text.") from None
+        await response.end_chunks()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="binlator_server", description="Serve BINLATOR conversions over HTTP.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"address to listen on (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port (default: {DEFAULT_PORT})")
+    parser.add_argument("--workers", type=int, help="conversion threads (default: Python's choice)")
+    args = parser.parse_args(argv)
+
+    server = ConversionServer(args.host, args.port, args.workers)
+
+    async def run():
+        await server.start()
+        print(f"binlator_server: listening on http://{server.host}:{server.port}/", file=sys.stderr)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    binlator_profile.start_session("server")
+    sys.exit(main())
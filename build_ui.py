@@ -0,0 +1,44 @@
+# ==========================================================
+# BINLATOR UI build step
+# ==========================================================
+# Turns "BIN UI.ui" (Qt Designer) into bin_ui.py so the app doesn't have to
+# parse the XML with uic every time it starts. Run it after editing the .ui:
+#
+#   python build_ui.py
+#
+# bin_ui.py remembers a hash of the .ui it was made from. If the .ui changes
+# and this script isn't re-run, the app notices and falls back to uic.
+
+import hashlib
+import io
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+UI_FILE = os.path.join(BASE_DIR, "BIN UI.ui")
+OUT_FILE = os.path.join(BASE_DIR, "bin_ui.py")
+
+
+def ui_source_hash(path=UI_FILE):
+    """SHA-1 of the .ui file contents."""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def build(ui_path=UI_FILE, out_path=OUT_FILE):
+    from PyQt5 import uic  # only needed when actually building
+
+    code = io.StringIO()
+    with open(ui_path, encoding="utf-8") as f:
+        uic.compileUi(f, code)
+
+    with open(out_path, "w", encoding="utf-8") as out:
+        # keep the header free of machine-specific absolute paths
+        out.write(code.getvalue().replace(ui_path, os.path.basename(ui_path)))
+        out.write("\n\n# Hash of the .ui this module was generated from (see build_ui.py)\n")
+        out.write(f'UI_SOURCE_HASH = "{ui_source_hash(ui_path)}"\n')
+
+
+if __name__ == "__main__":
+    build()
+    print(f"wrote {os.path.relpath(OUT_FILE)}", file=sys.stderr)
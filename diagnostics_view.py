@@ -0,0 +1,104 @@
+# ==========================================================
+# BINLATOR diagnostics panel
+# ==========================================================
+# Hidden window (Ctrl+Shift+D in the main window) that shows the backend's
+# per-mode counters (see "INSTRUMENTATION" in backend.py) and the result
+# cache statistics. Counting is off until it is switched on here or with
+# BINLATOR_STATS=1, so normal use pays nothing for it.
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QCheckBox, QPushButton, QLabel,
+    QTableWidget, QTableWidgetItem, QHeaderView,
+)
+from PyQt5.QtCore import Qt, QTimer
+
+import backend
+
+REFRESH_MS = 1000
+
+_COLUMNS = ("Mode", "Calls", "Errors", "Input chars", "Output size", "Mean", "p50", "p90", "p99")
+
+
+def format_seconds(seconds):
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds * 1e6:.0f} µs"
+
+
+class DiagnosticsDialog(QDialog):
+    """Live table of backend.stats_snapshot() plus the cache counters."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("BINLATOR Diagnostics")
+        self.resize(820, 420)
+
+        self.enabled_check = QCheckBox("Count conversions", self)
+        self.enabled_check.setChecked(backend.stats_enabled())
+        self.enabled_check.toggled.connect(backend.enable_stats)
+
+        self.table = QTableWidget(0, len(_COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(_COLUMNS)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+
+        self.cache_label = QLabel(self)
+        reset_button = QPushButton("Reset", self)
+        reset_button.clicked.connect(self._reset)
+        close_button = QPushButton("Close", self)
+        close_button.clicked.connect(self.close)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.enabled_check)
+        buttons.addStretch(1)
+        buttons.addWidget(reset_button)
+        buttons.addWidget(close_button)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addWidget(self.cache_label)
+        layout.addLayout(buttons)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.enabled_check.setChecked(backend.stats_enabled())
+        self.refresh()
+        self._timer.start()   # only refreshes while the panel is open
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def _reset(self):
+        backend.reset_stats()
+        self.refresh()
+
+    def refresh(self):
+        rows = sorted(backend.stats_snapshot().items())
+        self.table.setRowCount(len(rows))
+        for row, (mode, s) in enumerate(rows):
+            values = (
+                mode, f"{s['calls']:,}", f"{s['errors']:,}", f"{s['input_chars']:,}",
+                f"{s['output_size']:,}", format_seconds(s["mean_s"]),
+                "< " + format_seconds(s["p50_s"]), "< " + format_seconds(s["p90_s"]),
+                "< " + format_seconds(s["p99_s"]),
+            )
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if col:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, col, item)
+
+        cache = backend.result_cache.stats()
+        self.cache_label.setText(
+            f"Result cache: {cache['entries']:,} entries, {cache['bytes'] / 1e6:.1f} of "
+            f"{cache['max_bytes'] / 1e6:.0f} MB, {cache['hits']:,} hits, "
+            f"{cache['misses']:,} misses, {cache['evictions']:,} evictions"
+        )
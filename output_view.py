@@ -0,0 +1,139 @@
+# ==========================================================
+# BINLATOR large output view
+# ==========================================================
+# A QTextBrowser lays out the whole document, which is far too slow (and
+# memory hungry) for results of tens of megabytes. PagedTextView keeps the
+# result as one Python str (1 byte per char for ASCII output) and only puts
+# the rows that are on screen into its text widget.
+#
+# Rows are fixed-width slices of the text, so finding row N is just an index
+# computation and nothing has to be measured up front. Line breaks inside the
+# result are shown as "⏎" so every row stays exactly one line tall; copy and
+# save always use the real text.
+
+from PyQt5.QtWidgets import QWidget, QPlainTextEdit, QScrollBar, QHBoxLayout
+from PyQt5.QtGui import QFontDatabase
+from PyQt5.QtCore import Qt, QEvent, QMimeData
+
+SAVE_CHUNK = 1 << 20   # chars written per write() call when saving
+
+_SHOW_BREAKS = str.maketrans(dict.fromkeys("\n\r\u2028\u2029", "⏎"))
+
+
+def iter_text_chunks(text, size=SAVE_CHUNK):
+    """Yield text in slices of `size` chars (for writing without one giant copy)."""
+    for start in range(0, len(text), size):
+        yield text[start:start + size]
+
+
+class LazyTextMime(QMimeData):
+    """
+    Clipboard data that hands the text to Qt only when something is pasted,
+    instead of converting the whole result to a QString on Copy.
+    """
+
+    def __init__(self, text):
+        super().__init__()
+        self._text = text
+
+    def formats(self):
+        return ["text/plain"]
+
+    def hasText(self):
+        return True
+
+    def retrieveData(self, mime_type, preferred_type):
+        if mime_type == "text/plain":
+            return self._text
+        return super().retrieveData(mime_type, preferred_type)
+
+
+class PagedTextView(QWidget):
+    """Read-only view of a very long text that only lays out the visible rows."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._text = ""
+        self._cols = 80    # chars per row (from the widget width)
+        self._rows = 10    # rows on screen (from the widget height)
+
+        self._page = QPlainTextEdit(self)
+        self._page.setReadOnly(True)
+        self._page.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self._page.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._page.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._page.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self._page.installEventFilter(self)
+        self._page.viewport().installEventFilter(self)
+
+        self._bar = QScrollBar(Qt.Vertical, self)
+        self._bar.valueChanged.connect(self._render)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self._page)
+        layout.addWidget(self._bar)
+
+    # ---- data ----
+    def set_text(self, text):
+        self._text = text
+        self._relayout()
+        self._bar.setValue(0)
+        self._render()
+
+    def text(self):
+        """The full result (the backing store, not what is on screen)."""
+        return self._text
+
+    def clear(self):
+        self.set_text("")
+
+    # ---- layout ----
+    def _relayout(self):
+        metrics = self._page.fontMetrics()
+        viewport = self._page.viewport()
+        margin = 2 * int(self._page.document().documentMargin())
+        self._cols = max((viewport.width() - margin) // max(metrics.horizontalAdvance("0"), 1), 1)
+        self._rows = max((viewport.height() - margin) // max(metrics.lineSpacing(), 1), 1)
+
+        total_rows = -(-len(self._text) // self._cols)
+        self._bar.setRange(0, max(total_rows - self._rows, 0))
+        self._bar.setPageStep(self._rows)
+        self._bar.setSingleStep(1)
+
+    def _render(self, _=None):
+        cols = self._cols
+        start = self._bar.value() * cols
+        window = self._text[start:start + cols * self._rows].translate(_SHOW_BREAKS)
+        self._page.setPlainText("\n".join(window[i:i + cols] for i in range(0, len(window), cols)))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # keep the first visible char on screen when the row width changes
+        first = self._bar.value() * self._cols
+        self._relayout()
+        self._bar.setValue(first // self._cols)
+        self._render()
+
+    # ---- scrolling (the inner text widget has no scroll range of its own) ----
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Wheel:
+            rows = event.angleDelta().y() // 40   # 3 rows per wheel notch
+            self._bar.setValue(self._bar.value() - rows)
+            return True
+
+        if event.type() == QEvent.KeyPress:
+            ctrl = event.modifiers() & Qt.ControlModifier
+            target = {
+                Qt.Key_Up: self._bar.value() - 1,
+                Qt.Key_Down: self._bar.value() + 1,
+                Qt.Key_PageUp: self._bar.value() - self._rows,
+                Qt.Key_PageDown: self._bar.value() + self._rows,
+                Qt.Key_Home: 0 if ctrl else None,
+                Qt.Key_End: self._bar.maximum() if ctrl else None,
+            }.get(event.key())
+            if target is not None:
+                self._bar.setValue(target)   # QScrollBar clamps to its range
+                return True
+        return super().eventFilter(obj, event)
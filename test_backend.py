@@ -0,0 +1,297 @@
+# ==========================================================
+# BINLATOR mode functions: tests
+# ==========================================================
+# One row per mode function and branch: every error message the original
+# hand-written functions could return, and a few good inputs for each. The
+# expected values are what those functions gave, so the shared
+# parse -> code point -> format pipeline must give the same.
+
+import pytest
+
+import backend
+
+
+class _Boom(str):
+    """A str whose methods fail, to reach each function's catch-all branch."""
+
+    def _fail(self, *args):
+        raise RuntimeError("boom")
+
+    split = strip = replace = isspace = __iter__ = _fail
+
+
+_BOOM = _Boom("01000001")
+
+_CASES = [
+    # text_to_unicode
+    ("text_to_unicode", None, "Error: Input must be a string."),
+    ("text_to_unicode", "", "Error: Please enter something, not just spaces."),
+    ("text_to_unicode", "Hello", [72, 101, 108, 108, 111]),
+    ("text_to_unicode", "  Hi,  you! ", [72, 105, 44, 32, 121, 111, 117, 33]),
+    ("text_to_unicode", "H e l l o", [72, 101, 108, 108, 111]),
+    ("text_to_unicode", "H  e l l o", [72, 101, 108, 108, 111]),
+    ("text_to_unicode", "héllo 😀", [104, 233, 108, 108, 111, 32, 128512]),
+    ("text_to_unicode", "a", [97]),
+    ("text_to_unicode", "\x00\x7f", [0, 127]),
+    ("text_to_unicode", "\ud800", [55296]),
+    ("text_to_unicode", _BOOM, "Error: Something went wrong while converting text to Unicode."),
+    # text_to_binary
+    ("text_to_binary", None, "Error: Input must be a string."),
+    ("text_to_binary", "", "Error: Please enter something, not just spaces."),
+    ("text_to_binary", "Hello", "01001000 01100101 01101100 01101100 01101111"),
+    ("text_to_binary", "  Hi,  you! ", "01001000 01101001 00101100 00100000 01111001 01101111 01110101 00100001"),
+    ("text_to_binary", "H e l l o", "01001000 01100101 01101100 01101100 01101111"),
+    ("text_to_binary", "H  e l l o", "01001000 01100101 01101100 01101100 01101111"),
+    ("text_to_binary", "héllo 😀", "01101000 11101001 01101100 01101100 01101111 00100000 11111011000000000"),
+    ("text_to_binary", "a", "01100001"),
+    ("text_to_binary", "\x00\x7f", "00000000 01111111"),
+    ("text_to_binary", "\ud800", "1101100000000000"),
+    ("text_to_binary", _BOOM, "Error: Something went wrong while converting text to binary."),
+    # text_to_octal
+    ("text_to_octal", None, "Error: Input must be a string."),
+    ("text_to_octal", "", "Error: Please enter something, not just spaces."),
+    ("text_to_octal", "Hello", ["110", "145", "154", "154", "157"]),
+    ("text_to_octal", "  Hi,  you! ", ["110", "151", "54", "40", "171", "157", "165", "41"]),
+    ("text_to_octal", "H e l l o", ["110", "145", "154", "154", "157"]),
+    ("text_to_octal", "H  e l l o", ["110", "145", "154", "154", "157"]),
+    ("text_to_octal", "héllo 😀", ["150", "351", "154", "154", "157", "40", "373000"]),
+    ("text_to_octal", "a", ["141"]),
+    ("text_to_octal", "\x00\x7f", ["0", "177"]),
+    ("text_to_octal", "\ud800", ["154000"]),
+    ("text_to_octal", _BOOM, "Error: Something went wrong while converting text to octal."),
+    # text_to_hex
+    ("text_to_hex", None, "Error: Input must be a string."),
+    ("text_to_hex", "", "Error: Please enter something, not just spaces."),
+    ("text_to_hex", "Hello", ["48", "65", "6C", "6C", "6F"]),
+    ("text_to_hex", "  Hi,  you! ", ["48", "69", "2C", "20", "79", "6F", "75", "21"]),
+    ("text_to_hex", "H e l l o", ["48", "65", "6C", "6C", "6F"]),
+    ("text_to_hex", "H  e l l o", ["48", "65", "6C", "6C", "6F"]),
+    ("text_to_hex", "héllo 😀", ["68", "E9", "6C", "6C", "6F", "20", "1F600"]),
+    ("text_to_hex", "a", ["61"]),
+    ("text_to_hex", "\x00\x7f", ["0", "7F"]),
+    ("text_to_hex", "\ud800", ["D800"]),
+    ("text_to_hex", _BOOM, "Error: Something went wrong while converting text to hexadecimal."),
+    # binary_to_text
+    ("binary_to_text", None, "Error: Input must be a string of binary values."),
+    ("binary_to_text", "", "Error: Please enter something, not just spaces."),
+    ("binary_to_text", "0100000", "Error: Need at least 8 bits."),
+    ("binary_to_text", "0100 0001", "A"),
+    ("binary_to_text", "01000001", "A"),
+    ("binary_to_text", "0100000101000010", "Error: Missing spaces between bytes (e.g. '01000001 01000010')."),
+    ("binary_to_text", "01000001 01000010", "AB"),
+    ("binary_to_text", "  01000001   01000010  ", "AB"),
+    ("binary_to_text", "01000001 0100", "Error: Total bit length must be a multiple of 8."),
+    ("binary_to_text", "01000001 0100001 1", "Error: Each group must be 8 bits."),
+    ("binary_to_text", "01000001 0100001x", "Error: Make sure you only enter valid binary numbers (0s and 1s)."),
+    ("binary_to_text", "11111111 00000000", "ÿ\x00"),
+    ("binary_to_text", "0b000001 01000001", "\x01A"),
+    ("binary_to_text", _BOOM, "Error: Something went wrong while converting binary to text."),
+    # binary_to_unicode
+    ("binary_to_unicode", None, "Error: Input must be a string of binary values."),
+    ("binary_to_unicode", "", "Error: Please enter something, not just spaces."),
+    ("binary_to_unicode", "0100000", "Error: Need at least 8 bits."),
+    ("binary_to_unicode", "0100 0001", [65]),
+    ("binary_to_unicode", "01000001", [65]),
+    ("binary_to_unicode", "0100000101000010", "Error: Missing spaces between bytes (e.g. '01000001 01000010')."),
+    ("binary_to_unicode", "01000001 01000010", [65, 66]),
+    ("binary_to_unicode", "  01000001   01000010  ", [65, 66]),
+    ("binary_to_unicode", "01000001 0100", "Error: Total bit length must be a multiple of 8."),
+    ("binary_to_unicode", "01000001 0100001 1", "Error: Each group must be 8 bits."),
+    ("binary_to_unicode", "01000001 0100001x", "Error: Make sure you only enter valid binary numbers (0s and 1s)"),
+    ("binary_to_unicode", "11111111 00000000", [255, 0]),
+    ("binary_to_unicode", "0b000001 01000001", [1, 65]),
+    ("binary_to_unicode", _BOOM, "Error: Something went wrong while converting binary to Unicode."),
+    # binary_to_octal
+    ("binary_to_octal", None, "Error: Input must be a string of binary values."),
+    ("binary_to_octal", "", "Error: Please enter something, not just spaces."),
+    ("binary_to_octal", "0100000", ["40"]),
+    ("binary_to_octal", "0100 0001", ["4", "1"]),
+    ("binary_to_octal", "01000001", ["101"]),
+    ("binary_to_octal", "0100000101000010", ["40502"]),
+    ("binary_to_octal", "01000001 01000010", ["101", "102"]),
+    ("binary_to_octal", "01000001\n01000010", ["101", "102"]),
+    ("binary_to_octal", "  01000001   01000010  ", ["101", "102"]),
+    ("binary_to_octal", "01000001 0100", ["101", "4"]),
+    ("binary_to_octal", "01000001 0100001x", "Error: Make sure you only enter valid binary numbers (0s and 1s)."),
+    ("binary_to_octal", _BOOM, "Error: Something went wrong while converting binary to octal."),
+    # binary_to_hex
+    ("binary_to_hex", None, "Error: Input must be a string of binary values."),
+    ("binary_to_hex", "", "Error: Please enter something, not just spaces."),
+    ("binary_to_hex", "0100000", "Error: Need at least 8 bits."),
+    ("binary_to_hex", "0100 0001", ["41"]),
+    ("binary_to_hex", "01000001", ["41"]),
+    ("binary_to_hex", "0100000101000010", "Error: Missing spaces between bytes (e.g. '01000001 01000010')."),
+    ("binary_to_hex", "01000001 01000010", ["41", "42"]),
+    ("binary_to_hex", "  01000001   01000010  ", ["41", "42"]),
+    ("binary_to_hex", "01000001 0100", "Error: Total bit length must be a multiple of 8."),
+    ("binary_to_hex", "01000001 0100001 1", "Error: Each group must be 8 bits."),
+    ("binary_to_hex", "01000001 0100001x", "Error: Make sure you only enter valid binary numbers (0s and 1s)"),
+    ("binary_to_hex", "11111111 00000000", ["FF", "0"]),
+    ("binary_to_hex", "0b000001 01000001", ["1", "41"]),
+    ("binary_to_hex", _BOOM, "Error: Something went wrong while converting binary to hexadecimal."),
+    # unicode_to_text
+    ("unicode_to_text", None, "Error: Input must be a string of numbers."),
+    ("unicode_to_text", "", "Error: Please enter something, not just spaces."),
+    ("unicode_to_text", "72 105", "Hi"),
+    ("unicode_to_text", " 72\n105\t33 ", "Hi!"),
+    ("unicode_to_text", "72,105", "Error: Please enter valid decimal numbers (e.g. 65 66 67)."),
+    ("unicode_to_text", "999999999999999999999999999999", "Error: Something went wrong while converting Unicode to text."),
+    ("unicode_to_text", "0", "\x00"),
+    ("unicode_to_text", "233 128512", "é😀"),
+    ("unicode_to_text", "٣", "\x03"),
+    ("unicode_to_text", "+65", "A"),
+    ("unicode_to_text", _BOOM, "Error: Something went wrong while converting Unicode to text."),
+    # unicode_to_binary
+    ("unicode_to_binary", None, "Error: Input must be a string of numbers."),
+    ("unicode_to_binary", "", "Error: Please enter something, not just spaces."),
+    ("unicode_to_binary", "72 105", ["01001000", "01101001"]),
+    ("unicode_to_binary", " 72\n105\t33 ", ["01001000", "01101001", "00100001"]),
+    ("unicode_to_binary", "72,105", "Error: Please enter valid decimal numbers."),
+    ("unicode_to_binary", "-1", ["-0000001"]),
+    ("unicode_to_binary", "1114112", ["100010000000000000000"]),
+    ("unicode_to_binary", "999999999999999999999999999999", ["1100100111110010110010011100110100000100011001110100111011011110101000111111111111111111111111111111"]),
+    ("unicode_to_binary", "0", ["00000000"]),
+    ("unicode_to_binary", "233 128512", ["11101001", "11111011000000000"]),
+    ("unicode_to_binary", "٣", ["00000011"]),
+    ("unicode_to_binary", _BOOM, "Error: Something went wrong while converting Unicode to binary."),
+    # unicode_to_octal
+    ("unicode_to_octal", None, "Error: Input must be a string of numbers."),
+    ("unicode_to_octal", "", "Error: Please enter something, not just spaces."),
+    ("unicode_to_octal", "72 105", ["110", "151"]),
+    ("unicode_to_octal", " 72\n105\t33 ", ["110", "151", "41"]),
+    ("unicode_to_octal", "72,105", "Error: Please enter valid decimal numbers."),
+    ("unicode_to_octal", "-1", ["-1"]),
+    ("unicode_to_octal", "1114112", ["4200000"]),
+    ("unicode_to_octal", "999999999999999999999999999999", ["1447626234640431647336507777777777"]),
+    ("unicode_to_octal", "0", ["0"]),
+    ("unicode_to_octal", "233 128512", ["351", "373000"]),
+    ("unicode_to_octal", "٣", ["3"]),
+    ("unicode_to_octal", _BOOM, "Error: Something went wrong while converting decimal to octal."),
+    # decimal_to_hex
+    ("decimal_to_hex", None, "Error: Input must be a string of numbers."),
+    ("decimal_to_hex", "", "Error: Please enter something, not just spaces."),
+    ("decimal_to_hex", "72 105", ["48", "69"]),
+    ("decimal_to_hex", " 72\n105\t33 ", ["48", "69", "21"]),
+    ("decimal_to_hex", "72,105", "Error: Please enter valid decimal numbers."),
+    ("decimal_to_hex", "-1", ["-1"]),
+    ("decimal_to_hex", "1114112", ["110000"]),
+    ("decimal_to_hex", "999999999999999999999999999999", ["C9F2C9CD04674EDEA3FFFFFFF"]),
+    ("decimal_to_hex", "0", ["0"]),
+    ("decimal_to_hex", "233 128512", ["E9", "1F600"]),
+    ("decimal_to_hex", "٣", ["3"]),
+    ("decimal_to_hex", _BOOM, "Error: Something went wrong while converting decimal to hex."),
+    # octal_to_text
+    ("octal_to_text", None, "Error: Input must be a string of octal values."),
+    ("octal_to_text", "", "Error: Please enter something, not just spaces."),
+    ("octal_to_text", "110 151", "Hi"),
+    ("octal_to_text", "110\n151\t41", "Hi!"),
+    ("octal_to_text", "1101 51", "Ɂ)"),
+    ("octal_to_text", "110151", "適"),
+    ("octal_to_text", "110 158", "Error: Please add spaces to octal values (0–7)."),
+    ("octal_to_text", "377 4200", "ÿࢀ"),
+    ("octal_to_text", "777777777777777777777777777777", "Error: Something went wrong while converting octal to text."),
+    ("octal_to_text", _BOOM, "Error: Something went wrong while converting octal to text."),
+    # octal_to_binary
+    ("octal_to_binary", None, "Error: Input must be a string of octal values."),
+    ("octal_to_binary", "", "Error: Please enter something, not just spaces."),
+    ("octal_to_binary", "110 151", ["01001000", "01101001"]),
+    ("octal_to_binary", "110\n151\t41", ["01001000", "01101001", "00100001"]),
+    ("octal_to_binary", "1101 51", ["1001000001", "00101001"]),
+    ("octal_to_binary", "110151", ["1001000001101001"]),
+    ("octal_to_binary", "110 158", "Error: Please enter valid octal values (0–7)."),
+    ("octal_to_binary", "377 4200", ["11111111", "100010000000"]),
+    ("octal_to_binary", "777777777777777777777777777777", ["111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111"]),
+    ("octal_to_binary", _BOOM, "Error: Something went wrong while converting octal to binary."),
+    # octal_to_unicode
+    ("octal_to_unicode", None, "Error: Input must be a string of octal values."),
+    ("octal_to_unicode", "", "Error: Please enter something, not just spaces."),
+    ("octal_to_unicode", "110 151", [72, 105]),
+    ("octal_to_unicode", "110\n151\t41", [72, 105, 33]),
+    ("octal_to_unicode", "1101 51", [577, 41]),
+    ("octal_to_unicode", "110151", [36969]),
+    ("octal_to_unicode", "110 158", "Error: Please enter valid octal values (0–7)."),
+    ("octal_to_unicode", "377 4200", [255, 2176]),
+    ("octal_to_unicode", "777777777777777777777777777777", [1237940039285380274899124223]),
+    ("octal_to_unicode", _BOOM, "Error: Something went wrong while converting octal to decimal."),
+    # octal_to_hex
+    ("octal_to_hex", None, "Error: Input must be a string of octal values."),
+    ("octal_to_hex", "", "Error: Please enter something, not just spaces."),
+    ("octal_to_hex", "110 151", ["48", "69"]),
+    ("octal_to_hex", "110\n151\t41", ["48", "69", "21"]),
+    ("octal_to_hex", "1101 51", ["241", "29"]),
+    ("octal_to_hex", "110151", ["9069"]),
+    ("octal_to_hex", "110 158", "Error: Please enter valid octal values (0–7)."),
+    ("octal_to_hex", "377 4200", ["FF", "880"]),
+    ("octal_to_hex", "777777777777777777777777777777", ["3FFFFFFFFFFFFFFFFFFFFFF"]),
+    ("octal_to_hex", _BOOM, "Error: Something went wrong while converting octal to hexadecimal."),
+    # hex_to_text
+    ("hex_to_text", None, "Error: Input must be a string of hexadecimal values."),
+    ("hex_to_text", "", "Error: Please enter something, not just spaces."),
+    ("hex_to_text", "48 69", "Hi"),
+    ("hex_to_text", "48 6c 6C", "Hll"),
+    ("hex_to_text", "48\n69", "Hi"),
+    ("hex_to_text", "4869", "䡩"),
+    ("hex_to_text", "48 6G", "Error: Please enter valid hexadecimal values (0–9, A–F)."),
+    ("hex_to_text", "0x48 69", "Hi"),
+    ("hex_to_text", "1F600", "😀"),
+    ("hex_to_text", "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFF", "Error: Something went wrong while converting hex to text."),
+    ("hex_to_text", "٣", "\x03"),
+    ("hex_to_text", _BOOM, "Error: Something went wrong while converting hex to text."),
+    # hex_to_decimal
+    ("hex_to_decimal", None, "Error: Input must be a string of hexadecimal values."),
+    ("hex_to_decimal", "", "Error: Please enter something, not just spaces."),
+    ("hex_to_decimal", "48 69", [72, 105]),
+    ("hex_to_decimal", "48 6c 6C", [72, 108, 108]),
+    ("hex_to_decimal", "48\n69", [72, 105]),
+    ("hex_to_decimal", "4869", [18537]),
+    ("hex_to_decimal", "48 6G", "Error: Please enter valid hexadecimal values (0–9, A–F)."),
+    ("hex_to_decimal", "0x48 69", [72, 105]),
+    ("hex_to_decimal", "1F600", [128512]),
+    ("hex_to_decimal", "110000", [1114112]),
+    ("hex_to_decimal", "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFF", [1329227995784915872903807060280344575]),
+    ("hex_to_decimal", _BOOM, "Error: Something went wrong while converting hex to decimal."),
+    # hex_to_binary
+    ("hex_to_binary", None, "Error: Input must be a string of hexadecimal values."),
+    ("hex_to_binary", "", "Error: Please enter something, not just spaces."),
+    ("hex_to_binary", "48 69", ["01001000", "01101001"]),
+    ("hex_to_binary", "48 6c 6C", ["01001000", "01101100", "01101100"]),
+    ("hex_to_binary", "48\n69", ["01001000", "01101001"]),
+    ("hex_to_binary", "4869", ["100100001101001"]),
+    ("hex_to_binary", "48 6G", "Error: Please enter valid hexadecimal values (0–9, A–F)."),
+    ("hex_to_binary", "0x48 69", ["01001000", "01101001"]),
+    ("hex_to_binary", "1F600", ["11111011000000000"]),
+    ("hex_to_binary", "110000", ["100010000000000000000"]),
+    ("hex_to_binary", "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFF", ["111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111"]),
+    ("hex_to_binary", _BOOM, "Error: Something went wrong while converting hex to binary."),
+    # hex_to_octal
+    ("hex_to_octal", None, "Error: Input must be a string of hexadecimal values."),
+    ("hex_to_octal", "", "Error: Please enter something, not just spaces."),
+    ("hex_to_octal", "48 69", ["110", "151"]),
+    ("hex_to_octal", "48 6c 6C", ["110", "154", "154"]),
+    ("hex_to_octal", "48\n69", ["110", "151"]),
+    ("hex_to_octal", "4869", ["44151"]),
+    ("hex_to_octal", "48 6G", "Error: Please enter valid hexadecimal values (0–9, A–F)."),
+    ("hex_to_octal", "0x48 69", ["110", "151"]),
+    ("hex_to_octal", "1F600", ["373000"]),
+    ("hex_to_octal", "110000", ["4200000"]),
+    ("hex_to_octal", "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFF", ["7777777777777777777777777777777777777777"]),
+    ("hex_to_octal", _BOOM, "Error: Something went wrong while converting hexadecimal to octal."),
+]
+
+
+def _plain(result):
+    return list(result) if isinstance(result, backend.CodeList) else result
+
+
+@pytest.mark.parametrize("name, user, expected", _CASES)
+def test_mode_matches_original(name, user, expected):
+    assert _plain(getattr(backend, name)(user)) == expected
+
+
+def test_every_classic_mode_is_covered():
+    names = {name for name, _, _ in _CASES}
+    classic = {"text", "binary", "decimal", "octal", "hex"}
+    for func in backend.MODES.values():
+        source, target = backend._FUNC_KEYS[func]
+        if source in classic and target in classic:
+            assert func.__name__ in names, func.__name__
@@ -0,0 +1,52 @@
+# ==========================================================
+# BINLATOR batch API: tests
+# ==========================================================
+# convert_batch() must give func(item) for every item, with a status code
+# that says what kind of result it is.
+
+import random
+
+import pytest
+
+import backend
+from testutil import random_input, render
+
+_PIECES = ["0", "1", "01000001", "7", "8", "41", "zz", "FF", "1114112", "-1", "é", "😀", " ", "  ", "\n"]
+
+
+def _expected_status(result, item):
+    if not isinstance(item, str):
+        return backend.STATUS_NOT_STRING
+    if not item or item.isspace():
+        return backend.STATUS_EMPTY
+    if not (isinstance(result, str) and result.startswith("Error:")):
+        return backend.STATUS_OK
+    if result.startswith(backend._FAIL):
+        return backend.STATUS_FAILED
+    return backend.STATUS_INVALID
+
+
+@pytest.mark.parametrize("mode", list(backend.MODES))
+def test_batch_matches_mode_function(mode):
+    func = backend.MODES[mode]
+    rng = random.Random(mode)
+    items = [random_input(rng, _PIECES, spaces=(), count=(0, 8)) for _ in range(200)]
+    items += [None, 65, "", "   "]
+    results, status = backend.convert_batch(func, iter(items))
+    assert len(results) == len(status) == len(items)
+    for item, result, code in zip(items, results, status):
+        expected = func(item)
+        assert render(result) == render(expected), item
+        assert code == _expected_status(expected, item), item
+
+
+def test_big_items():
+    big = "48 69 " * (backend.NUMPY_MIN_SIZE // 6 + 1)
+    results, status = backend.convert_batch(backend.hex_to_text, ["48 69", big, big + "zz"])
+    assert results == ["Hi", backend.hex_to_text(big), backend.hex_to_text(big + "zz")]
+    assert list(status) == [backend.STATUS_OK, backend.STATUS_OK, backend.STATUS_INVALID]
+
+
+def test_empty_batch():
+    results, status = backend.convert_batch(backend.text_to_hex, [])
+    assert results == [] and len(status) == 0
@@ -0,0 +1,87 @@
+# ==========================================================
+# BINLATOR bytes modes: tests
+# ==========================================================
+# convert_bytes() and the *_bytes functions on bytes-like input.
+
+import pytest
+
+import backend
+
+
+@pytest.mark.parametrize("func, data, expected", [
+    (backend.hex_to_text, b"48 69", b"Hi"),
+    (backend.binary_to_text, b"01001000 01101001", b"Hi"),
+    (backend.octal_to_hex, b"110 151", b"48 69"),
+    (backend.unicode_to_binary, b"72 105", b"01001000 01101001"),
+    (backend.hex_to_decimal, b"  48\n69  ", b"72 105"),
+    # text input is raw bytes: one character per byte, no whitespace clean-up
+    (backend.text_to_hex, b"\x00\xff Hi", b"0 FF 20 48 69"),
+    (backend.text_to_unicode, b" A ", b"32 65 32"),
+])
+def test_convert_bytes(func, data, expected):
+    assert backend.convert_bytes(func, data) == expected
+
+
+def test_bytes_functions_match_convert_bytes():
+    for mode, func in backend.MODES.items():
+        source = backend._FUNC_KEYS[func][0]
+        data = b"Hi" if source == "text" else b"1 10"
+        try:
+            expected = backend.convert_bytes(func, data)
+        except backend.ConversionError as e:
+            expected = str(e)
+        try:
+            got = backend.BYTES_MODES[mode](data)
+        except backend.ConversionError as e:
+            got = str(e)
+        assert got == expected, mode
+
+
+@pytest.mark.parametrize("data", [b"48 69", bytearray(b"48 69"), memoryview(b"48 69")])
+def test_any_buffer_in(data):
+    assert backend.hex_to_text_bytes(data) == b"Hi"
+
+
+def test_output_buffers():
+    out = bytearray(b">")
+    assert backend.hex_to_text_bytes(b"48 69", out=out) == 2
+    assert out == b">Hi"
+
+    buf = bytearray(4)
+    assert backend.hex_to_text_bytes(b"48 69", out=memoryview(buf)) == 2
+    assert buf == b"Hi\x00\x00"
+
+    with pytest.raises(ValueError, match="output buffer too small"):
+        backend.hex_to_text_bytes(b"48 69 21", out=memoryview(bytearray(2)))
+
+
+def test_text_output_encoding():
+    assert backend.hex_to_text_bytes(b"E9") == b"\xe9"
+    assert backend.hex_to_text_bytes(b"E9 1F600", encoding="utf-8") == "é😀".encode("utf-8")
+    with pytest.raises(backend.ConversionError, match="can't be written as latin-1"):
+        backend.hex_to_text_bytes(b"1F600")
+
+
+@pytest.mark.parametrize("func, data", [
+    (backend.hex_to_text, b"48 zz"),
+    (backend.binary_to_text, b"0100100"),
+    (backend.octal_to_text, b"110 8"),
+    (backend.unicode_to_text, b"72 \xe9"),
+])
+def test_errors_match_str_functions(func, data):
+    with pytest.raises(backend.ConversionError) as info:
+        backend.convert_bytes(func, data)
+    assert str(info.value) == func(data.decode("latin-1"))
+
+
+def test_error_location_is_a_byte_offset():
+    with pytest.raises(backend.ConversionError) as info:
+        backend.hex_to_text_bytes(b"48 69\n4G")
+    bad = info.value.location
+    assert (bad.offset, bad.line, bad.column, bad.token) == (6, 2, 1, "4G")
+
+
+def test_empty_input():
+    with pytest.raises(backend.ConversionError) as info:
+        backend.text_to_hex_bytes(b"")
+    assert str(info.value) == backend.text_to_hex("")
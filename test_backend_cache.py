@@ -0,0 +1,80 @@
+# ==========================================================
+# BINLATOR result cache: tests
+# ==========================================================
+# ResultCache on its own (not the shared backend.result_cache).
+
+import backend
+
+
+def _counting():
+    calls = []
+
+    def run(f, user, progress):
+        calls.append(user)
+        return f(user, progress)
+    return calls, run
+
+
+def test_repeat_is_answered_from_cache():
+    cache = backend.ResultCache()
+    calls, run = _counting()
+    assert cache.call(backend.hex_to_text, "48 69", run=run) == "Hi"
+    assert cache.call(backend.hex_to_text, "48 69", run=run) == "Hi"
+    assert calls == ["48 69"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_key_includes_mode_and_input():
+    cache = backend.ResultCache()
+    assert cache.call(backend.hex_to_text, "41") == "A"
+    assert cache.call(backend.hex_to_decimal, "41") == backend.hex_to_decimal("41")
+    assert cache.call(backend.hex_to_text, "42") == "B"
+    assert cache.stats()["misses"] == 3
+
+
+def test_errors_are_cached_like_results():
+    cache = backend.ResultCache()
+    assert cache.call(backend.hex_to_text, "zz") == backend.hex_to_text("zz")
+    assert cache.call(backend.hex_to_text, "zz") == backend.hex_to_text("zz")
+    assert cache.stats()["hits"] == 1
+
+
+def test_least_recently_used_is_evicted():
+    users = ["41 42", "43 44", "45 46"]   # results of one size
+    probe = backend.ResultCache()
+    probe.call(backend.hex_to_text, users[0])
+    cache = backend.ResultCache(max_bytes=2 * probe.bytes)   # room for two
+    cache.call(backend.hex_to_text, users[0])
+    cache.call(backend.hex_to_text, users[1])
+    cache.call(backend.hex_to_text, users[0])   # now the most recently used
+    cache.call(backend.hex_to_text, users[2])   # pushes out users[1]
+    assert cache.stats()["evictions"] == 1
+    assert cache.bytes <= cache.max_bytes
+    hits = cache.stats()["hits"]
+    cache.call(backend.hex_to_text, users[0])
+    assert cache.stats()["hits"] == hits + 1
+    cache.call(backend.hex_to_text, users[1])
+    assert cache.stats()["hits"] == hits + 1
+
+
+def test_result_bigger_than_budget_is_not_stored():
+    cache = backend.ResultCache(max_bytes=50)
+    assert cache.call(backend.hex_to_text, "41 " * 100) == "A" * 100
+    assert cache.stats()["entries"] == 0
+
+
+def test_resize_and_clear():
+    cache = backend.ResultCache()
+    for i in range(10):
+        cache.call(backend.decimal_to_hex, str(i))
+    cache.resize(cache.bytes // 2)
+    assert cache.stats()["evictions"] > 0 and cache.bytes <= cache.max_bytes
+    cache.clear()
+    assert (cache.stats()["entries"], cache.bytes) == (0, 0)
+
+
+def test_non_string_input_is_not_cached():
+    cache = backend.ResultCache()
+    assert cache.call(backend.hex_to_text, None) == backend.hex_to_text(None)
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,63 @@
+# ==========================================================
+# BINLATOR bad-token finder: tests
+# ==========================================================
+# check_input() must point at the token behind the error the mode function
+# returns, with that same message.
+
+import random
+
+import pytest
+
+import backend
+
+
+@pytest.mark.parametrize("func, user, offset, token", [
+    (backend.hex_to_text, "48 zz 69", 3, "zz"),
+    (backend.hex_to_text, "48 69\n  4G 21", 8, "4G"),
+    (backend.binary_to_text, "01001000 0110100x", 9, "0110100x"),
+    (backend.binary_to_text, "01001000 0100100 01101001 1", 9, "0100100"),
+    (backend.unicode_to_text, "72 105 x", 7, "x"),
+    (backend.unicode_to_text, "72 1114112", 3, "1114112"),
+    (backend.octal_to_hex, "110 158", 4, "158"),
+    (backend.text_to_hex, "\ud800", None, None),
+])
+def test_bad_token(func, user, offset, token):
+    bad = backend.check_input(func, user)
+    if offset is None:
+        assert bad is None
+        return
+    assert (bad.offset, bad.token, bad.message) == (offset, token, func(user))
+    assert user[bad.offset:bad.offset + len(bad.token)] == bad.token
+
+
+def test_line_and_column():
+    user = "48 69\n41\n 41 é€ 41"
+    bad = backend.check_input(backend.hex_to_text, user)
+    assert (bad.line, bad.column, bad.token) == (3, 5, "é€")   # columns count characters
+    assert str(bad) == backend.hex_to_text(user) + " (line 3, column 5: 'é€')"
+
+
+@pytest.mark.parametrize("func, user", [
+    (backend.hex_to_text, "48 69"),
+    (backend.hex_to_text, ""),
+    (backend.hex_to_text, "   "),
+    (backend.hex_to_text, None),
+    (backend.binary_to_text, "0100"),                # too few bits: no single token to blame
+    (backend.binary_to_text, "0100000101000010"),    # missing spaces
+    (len, "48 zz"),                                  # not a mode function
+])
+def test_nothing_to_point_at(func, user):
+    assert backend.check_input(func, user) is None
+
+
+@pytest.mark.parametrize("mode", list(backend.MODES))
+def test_message_matches_mode_function(mode):
+    func = backend.MODES[mode]
+    pieces = ["0", "1", "01000001", "7", "8", "41", "zz", "FF", "1114112", "-1", "é", " ", "  ", "\n"]
+    rng = random.Random(mode)
+    for _ in range(300):
+        user = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 8)))
+        bad = backend.check_input(func, user)
+        if bad is not None:
+            assert bad.message == func(user), user
+            assert user[bad.offset:bad.offset + len(bad.token)] == bad.token
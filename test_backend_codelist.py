@@ -0,0 +1,146 @@
+# ==========================================================
+# BINLATOR CodeList result type: tests
+# ==========================================================
+# CodeList must read like the list the number modes used to return, and
+# render() / write() must give the text format() would.
+
+import io
+
+import pytest
+
+import backend
+
+_SPECS = {"decimal": "d", "binary": "08b", "octal": "o", "hex": "X"}
+_VALUES = [0, 7, 10, 65, 255, 256, 4095, 0x1F600, 0x10FFFF]
+
+
+def _codes(values, kind):
+    return backend.CodeList.from_codes(values, kind)
+
+
+def _expected(values, kind, sep=" ", case="upper", pad=None):
+    spec = _SPECS[kind]
+    if pad:
+        spec = f"0{max(pad, 8 if kind == 'binary' else 1)}{spec[-1]}"
+    if case == "lower":
+        spec = spec.lower()
+    return sep.join(format(v, spec) for v in values)
+
+
+@pytest.mark.parametrize("kind", list(_SPECS))
+def test_render_default(kind):
+    assert _codes(_VALUES, kind).render() == _expected(_VALUES, kind)
+
+
+@pytest.mark.parametrize("kind", list(_SPECS))
+@pytest.mark.parametrize("sep", ["", ",", ", ", "\n"])
+@pytest.mark.parametrize("case", ["upper", "lower"])
+@pytest.mark.parametrize("pad", [None, 0, 1, 4, 8, 12])
+def test_render_options(kind, sep, case, pad):
+    assert _codes(_VALUES, kind).render(sep, case, pad) == _expected(_VALUES, kind, sep, case, pad)
+
+
+def test_render_examples():
+    assert backend.text_to_hex("Hi!").render() == "48 69 21"
+    assert backend.text_to_hex("éA").render(sep=",", case="lower", pad=4) == "00e9,0041"
+    assert backend.text_to_hex("Hi").render(sep="") == "4869"
+    assert backend.text_to_octal("A").render(pad=6) == "000101"
+    assert backend.text_to_binary("A") == "01000001"
+    assert _codes([5], "binary").render(pad=4) == "00000101"   # never fewer than 8 bits
+
+
+def test_render_bad_case():
+    with pytest.raises(ValueError):
+        _codes([1], "hex").render(case="title")
+
+
+@pytest.mark.parametrize("length", [0, 1, 2, 9, 10, 11, 31])
+@pytest.mark.parametrize("options", [(" ", "upper", None), (",", "lower", 4), ("", "upper", 10)])
+def test_write_matches_render(monkeypatch, length, options):
+    monkeypatch.setattr(backend, "RENDER_BLOCK", 10)   # several blocks without a big list
+    codes = _codes([(i * 7919) % 0x110000 for i in range(length)], "hex")
+    out = io.StringIO()
+    written = codes.write(out, *options)
+    assert out.getvalue() == codes.render(*options)
+    assert written == len(out.getvalue())
+
+
+def test_write_real_block_size():
+    codes = backend.text_to_unicode("é😀x" * (backend.RENDER_BLOCK // 2 + 1))
+    out = io.StringIO()
+    assert codes.write(out) == len(codes.render())
+    assert out.getvalue() == codes.render()
+
+
+@pytest.mark.parametrize("kind", list(_SPECS))
+def test_values_over_32_bits(kind):
+    values = [65, 2 ** 32, 2 ** 40 + 1, 10 ** 30]
+    codes = _codes(values, kind)
+    assert isinstance(codes._values, list)   # the fallback storage
+    assert codes.render() == _expected(values, kind)
+    assert codes.render(",", "lower", 12) == _expected(values, kind, ",", "lower", 12)
+    assert codes[1:] == _codes(values[1:], kind)
+    out = io.StringIO()
+    codes.write(out)
+    assert out.getvalue() == codes.render()
+
+
+def test_negative_values_fall_back_too():
+    codes = _codes([-5, 10], "decimal")
+    assert isinstance(codes._values, list)
+    assert codes.render() == "-5 10" and codes == [-5, 10]
+
+
+def test_huge_decimal_from_mode():
+    assert backend.decimal_to_hex("65 4294967296 18446744073709551616").render() == "41 100000000 10000000000000000"
+
+
+def test_reads_like_a_list():
+    codes = _codes([72, 105, 33], "hex")
+    assert codes == ["48", "69", "21"]
+    assert codes.tolist() == ["48", "69", "21"] and list(codes) == ["48", "69", "21"]
+    assert len(codes) == 3 and codes[0] == "48" and codes[-1] == "21"
+    assert repr(codes) == repr(["48", "69", "21"])
+    assert "69" in codes and codes.index("21") == 2
+    assert _codes([72, 105], "decimal") == [72, 105]   # decimal items are ints
+    with pytest.raises(IndexError):
+        codes[3]
+    with pytest.raises(TypeError):
+        hash(codes)
+
+
+def test_slices():
+    codes = _codes(range(20), "octal")
+    for part in (slice(2, 5), slice(None, None, 3), slice(-4, None), slice(5, 2), slice(None, None, -1)):
+        sliced = codes[part]
+        assert isinstance(sliced, backend.CodeList) and sliced.kind == "octal"
+        assert sliced == codes.tolist()[part]
+        assert sliced.render() == " ".join(codes.tolist()[part])
+
+
+def test_equality():
+    assert _codes([1, 2], "hex") == _codes([1, 2], "hex")
+    assert _codes([1, 2], "hex") != _codes([1, 2], "octal")   # same values, other base
+    assert _codes([1, 2], "hex") != _codes([1, 3], "hex")
+    assert _codes([1, 2], "hex") != ["1", "2", "3"]
+    assert _codes([1, 2], "hex") != "1 2"
+    assert _codes([65], "hex") == _codes([65, 2 ** 40], "hex")[:1]   # array vs list storage
+
+
+def test_concat():
+    a, b = _codes([72, 105], "hex"), _codes([33], "hex")
+    joined = backend.CodeList.concat([a, b])
+    assert joined == ["48", "69", "21"] and joined.kind == "hex"
+    assert joined.render() == "48 69 21"
+    assert backend.CodeList.concat([a]) == a
+    assert backend.CodeList.concat(iter([a, _codes([], "hex"), b])) == joined
+
+
+def test_concat_with_overflow():
+    joined = backend.CodeList.concat([_codes([65], "decimal"), _codes([2 ** 33], "decimal")])
+    assert joined == [65, 2 ** 33] and joined.render() == f"65 {2 ** 33}"
+
+
+def test_concat_nothing():
+    empty = backend.CodeList.concat([])
+    assert len(empty) == 0 and empty.render() == "" and empty == []
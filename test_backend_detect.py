@@ -0,0 +1,61 @@
+# ==========================================================
+# BINLATOR format detection: tests
+# ==========================================================
+
+import pytest
+
+import backend
+
+
+@pytest.mark.parametrize("data, source, width", [
+    ("48 65 6C 6C 6F", "hex", 2),
+    ("48 65 6c 6c 6f 20 77 6f 72 6c 64", "hex", 2),
+    ("01001000 01100101 01101100", "binary", 8),
+    ("010010000110010101101100", "binary", 8),
+    ("72 101 108 108 111", "decimal", 3),
+    ("72,105,33", "decimal", 2),
+    ("110 145 154 154 157", "octal", 3),
+    ("Hello, World!", "text", None),
+    ("cafe", "text", None),
+    ("héllo wörld", "text", None),
+    (b"48 65 6C 6C 6F", "hex", 2),
+    (memoryview(b"01001000 01100101"), "binary", 8),
+])
+def test_detect_format(data, source, width):
+    found = backend.detect_format(data)
+    assert (found.source, found.width) == (source, width)
+    assert 0 < found.confidence <= 1
+    assert found.label == backend._SOURCE_LABELS[source]
+
+
+def test_nothing_to_detect():
+    found = backend.detect_format("   ")
+    assert (found.source, found.confidence) == ("text", 0.0)
+
+
+def test_only_the_sample_is_read():
+    head = "48 65 6C 6C 6F " * (backend.DETECT_SAMPLE // 15 + 1)
+    assert backend.detect_format(head + "Hello, World! " * 10_000).source == "hex"
+
+
+@pytest.mark.parametrize("target, data, func", [
+    ("text", "48 65 6C 6C 6F", backend.hex_to_text),
+    ("text", "72 101 108 108 111", backend.unicode_to_text),
+    ("hex", "01001000 01100101", backend.binary_to_hex),
+    ("binary", "Hello", backend.text_to_binary),
+    ("text", "Hello there", None),   # already text
+    ("hex", "48 65 6C 6C 6F", None),
+])
+def test_auto_mode(target, data, func):
+    got, found = backend.auto_mode(target, data)
+    assert got is func
+    assert isinstance(found, backend.Detection)
+
+
+def test_auto_mode_on_empty_input_gives_the_usual_error():
+    func, _ = backend.auto_mode("text", "  ")
+    assert func("  ") == backend.hex_to_text("  ")
+
+
+def test_auto_modes_cover_every_classic_target():
+    assert sorted(backend.AUTO_MODES.values()) == sorted(backend._CLASSIC_BASES)
@@ -0,0 +1,92 @@
+# ==========================================================
+# BINLATOR short-token fast paths: tests
+# ==========================================================
+# Binary, hex and octal tokens short enough for the value tables (and the
+# one-buffer 'dd dd' / 'dddddddd dddddddd' layouts) skip int(). With the
+# fast paths switched off, every mode must give the same output and the
+# same error as with them on. NumPy is off on both sides.
+
+import random
+
+import pytest
+
+import backend
+from testutil import SPACES, random_input, render
+
+# source -> (tokens the tables cover, at each width limit and with
+# leading zeros; tokens they don't: too long, bad digits, or digits int()
+# accepts but the tables don't)
+_TOKENS = {
+    "binary": (["00000000", "11111111", "01001000", "00000001"],
+               ["0100100", "010010000", "000000001", "0", "0100100x", "01001002", "0b000001",
+                "0100_1000", "０1001000"]),
+    "hex": (["0", "F", "f", "00", "FF", "fF", "48", "0a"],
+            ["100", "0041", "00000041", "1F600", "G", "4G", "fg", "+4", "-4", "0x41", "4_1", "٣", "４１"]),
+    "octal": (["0", "7", "77", "777", "007", "000", "377", "10"],
+              ["0000", "1000", "0007", "400", "8", "18", "+7", "-7", "0o7", "7_7", "٣"]),
+}
+
+
+def _slow(monkeypatch, call):
+    """call() with the fast paths switched off."""
+    with monkeypatch.context() as m:
+        for table in ("_BINARY_VALUES", "_HEX_VALUES", "_OCTAL_VALUES"):
+            m.setattr(backend, table, {})
+        m.setattr(backend, "_binary_bytes", lambda user: None)
+        m.setattr(backend, "_hex_bytes", lambda user: None)
+        return call()
+
+
+def _inputs(rng, source):
+    good, other = _TOKENS[source]
+    inputs = [
+        " ".join(good),                   # evenly spaced: the one-buffer path where it applies
+        "\n".join(good),
+        " ".join(good) + " ",
+        "  " + "  ".join(good) + "\n",
+        *good,                            # one token at each limit
+    ]
+    pieces = good * 2 + other
+    for _ in range(300):
+        spaces = [" "] if rng.random() < 0.5 else SPACES + ["\x1c"]
+        inputs.append(random_input(rng, pieces, spaces, count=(1, 6)))
+    return inputs
+
+
+def _modes():
+    for mode, func in backend.MODES.items():
+        source, target = backend._FUNC_KEYS[func]
+        if source in _TOKENS and target in ("text", "binary", "decimal", "octal", "hex"):
+            yield mode
+
+
+@pytest.mark.parametrize("mode", list(_modes()))
+def test_fast_paths_match_int(mode, monkeypatch):
+    monkeypatch.setattr(backend, "USE_NUMPY", False)
+    func = backend.MODES[mode]
+    rng = random.Random(mode)
+    for user in _inputs(rng, backend._FUNC_KEYS[func][0]):
+        fast = render(func(user))
+        assert fast == _slow(monkeypatch, lambda: render(func(user))), repr(user)
+
+
+@pytest.mark.parametrize("mode", list(_modes()))
+def test_batch_fast_paths_match_int(mode, monkeypatch):
+    func = backend.MODES[mode]
+    items = _inputs(random.Random(mode), backend._FUNC_KEYS[func][0])
+    fast, fast_status = backend.convert_batch(func, items)
+    slow, slow_status = _slow(monkeypatch, lambda: backend.convert_batch(func, items))
+    assert list(map(render, fast)) == list(map(render, slow))
+    assert fast_status == slow_status
+
+
+@pytest.mark.parametrize("func, user, expected", [
+    (backend.hex_to_decimal, "00 FF ff 0 F", "0 255 255 0 15"),
+    (backend.hex_to_decimal, "FF 100", "255 256"),            # 3 digits: the int() path
+    (backend.hex_to_decimal, "0041 41", "65 65"),
+    (backend.octal_to_unicode, "0 7 77 777 0007", "0 7 63 511 7"),
+    (backend.binary_to_unicode, "00000000 11111111", "0 255"),
+    (backend.binary_to_unicode, "11111111  00000001", "255 1"),   # table, not one buffer
+])
+def test_width_limits(func, user, expected):
+    assert render(func(user)) == expected
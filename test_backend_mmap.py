@@ -0,0 +1,78 @@
+# ==========================================================
+# BINLATOR memory-mapped file conversion: tests
+# ==========================================================
+# convert_file() must write exactly what convert_bytes() gives for the
+# whole file, or raise its error and leave no output. MAX_PIECE is made
+# tiny so even small files are cut into many pieces.
+
+import pytest
+
+import backend
+import backend_mmap
+import backend_parallel
+
+_INPUTS = {
+    "text": [b"Hello, World!", bytes(range(256)), b"  \n\xff "],
+    "binary": [b"01001000 01101001 " * 20 + b"00100001", b"01001000\n01101001\t\t00100001",
+               b"01001000 01101001 0100100", b"01001000 " * 20 + b"2", b"0100100001101001"],
+    "decimal": [b"72 105 33 " * 20, b" 72\n105 ", b"72 1114112 105", b"72 -5"],
+    "octal": [b"110 151 041 " * 20 + b"041", b"110  151\n41", b"110 151 8", b"110\xa0151"],
+    "hex": [b"48 69 21 " * 20 + b"21", b"48\n69  1F600", b"48 69 zz 21", b"48 110000"],
+    "utf8_hex": [b"48 C3 A9", b"C3"],
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pool():
+    yield
+    backend_parallel.shutdown()
+
+
+@pytest.fixture
+def tiny_pieces(monkeypatch):
+    monkeypatch.setattr(backend_mmap, "MAX_PIECE", 7)
+
+
+def _expected(func, data):
+    try:
+        return backend.convert_bytes(func, data)
+    except backend.ConversionError as e:
+        return str(e)
+
+
+def _converted(func, data, tmp_path, workers):
+    in_path, out_path = tmp_path / "in.txt", tmp_path / "out.txt"
+    in_path.write_bytes(data)
+    try:
+        written = backend_mmap.convert_file(func, str(in_path), str(out_path), workers=workers)
+    except backend.ConversionError as e:
+        assert not out_path.exists()
+        return str(e)
+    output = out_path.read_bytes()
+    assert written == len(output)
+    return output
+
+
+def _modes():
+    for mode, func in backend.MODES.items():
+        source, target = backend._FUNC_KEYS[func]
+        if source in _INPUTS and target in ("text", "binary", "decimal", "octal", "hex"):
+            yield mode
+
+
+@pytest.mark.parametrize("mode", list(_modes()))
+def test_mmap_matches_convert_bytes(mode, tmp_path, tiny_pieces):
+    func = backend.MODES[mode]
+    for data in _INPUTS[backend._FUNC_KEYS[func][0]]:
+        assert _converted(func, data, tmp_path, 1) == _expected(func, data), data
+
+
+@pytest.mark.parametrize("func", [backend.text_to_binary, backend.binary_to_text, backend.hex_to_text,
+                                  backend.octal_to_hex, backend.unicode_to_text])
+def test_mmap_matches_convert_bytes_in_pool(func, tmp_path, tiny_pieces):
+    for data in _INPUTS[backend._FUNC_KEYS[func][0]]:
+        assert _converted(func, data, tmp_path, 2) == _expected(func, data), data
+
+
+def test_empty_file(tmp_path):
+    assert _converted(backend.hex_to_text, b"", tmp_path, 1) == backend.hex_to_text("")
@@ -0,0 +1,148 @@
+# ==========================================================
+# BINLATOR input normalizer: tests
+# ==========================================================
+# normalize_input() must give what the GUI's original auto-grouping gave,
+# and its time must grow linearly with the input. The sizes the scaling
+# test runs at can be set with BINLATOR_SCALING_SIZES (default
+# "1K,1M,100M"; K and M are powers of 1024).
+
+import os
+import random
+import timeit
+
+import pytest
+
+import backend
+
+SIZES_ENV = "BINLATOR_SCALING_SIZES"
+OLD_MAX = 1 << 20   # the original code is only run up to this size (it is slow)
+SLACK = 3           # allowed growth of the time per character from one size to the next
+
+_FUNCS = [backend.binary_to_text, backend.octal_to_text, backend.unicode_to_text]
+_JUNK = [" ", "  ", "\n", "\t", ",", ";", "x", "-"]
+_UNICODE_JUNK = ["\xa0", "²", "٣", "é"]
+
+
+def _sizes():
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    sizes = []
+    for item in os.environ.get(SIZES_ENV, "1K,1M,100M").split(","):
+        item = item.strip().upper()
+        sizes.append(int(item[:-1]) * units[item[-1]] if item[-1] in units else int(item))
+    return sizes
+
+
+# ---- the GUI's auto-grouping as it was, one character at a time ----
+
+def _old_group(raw, digits, width):
+    cleaned = ""
+    for ch in raw:
+        if ch in digits:
+            cleaned += ch
+
+    if len(cleaned) == 0 or (len(cleaned) % width) != 0:
+        return None
+
+    groups = []
+    current = ""
+    for ch in cleaned:
+        current += ch
+        if len(current) == width:
+            groups.append(current)
+            current = ""
+
+    grouped = ""
+    i = 0
+    while i < len(groups):
+        grouped += groups[i]
+        if i != len(groups) - 1:
+            grouped += " "
+        i += 1
+    return grouped
+
+
+def _old_normalize_decimal(raw):
+    temp = ""
+    for ch in raw:
+        if ch.isdigit():
+            temp += ch
+        elif ch in [",", ";"]:
+            temp += " "
+        elif ch.isspace():
+            temp += " "
+    return " ".join(temp.split())
+
+
+def _old_normalize(func, raw):
+    """What translate() used to hand to func for input raw."""
+    source = backend._FUNC_KEYS[func][0]
+    if source == "binary":
+        grouped = _old_group(raw, "01", 8)
+    elif source == "octal":
+        grouped = _old_group(raw, "01234567", 3)
+    else:
+        grouped = _old_normalize_decimal(raw) or None
+    return raw if grouped is None else grouped
+
+
+# ---- inputs ----
+
+def _pattern(rng, func):
+    """About 4K characters of ASCII dump for func whose digits make whole groups."""
+    source = backend._FUNC_KEYS[func][0]
+    digits, width = {"binary": ("01", 8), "octal": ("01234567", 3), "decimal": ("0123456789", 1)}[source]
+    parts = []
+    count = 0
+    while count < 2000 or count % width:
+        if rng.random() < 0.7:
+            parts.append(rng.choice(digits))
+            count += 1
+        else:
+            parts.append(rng.choice(_JUNK))
+    return "".join(parts)
+
+
+def _sample(func, size):
+    pattern = _pattern(random.Random(size), func)
+    return pattern * max(size // len(pattern), 1)
+
+
+def _seconds(func, user):
+    timer = timeit.Timer(lambda: backend.normalize_input(func, user))
+    number, took = timer.autorange()
+    if took > 1:
+        return took / number
+    return min(timer.repeat(3, number)) / number
+
+
+# ---- tests ----
+
+@pytest.mark.parametrize("func", _FUNCS, ids=lambda f: f.__name__)
+def test_normalize_matches_old_grouping(func):
+    rng = random.Random(func.__name__)
+    pieces = ["0", "1", "01000001", "5", "7", "9", "65", "110", *_JUNK, *_UNICODE_JUNK]
+    for _ in range(2000):
+        raw = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 20)))
+        assert backend.normalize_input(func, raw) == _old_normalize(func, raw), raw
+
+
+@pytest.mark.parametrize("func", _FUNCS, ids=lambda f: f.__name__)
+def test_normalize_stream_matches_normalize_input(func):
+    user = _sample(func, 300_000)
+    chunks = backend.normalize_stream(func, user, chunk_size=7_777)
+    assert "".join(chunks) == backend.normalize_input(func, user)
+
+
+@pytest.mark.parametrize("func", _FUNCS, ids=lambda f: f.__name__)
+def test_normalize_scales_linearly(func):
+    measured = []
+    for size in _sizes():
+        user = _sample(func, size)
+        if len(user) <= OLD_MAX:
+            assert backend.normalize_input(func, user) == _old_normalize(func, user)
+        measured.append((len(user), _seconds(func, user)))
+
+    for (small, small_s), (big, big_s) in zip(measured, measured[1:]):
+        assert big_s / small_s <= SLACK * big / small, (
+            f"{func.__name__}: {small:,} chars took {small_s:.4f} s, {big:,} took {big_s:.4f} s"
+        )
@@ -0,0 +1,75 @@
+# ==========================================================
+# BINLATOR whole-number modes: tests
+# ==========================================================
+# The input is one number (whitespace inside it is ignored); the result
+# must be what int() and format() give, also for numbers far past the
+# size where int(str) stops (sys.get_int_max_str_digits()).
+
+import contextlib
+import random
+import sys
+
+import pytest
+
+import backend
+
+_BASES = {"binary_number": 2, "octal_number": 8, "decimal_number": 10, "hex_number": 16}
+_SPECS = {2: "b", 8: "o", 10: "d", 16: "X"}
+
+
+def _modes():
+    return [(source, target) for source in _BASES for target in _BASES if source != target]
+
+
+@contextlib.contextmanager
+def _no_digit_limit():
+    """Lift int(str)'s digit limit, for building the reference results only."""
+    if not hasattr(sys, "set_int_max_str_digits"):
+        yield
+        return
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        yield
+    finally:
+        sys.set_int_max_str_digits(limit)
+
+
+@pytest.mark.parametrize("source, target", _modes())
+def test_number_matches_int(source, target):
+    func = backend._MODE_FUNCS[(source, target)]
+    rng = random.Random(f"{source}-{target}")
+    for bits in [1, 7, 64, 1000, 20_000, 100_000]:
+        n = rng.getrandbits(bits)
+        with _no_digit_limit():
+            user = format(n, _SPECS[_BASES[source]])
+            expected = format(n, _SPECS[_BASES[target]])
+        assert func(user) == expected, bits
+
+
+@pytest.mark.parametrize("func, user, expected", [
+    (backend.decimal_number_to_hex, "255", "FF"),
+    (backend.decimal_number_to_hex, " 00012 ", "C"),
+    (backend.decimal_number_to_hex, "12\n34", "4D2"),   # one number across lines
+    (backend.decimal_number_to_binary, "0", "0"),
+    (backend.hex_number_to_binary, "ff", "11111111"),
+    (backend.hex_number_to_decimal, "0x1F", "31"),
+    (backend.binary_number_to_hex, "0b1111", "F"),
+    (backend.octal_number_to_decimal, "0o17", "15"),
+    (backend.binary_number_to_decimal, "1 0 1", "5"),
+    (backend.decimal_number_to_hex, "", backend._EMPTY_MSG),
+    (backend.decimal_number_to_hex, "12a", "Error: Please enter valid decimal numbers."),
+    (backend.decimal_number_to_hex, "-5", "Error: Please enter valid decimal numbers."),
+    (backend.decimal_number_to_hex, "1_000", "Error: Please enter valid decimal numbers."),
+    (backend.binary_number_to_octal, "102", "Error: Make sure you only enter valid binary numbers (0s and 1s)."),
+    (backend.octal_number_to_hex, "78", "Error: Please enter valid octal values (0–7)."),
+    (backend.hex_number_to_octal, "fg", "Error: Please enter valid hexadecimal values (0–9, A–F)."),
+])
+def test_examples(func, user, expected):
+    assert func(user) == expected
+
+
+def test_progress_is_start_and_end():
+    seen = []
+    backend.hex_number_to_decimal("FF", lambda done, total: seen.append((done, total)))
+    assert seen == [(0, 1), (1, 1)]
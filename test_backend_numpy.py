@@ -0,0 +1,96 @@
+# ==========================================================
+# BINLATOR NumPy engine: tests
+# ==========================================================
+# Every mode must give the same output string, or the same error string,
+# with the NumPy engine as with the pure-Python path. The NumPy side runs
+# with NUMPY_MIN_SIZE = 1 so small inputs take the array path too.
+
+import pytest
+
+import backend
+from testutil import render
+
+pytest.importorskip("numpy")
+
+_BIG = 70_000   # tokens: more than one backend_numpy.BLOCK
+
+# source -> (good tokens of one width, good tokens of other widths, bad tokens)
+_TOKENS = {
+    "binary": (["01001000", "01101001", "11111111", "00000000"], ["0100100", "1"], ["0100100x", "2", "0b000001"]),
+    "decimal": (["72", "10", "33", "99"], ["105", "7", "233", "128512"], ["x", "-1", "1114112", "4.2"]),
+    "octal": (["110", "151", "041", "377"], ["7", "1", "4200", "372000"], ["8", "15a", "9"]),
+    "hex": (["48", "69", "6c", "FF"], ["4", "E9", "1F600", "0x41"], ["G", "6z", "110000"]),
+    "utf8_hex": (["C3", "A9", "48", "69"], ["C3A9"], ["C", "ZZ", "FF"]),
+    "utf16le_hex": (["48", "00", "E9", "00"], ["4800"], ["4", "ZZ"]),
+    "utf8_binary": (["11000011", "10101001", "01001000"], ["1100001110101001"], ["1100001", "2"]),
+    "utf32be_binary": (["00000000", "00000000", "00000000", "01001000"], ["0100"], ["x"]),
+}
+_TEXTS = ["Hello, World!", "  H e l l o  ", "héllo 😀", "\n\t x \n", "a", "€" * 3, "x" * 70_001 + "é"]
+
+
+def _inputs(source):
+    """Evenly spaced, irregular, whitespace-heavy and malformed inputs for source."""
+    if source == "text":
+        return _TEXTS
+    fixed, other, bad = _TOKENS[source]
+    big = (fixed * (_BIG // len(fixed) + 1))[:_BIG]
+    return [
+        " ".join(fixed),
+        " ".join(big),
+        " ".join(big) + " ",
+        " ".join(fixed + other),
+        " ".join(big + other),
+        "  ".join(fixed),
+        "\n" + "\t".join(fixed) + "\n\n",
+        "\n".join(big),
+        " \r\n ".join(fixed * 3),
+        "".join(fixed),
+        fixed[0],
+        " ".join(fixed + bad[:1]),
+        " ".join(bad[-1:] + fixed),
+        " ".join(big + bad[:1]),
+        " ".join(fixed[:2] + bad + fixed[2:]),
+        " ".join(fixed).lower(),
+        " ".join(fixed).upper(),
+        " ".join(fixed) + "\xa0" + fixed[0],
+        "   ",
+    ]
+
+
+def _with_engine(monkeypatch, numpy, call):
+    monkeypatch.setattr(backend, "USE_NUMPY", numpy)
+    monkeypatch.setattr(backend, "NUMPY_MIN_SIZE", 1 if numpy else backend.NUMPY_MIN_SIZE)
+    try:
+        return call()
+    except backend.ConversionError as e:
+        return "raised " + str(e)
+
+
+def _modes():
+    sources = {"text", *_TOKENS}
+    return [mode for mode, func in backend.MODES.items() if backend._FUNC_KEYS[func][0] in sources]
+
+
+def test_numpy_engine_is_used(monkeypatch):
+    monkeypatch.setattr(backend, "NUMPY_MIN_SIZE", 1)
+    assert type(backend._fast_fixed_codes("01000001 01000010", 2, 8)).__name__ == "ndarray"
+    assert type(backend._fast_text_codes("Hi")).__name__ == "ndarray"
+
+
+@pytest.mark.parametrize("mode", _modes())
+def test_numpy_matches_python(monkeypatch, mode):
+    func = backend.MODES[mode]
+    for user in _inputs(backend._FUNC_KEYS[func][0]):
+        python = _with_engine(monkeypatch, False, lambda: render(func(user)))
+        numpy = _with_engine(monkeypatch, True, lambda: render(func(user)))
+        assert numpy == python, (mode, user[:80])
+
+
+@pytest.mark.parametrize("mode", _modes())
+def test_numpy_matches_python_bytes(monkeypatch, mode):
+    func = backend.BYTES_MODES[mode]
+    for user in _inputs(backend._FUNC_KEYS[backend.MODES[mode]][0]):
+        data = user.encode("utf-8")
+        python = _with_engine(monkeypatch, False, lambda: func(data, encoding="utf-8"))
+        numpy = _with_engine(monkeypatch, True, lambda: func(data, encoding="utf-8"))
+        assert numpy == python, (mode, user[:80])
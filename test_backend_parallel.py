@@ -0,0 +1,62 @@
+# ==========================================================
+# BINLATOR parallel driver: tests
+# ==========================================================
+# backend_parallel.convert() must return exactly what the mode function
+# returns. min_size=0 sends small inputs through the process pool.
+
+import pytest
+
+import backend
+import backend_parallel
+
+_INPUTS = {
+    "text": ["Hello, World! " * 50, "héllo 😀 " * 80, "H e l l o"],
+    "binary": ["01001000 01101001 " * 100, "01001000\n01101001\t" * 60 + "0100100", "01001000 " * 90 + "2"],
+    "decimal": ["72 105 " * 100, "72 105 " * 90 + "1114112", "72,105 " * 40],
+    "octal": ["110 151 " * 100, "110 151 " * 90 + "8"],
+    "hex": ["48 69 " * 100, "48 69 1F600 " * 70, "48 69 " * 90 + "ZZ"],
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pool():
+    yield
+    backend_parallel.shutdown()
+
+
+def _cases():
+    for mode, func in backend.MODES.items():
+        source, target = backend._FUNC_KEYS[func]
+        if source in _INPUTS and target in _INPUTS:
+            yield mode
+
+
+@pytest.mark.parametrize("mode", list(_cases()))
+def test_parallel_matches_serial(mode):
+    func = backend.MODES[mode]
+    for user in _INPUTS[backend._FUNC_KEYS[func][0]]:
+        assert backend_parallel.convert(func, user, workers=2, min_size=0) == func(user), user[:40]
+
+
+def test_parallel_reports_progress():
+    user = "48 69 " * 1000
+    seen = []
+    result = backend_parallel.convert(backend.hex_to_text, user, lambda done, total: seen.append((done, total)),
+                                      workers=2, min_size=0)
+    assert result == "Hi" * 1000
+    assert seen[0][0] == 0 and seen[-1][0] == seen[-1][1]
+
+
+def test_small_input_runs_serially(monkeypatch):
+    def no_pool(workers):
+        raise AssertionError("the pool was used")
+    monkeypatch.setattr(backend_parallel, "_get_pool", no_pool)
+    assert backend_parallel.convert(backend.hex_to_text, "48 69") == "Hi"
+    assert backend_parallel.convert(backend.hex_to_text, "48 69 " * 100, workers=1, min_size=0) == "Hi" * 100
+
+
+def test_pieces_run_in_the_pool(monkeypatch):
+    def serial(user, progress=None):
+        raise AssertionError("fell back to the serial function")
+    monkeypatch.setitem(backend_parallel._KEYS, serial, backend._FUNC_KEYS[backend.hex_to_text])
+    assert backend_parallel.convert(serial, "48 69 " * 100, workers=2, min_size=0) == "Hi" * 100
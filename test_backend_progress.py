@@ -0,0 +1,98 @@
+# ==========================================================
+# BINLATOR progress / cancel: tests
+# ==========================================================
+# Raising ConversionCancelled from the progress callback must stop a big
+# conversion in whichever phase it is (input check, decimal parse, whole
+# numbers, formatting) and reach the caller.
+
+import pytest
+
+import backend
+
+
+class _CancelAt:
+    """progress callback that cancels on call number `n` (counting from 1)."""
+
+    def __init__(self, n):
+        self.n = n
+        self.calls = []
+
+    def __call__(self, done, total):
+        self.calls.append((done, total))
+        if len(self.calls) == self.n:
+            raise backend.ConversionCancelled()
+
+
+def _not_formatted(monkeypatch):
+    def fail(codes, fmt, progress):
+        raise AssertionError("formatting started after the cancel")
+    monkeypatch.setattr(backend, "_format_in_blocks", fail)
+
+
+@pytest.mark.parametrize("func, user", [
+    (backend.hex_to_text, "48 69 " * 300_000),
+    (backend.text_to_binary, "Hi" * 300_000),
+    (backend.binary_to_unicode, "01001000 " * 300_000),
+])
+def test_cancel_stops_formatting(func, user):
+    progress = _CancelAt(3)
+    with pytest.raises(backend.ConversionCancelled):
+        func(user, progress)
+    assert len(progress.calls) == 3
+
+
+def test_cancel_during_input_check(monkeypatch):
+    _not_formatted(monkeypatch)
+    user = "110 151 " * (backend.VALIDATE_WINDOW // 4)   # several windows
+    progress = _CancelAt(2)
+    with pytest.raises(backend.ConversionCancelled):
+        backend.octal_to_text(user, progress)
+    assert progress.calls[0] == (0, len(user)) and 0 < progress.calls[1][0] < len(user)
+
+
+def test_cancel_during_decimal_parse(monkeypatch):
+    _not_formatted(monkeypatch)
+    tokens = 3 * backend.PROGRESS_BLOCK
+    user = "72 105 33 " * (tokens // 3)
+    progress = _CancelAt(2)
+    with pytest.raises(backend.ConversionCancelled):
+        backend.unicode_to_text(user, progress)
+    assert progress.calls == [(0, len(user)), (0, tokens)]
+
+
+@pytest.mark.parametrize("func, user", [
+    (backend.decimal_number_to_hex, "9" * 100_000),
+    (backend.hex_number_to_decimal, "F" * 100_000),
+])
+def test_cancel_whole_number(func, user):
+    progress = _CancelAt(2)
+    with pytest.raises(backend.ConversionCancelled):
+        func(user, progress)
+    assert progress.calls == [(0, 1), (0, 1)]
+
+
+@pytest.mark.parametrize("func, user", [
+    (backend.binary_to_text, "0100100001101001" * 100_000),
+    (backend.unicode_to_text, "72,105; " * 100_000),
+])
+def test_cancel_normalize_input(func, user):
+    progress = _CancelAt(2)
+    with pytest.raises(backend.ConversionCancelled):
+        backend.normalize_input(func, user, progress)
+    assert progress.calls[0][0] == 0 and progress.calls[1][0] > 0
+
+
+def test_cancel_check_input():
+    user = "48 69 " * backend.VALIDATE_WINDOW + "ZZ"
+    progress = _CancelAt(2)
+    with pytest.raises(backend.ConversionCancelled):
+        backend.check_input(backend.hex_to_text, user, progress)
+
+
+def test_progress_does_not_change_results():
+    for func, user in [(backend.unicode_to_text, "72 105 " * 100_000), (backend.decimal_number_to_hex, "9" * 10_000),
+                       (backend.octal_to_text, "110 151 " * 200_000 + "9")]:
+        assert func(user, lambda done, total: None) == func(user)
+    user = "0100100001101001 " * 100_000
+    assert backend.normalize_input(backend.binary_to_text, user, lambda done, total: None) == \
+        backend.normalize_input(backend.binary_to_text, user)
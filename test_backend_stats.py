@@ -0,0 +1,102 @@
+# ==========================================================
+# BINLATOR per-mode stats: tests
+# ==========================================================
+# enable_stats() / stats_snapshot() / reset_stats(), with the clock
+# replaced where the test needs known timings.
+
+import types
+
+import pytest
+
+import backend
+
+
+@pytest.fixture
+def stats():
+    was_on = backend.stats_enabled()
+    backend.reset_stats()
+    backend.enable_stats()
+    yield
+    backend.enable_stats(was_on)
+    backend.reset_stats()
+
+
+def _clock(monkeypatch, *elapsed_ns):
+    """Make every counted call take the next of elapsed_ns nanoseconds."""
+    ticks = []
+    for ns in elapsed_ns:
+        ticks += [0, ns]
+    ticks = iter(ticks)
+    monkeypatch.setattr(backend, "time", types.SimpleNamespace(perf_counter_ns=lambda: next(ticks)))
+
+
+def test_counters_per_mode(stats):
+    backend.hex_to_text("48 69")
+    backend.hex_to_text("48 69 21")
+    backend.hex_to_text("ZZ")
+    backend.text_to_hex("Hi")
+    snapshot = backend.stats_snapshot()
+    assert set(snapshot) == {"Hexadecimal - Text", "Text - Hexadecimal"}
+    hex_text = snapshot["Hexadecimal - Text"]
+    assert (hex_text["calls"], hex_text["errors"]) == (3, 1)
+    assert hex_text["input_chars"] == len("48 69") + len("48 69 21") + len("ZZ")
+    assert hex_text["output_size"] == len("Hi") + len("Hi!")   # errors add no output
+    text_hex = snapshot["Text - Hexadecimal"]
+    assert (text_hex["calls"], text_hex["errors"], text_hex["output_size"]) == (1, 0, 2)   # two items
+
+
+def test_results_unchanged(stats):
+    assert backend.binary_to_text("01001000 01101001") == "Hi"
+    assert backend.unicode_to_text("x") == backend._MODE_MSGS[("decimal", "text")][0]
+
+
+def test_histogram_and_time(stats, monkeypatch):
+    _clock(monkeypatch, 500, 5_000, 5_000, 3_000_000)
+    for _ in range(4):
+        backend.hex_to_text("48")
+    row = backend.stats_snapshot()["Hexadecimal - Text"]
+    # 0.5 µs -> bucket < 1 µs, 5 µs -> < 8 µs, 3 ms -> < 4096 µs
+    assert row["histogram"] == [(1e-6, 1), (8e-6, 2), (4096e-6, 1)]
+    assert row["total_s"] == pytest.approx(3_010_500e-9)
+    assert row["mean_s"] == pytest.approx(3_010_500e-9 / 4)
+
+
+def test_slowest_bucket_has_no_upper_bound(stats, monkeypatch):
+    _clock(monkeypatch, 10 ** 13)   # hours
+    backend.hex_to_text("48")
+    assert backend.stats_snapshot()["Hexadecimal - Text"]["histogram"] == [(None, 1)]
+
+
+def test_percentiles_on_known_samples():
+    row = backend._ModeStats()
+    row.calls = 100
+    row.histogram[0] = 50    # < 1 µs
+    row.histogram[3] = 40    # < 8 µs
+    row.histogram[10] = 9    # < 1024 µs
+    row.histogram[20] = 1    # < 2**20 µs
+    snapshot = row.snapshot()
+    assert snapshot["p50_s"] == 1e-6
+    assert snapshot["p90_s"] == 8e-6
+    assert snapshot["p99_s"] == 1024e-6
+    assert row._percentile(1.0) == 2 ** 20 / 1e6
+
+
+def test_percentiles_without_calls():
+    snapshot = backend._ModeStats().snapshot()
+    assert snapshot["p50_s"] == snapshot["p99_s"] == snapshot["mean_s"] == 0.0
+    assert snapshot["histogram"] == []
+
+
+def test_enable_disable_reset(stats):
+    assert backend.stats_enabled()
+    backend.hex_to_text("48")
+    backend.enable_stats(False)
+    assert not backend.stats_enabled()
+    backend.hex_to_text("48")   # not counted
+    assert backend.stats_snapshot()["Hexadecimal - Text"]["calls"] == 1   # kept while off
+    backend.enable_stats()
+    backend.hex_to_text("48")
+    assert backend.stats_snapshot()["Hexadecimal - Text"]["calls"] == 2
+    backend.reset_stats()
+    assert backend.stats_snapshot() == {}
+    assert backend.stats_enabled()   # reset only clears the counts
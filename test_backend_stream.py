@@ -0,0 +1,78 @@
+# ==========================================================
+# BINLATOR streaming modes: tests
+# ==========================================================
+# Joined together, a *_stream function's output (or its ConversionError)
+# must be what the mode function gives for the whole input, wherever the
+# chunk boundaries fall.
+
+import io
+import random
+
+import pytest
+
+import backend
+from testutil import SPACES, random_input, render
+
+# Input pieces per source: good tokens and bad ones
+_PIECES = {
+    "text": ["H", "i", "é", "😀", "ab", "Hello", "a b"],
+    "binary": ["01000001", "01101001", "11111111", "0100", "1", "010000011", "0b000001", "2", "x"],
+    "decimal": ["65", "104", "233", "0", "-1", "1114112", "99999999999999999999999", "x", "6.5"],
+    "octal": ["101", "7", "351", "777", "4200000", "8", "x"],
+    "hex": ["41", "6c", "E9", "F", "1F600", "110000", "0x41", "g", "4_1"],
+    "binary_number": ["1", "0", "1010", "2", "_"],
+    "octal_number": ["7", "0", "1234", "8"],
+    "decimal_number": ["9", "0", "1234567890", "a"],
+    "hex_number": ["f", "0", "DEADBEEF", "g"],
+}
+for _base, (_, _, _digits) in backend._ENCODED_BASES.items():
+    _PIECES[_base] = (
+        ["48", "69", "C3", "A9", "C3A9", "F0", "9F", "98", "80", "00", "D8", "3D", "DE", "ZZ", "4"]
+        if _digits == "hex" else
+        ["01001000", "11000011", "10101001", "1100001110101001", "00000000", "11011000", "0100", "2"]
+    )
+
+
+def _random_chunks(rng, user):
+    cuts = sorted(rng.sample(range(len(user) + 1), min(len(user) + 1, rng.randint(0, 6))))
+    return [user[a:b] for a, b in zip([0] + cuts, cuts + [len(user)])]
+
+
+def _streamed(stream, chunks):
+    try:
+        return "".join(stream(chunks))
+    except backend.ConversionError as e:
+        return str(e)
+
+
+@pytest.mark.parametrize("mode", list(backend.MODES))
+def test_stream_matches_whole_input(mode):
+    func, stream = backend.MODES[mode], backend.STREAM_MODES[mode]
+    source = backend._FUNC_KEYS[func][0]
+    rng = random.Random(mode)
+    for _ in range(300):
+        user = random_input(rng, _PIECES[source])
+        chunks = _random_chunks(rng, user)
+        assert _streamed(stream, chunks) == render(func(user)), (user, chunks)
+
+
+@pytest.mark.parametrize("user, chunks", [
+    ("01000001\n01000010", ["01000001\n01000010"]),
+    ("0100 0001", ["0100", " 0001"]),
+    ("01000001 01000010 0100", ["01000001 ", "01000010 ", "0100"]),
+    ("01000001  \xa0", ["", "01000001  ", "\xa0"]),
+])
+def test_binary_stream_checks_whole_input(user, chunks):
+    assert _streamed(backend.binary_to_text_stream, chunks) == backend.binary_to_text(user)
+
+
+def test_octal_stream_rejects_stray_whitespace():
+    for func in (backend.octal_to_text, backend.octal_to_hex):
+        stream = backend._STREAMS[backend._FUNC_KEYS[func]]
+        assert _streamed(stream, ["110 151", "\xa0041"]) == func("110 151\xa0041")
+
+
+def test_stream_reads_files_in_chunks():
+    assert "".join(backend.hex_to_text_stream(io.StringIO("48 65 6C 6C 6F"), 1)) == "Hello"
+    assert "".join(backend.text_to_binary_stream(io.StringIO("  H e l l o  "), 2)) == \
+        "01001000 01100101 01101100 01101100 01101111"
@@ -0,0 +1,63 @@
+# ==========================================================
+# BINLATOR UTF-x byte modes: tests
+# ==========================================================
+# Text <-> the bytes of a UTF-x encoding, written as hex or 8-bit binary.
+# The expected bytes come from Python's own codecs.
+
+import pytest
+
+import backend
+from testutil import render
+
+_TEXTS = ["Hi", "Hé", "😀", "a b\nc", "€uro", "\x00\x7f\x80￿\U0010ffff"]
+_BASES = list(backend._ENCODED_BASES)
+
+
+def _func(source, target):
+    return backend._MODE_FUNCS[(source, target)]
+
+
+def _written(data, digits):
+    return " ".join(format(b, "02X" if digits == "hex" else "08b") for b in data)
+
+
+@pytest.mark.parametrize("base", _BASES)
+def test_encode_matches_codec(base):
+    codec, _, digits = backend._ENCODED_BASES[base]
+    for text in _TEXTS:
+        assert render(_func("text", base)(text)) == _written(text.encode(codec), digits), text
+
+
+@pytest.mark.parametrize("base", _BASES)
+def test_round_trip(base):
+    for text in _TEXTS:
+        encoded = render(_func("text", base)(text))
+        assert _func(base, "text")(encoded) == text, text
+
+
+def test_examples():
+    assert render(backend.text_to_utf8_hex("é")) == "C3 A9"
+    assert render(backend.text_to_utf8_binary("é")) == "11000011 10101001"
+    assert render(backend.text_to_utf16le_hex("😀")) == "3D D8 00 DE"
+    assert render(backend.text_to_utf16be_hex("😀")) == "D8 3D DE 00"
+    assert render(backend.text_to_utf32be_hex("A")) == "00 00 00 41"
+    assert backend.utf8_hex_to_text("c3a9 48") == "éH"            # lower case, unspaced pairs
+    assert backend.utf8_binary_to_text("1100001110101001") == "é"  # one unspaced run
+
+
+@pytest.mark.parametrize("func, user, message", [
+    (backend.utf8_hex_to_text, "C3", "Error: These bytes are not valid UTF-8."),
+    (backend.utf8_hex_to_text, "FF", "Error: These bytes are not valid UTF-8."),
+    (backend.utf16le_hex_to_text, "3D D8", "Error: These bytes are not valid UTF-16LE."),
+    (backend.utf32be_hex_to_text, "00 11 00 00", "Error: These bytes are not valid UTF-32BE."),
+    (backend.utf8_hex_to_text, "ZZ", backend._BYTE_DIGITS_MSGS["hex"]),
+    (backend.utf8_hex_to_text, "4", backend._BYTE_DIGITS_MSGS["hex"]),
+    (backend.utf8_hex_to_text, "C3 A", backend._BYTE_DIGITS_MSGS["hex"]),
+    (backend.utf8_binary_to_text, "0100100", backend._BYTE_DIGITS_MSGS["binary"]),
+    (backend.utf8_binary_to_text, "01001000 2", backend._BYTE_DIGITS_MSGS["binary"]),
+    (backend.utf8_hex_to_text, "  ", backend._EMPTY_MSG),
+    (backend.text_to_utf8_hex, "\ud800", "Error: Some characters can't be written as UTF-8."),
+    (backend.text_to_utf16le_binary, "\udc00", "Error: Some characters can't be written as UTF-16LE."),
+])
+def test_errors(func, user, message):
+    assert func(user) == message
@@ -0,0 +1,114 @@
+# ==========================================================
+# BINLATOR command line: tests
+# ==========================================================
+# main() run on small files in a temporary directory.
+
+import argparse
+import os
+
+import pytest
+
+import backend
+import binlator
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def _outputs(out_dir):
+    return {str(p.relative_to(out_dir)): p.read_text(encoding="utf-8") for p in out_dir.rglob("*") if p.is_file()}
+
+
+def test_outputs_named_after_inputs(tmp_path):
+    first = _write(tmp_path / "a" / "one.txt", "48 69")
+    second = _write(tmp_path / "b" / "two.txt", "4A 6B")
+    assert binlator.main(["hex_to_text", first, second, "-o", str(tmp_path / "out")]) == 0
+    assert _outputs(tmp_path / "out") == {"one.txt": "Hi\n", "two.txt": "Jk\n"}
+
+
+@pytest.mark.parametrize("options", [[], ["--raw"], ["--mmap"]])
+def test_same_named_inputs_keep_their_directories(tmp_path, options):
+    first = _write(tmp_path / "a" / "x.txt", "48 69")
+    second = _write(tmp_path / "b" / "c" / "x.txt", "4A 6B")
+    out = tmp_path / "out"
+    assert binlator.main(["hex_to_text", first, second, "-o", str(out), *options]) == 0
+    end = "" if options == ["--mmap"] else "\n"
+    assert _outputs(out) == {os.path.join("a", "x.txt"): "Hi" + end, os.path.join("b", "c", "x.txt"): "Jk" + end}
+
+
+def test_output_paths():
+    x, y, ex = os.path.join("d", "x.txt"), os.path.join("d", "y.txt"), os.path.join("d", "e", "x.txt")
+    assert binlator._output_paths("out", [x, y]) == {
+        x: os.path.join("out", "x.txt"), y: os.path.join("out", "y.txt")}
+    assert binlator._output_paths("out", [x, os.path.join("d", ".", "x.txt")]) == {   # one input twice
+        x: os.path.join("out", "x.txt"), os.path.join("d", ".", "x.txt"): os.path.join("out", "x.txt")}
+    assert binlator._output_paths("out", [ex, x]) == {
+        ex: os.path.join("out", "e", "x.txt"), x: os.path.join("out", "x.txt")}
+    assert binlator._output_paths("out", ["-"]) == {"-": os.path.join("out", "stdin.txt")}
+
+
+@pytest.mark.parametrize("options", [[], ["--raw"], ["--mmap"]])
+def test_failed_input_leaves_no_output(tmp_path, capsys, options):
+    good = _write(tmp_path / "good.txt", "48 69")
+    # the bad token comes after the first stream chunk has been written
+    bad = _write(tmp_path / "bad.txt", "48 " * 100_000 + "ZZ")
+    out = tmp_path / "out"
+    assert binlator.main(["hex_to_text", good, bad, "-o", str(out), *options]) == 1
+    assert sorted(_outputs(out)) == ["good.txt"]
+    assert "bad.txt" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("options", [[], ["--raw"], ["--mmap"]])
+def test_failed_input_keeps_older_output(tmp_path, options):
+    out = tmp_path / "out"
+    _write(out / "bad.txt", "from an earlier run")
+    bad = _write(tmp_path / "bad.txt", "48 ZZ")
+    assert binlator.main(["hex_to_text", bad, "-o", str(out), *options]) == 1
+    assert _outputs(out) == {"bad.txt": "from an earlier run"}
+
+
+def test_auto_mode_skips_input_in_target_format(tmp_path, capsys):
+    hex_dump = _write(tmp_path / "hex.txt", "48 65 6C 6C 6F")
+    text = _write(tmp_path / "text.txt", "Hello there")
+    out = tmp_path / "out"
+    assert binlator.main(["Auto - Text", hex_dump, text, "-o", str(out), "--stats"]) == binlator.EXIT_SKIPPED
+    assert _outputs(out) == {"hex.txt": "Hello\n"}
+    err = capsys.readouterr().err
+    assert f"binlator: {text}: skipped, it already looks like Text" in err
+    assert "1/2 inputs (1 skipped)" in err
+
+
+def test_failure_beats_skip(tmp_path):
+    bad = _write(tmp_path / "bad.txt", "48 65 6C 6C 6G")
+    text = _write(tmp_path / "text.txt", "Hello there")
+    assert binlator.main(["Auto - Text", bad, text, "-o", str(tmp_path / "out")]) == binlator.EXIT_FAILED
+
+
+def test_error_place_past_the_first_window(tmp_path, capsys):
+    bad = _write(tmp_path / "bad.txt", "48 69\n" * 30_000 + "48 " * 5_000 + "ZZ 48\n")
+    assert binlator.main(["hex_to_text", bad, "-o", str(tmp_path / "out")]) == 1
+    assert f"{bad}:30001:15001: 'ZZ'" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("raw", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8])
+def test_error_place_matches_whole_file(tmp_path, monkeypatch, raw, chunk_size):
+    monkeypatch.setattr(backend, "STREAM_CHUNK_SIZE", chunk_size)
+    args = argparse.Namespace(raw=raw, encoding="utf-8")
+    for user in ["48 ZZ", "48\n69 4\n 6Z 48", "\n\n  48  69\t7G\n", "41 42 43 44 45\n46 47 48 49 GG"]:
+        path = _write(tmp_path / "in.txt", user)
+        whole = backend.check_input(backend.hex_to_text, user)
+        found = binlator._find_in_file(path, backend.ConversionError(whole.message), args, backend.hex_to_text)
+        assert (found.offset, found.line, found.column, found.token) == \
+            (whole.offset, whole.line, whole.column, whole.token), user
+
+
+def test_error_place_gives_up_on_huge_tokens(tmp_path, monkeypatch):
+    monkeypatch.setattr(binlator, "_LONGEST_TOKEN", 100)
+    path = _write(tmp_path / "in.txt", "48 " + "F" * 1_000)
+    error = backend.ConversionError("Error: whatever")
+    assert binlator._error_place(path, error, argparse.Namespace(raw=False, encoding="utf-8", normalize=False),
+                                 backend.hex_to_text) == path
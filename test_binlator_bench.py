@@ -0,0 +1,63 @@
+# ==========================================================
+# BINLATOR benchmarks: tests
+# ==========================================================
+# compare on two small hand-written result files (nothing is measured).
+
+import json
+
+import pytest
+
+import binlator_bench
+
+
+def _results(cases):
+    """{"meta": ..., "results": ...} from key -> (latency in ms, peak bytes)."""
+    return {
+        "meta": {"sizes": ["1K"], "repeat": 1},
+        "results": {
+            key: {"input_bytes": 1024, "latency_s": ms / 1e3, "mb_per_s": 0.0, "peak_bytes": peak}
+            for key, (ms, peak) in cases.items()
+        },
+    }
+
+
+def _save(path, results):
+    path.write_text(json.dumps(results), encoding="utf-8")
+    return str(path)
+
+
+def test_compare_flags_only_changes_over_the_tolerance():
+    old = _results({"a/x/1K": (10.0, 1000), "b/x/1K": (10.0, 1000), "c/x/1K": (10.0, 1000)})
+    new = _results({"a/x/1K": (12.5, 1000), "b/x/1K": (10.5, 1000), "c/x/1K": (5.0, 1000)})
+    worse = binlator_bench.compare(old, new, tolerance=0.10)
+    assert worse == [("a/x/1K", "latency_s", 0.01, 0.0125, pytest.approx(0.25))]   # +25%; +5% and -50% pass
+    assert binlator_bench.compare(old, new, tolerance=0.30) == []
+
+
+def test_compare_memory_tolerance():
+    old = _results({"a/x/1K": (10.0, 1000)})
+    new = _results({"a/x/1K": (10.0, 1500)})
+    assert [w[1] for w in binlator_bench.compare(old, new, tolerance=0.10)] == ["peak_bytes"]
+    assert binlator_bench.compare(old, new, tolerance=0.10, memory_tolerance=0.60) == []
+
+
+def test_compare_skips_cases_missing_on_one_side():
+    old = _results({"a/x/1K": (10.0, 1000), "gone/x/1K": (1.0, 1)})
+    new = _results({"a/x/1K": (10.0, 1000), "added/x/1K": (99.0, 99)})
+    assert binlator_bench.compare(old, new) == []
+
+
+@pytest.mark.parametrize("new_ms, tolerance, status", [
+    (15.0, None, 1),     # +50% over the default 10%
+    (10.5, None, 0),     # +5%
+    (15.0, "0.6", 0),
+    (10.5, "0.01", 1),
+])
+def test_compare_command_exit_status(tmp_path, capsys, new_ms, tolerance, status):
+    old = _save(tmp_path / "old.json", _results({"text_to_hex/ascii/1K": (10.0, 1000)}))
+    new = _save(tmp_path / "new.json", _results({"text_to_hex/ascii/1K": (new_ms, 1000)}))
+    argv = ["compare", old, new] + (["--tolerance", tolerance] if tolerance else [])
+    assert binlator_bench.main(argv) == status
+    out = capsys.readouterr().out
+    assert ("REGRESSION text_to_hex/ascii/1K" in out) == bool(status)
+    assert f"{status} regression(s)" in out
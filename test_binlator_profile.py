@@ -0,0 +1,48 @@
+# ==========================================================
+# BINLATOR opt-in profiling: tests
+# ==========================================================
+# With BINLATOR_PROFILE unset nothing is wrapped, started or written;
+# with =cprofile the profiles of @profiled calls end up in one .prof file.
+
+import os
+
+import pytest
+
+import binlator_profile
+
+
+@pytest.fixture
+def profile_dir(tmp_path, monkeypatch):
+    registered = []
+    monkeypatch.setenv("BINLATOR_PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(binlator_profile.atexit, "register", registered.append)
+    monkeypatch.setattr(binlator_profile, "_session", None)
+    monkeypatch.setattr(binlator_profile, "_profiles", [])
+    return tmp_path, registered
+
+
+def _work(n):
+    return sum(range(n))
+
+
+def test_off_by_default(profile_dir, monkeypatch):
+    folder, registered = profile_dir
+    monkeypatch.setattr(binlator_profile, "MODE", "")
+    assert binlator_profile.profiled(_work) is _work
+    binlator_profile.start_session("test")
+    assert _work(10) == 45
+    assert registered == [] and binlator_profile._session is None
+    assert os.listdir(folder) == []
+
+
+def test_cprofile(profile_dir, monkeypatch):
+    folder, registered = profile_dir
+    monkeypatch.setattr(binlator_profile, "MODE", "cprofile")
+    work = binlator_profile.profiled(_work)
+    assert work is not _work and work.__name__ == "_work"
+    binlator_profile.start_session("test")
+    assert work(10) == 45 and work(20) == 190
+    assert len(binlator_profile._profiles) == 2
+    for at_exit in registered:
+        at_exit()
+    assert os.listdir(folder) == [f"binlator-test-{os.getpid()}.prof"]
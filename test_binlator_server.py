@@ -0,0 +1,124 @@
+# ==========================================================
+# BINLATOR HTTP service: tests
+# ==========================================================
+# One ConversionServer on a free port (on its own event loop thread),
+# spoken to with http.client.
+
+import asyncio
+import http.client
+import json
+import threading
+
+import pytest
+
+import backend
+import backend_parallel
+import binlator_server
+
+
+@pytest.fixture(scope="module")
+def server():
+    srv = binlator_server.ConversionServer(port=0)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run():
+        loop.run_until_complete(srv.start())
+        started.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    started.wait(10)
+    yield srv
+    asyncio.run_coroutine_threadsafe(srv.close(), loop).result(10)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(10)
+
+
+def _request(server, method, path, body=None, **kwargs):
+    conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=30)
+    try:
+        conn.request(method, path, body=body, **kwargs)
+        response = conn.getresponse()
+        return response.status, response.read().decode("utf-8")
+    finally:
+        conn.close()
+
+
+def test_modes(server):
+    status, body = _request(server, "GET", "/modes")
+    modes = json.loads(body)["modes"]
+    assert status == 200
+    assert {"name": "Text - Binary", "function": "text_to_binary", "path": "/convert/text_to_binary"} in modes
+    assert len(modes) == len(backend.MODES)
+
+
+@pytest.mark.parametrize("path", ["/convert/hex_to_text", "/convert/Hexadecimal%20-%20Text"])
+def test_convert(server, path):
+    assert _request(server, "POST", path, "48 69 21") == (200, "Hi!")
+
+
+def test_convert_chunked_body(server):
+    body = (b"48 69 " for _ in range(2000))
+    assert _request(server, "POST", "/convert/hex_to_text", body, encode_chunked=True) == (200, "Hi" * 2000)
+
+
+def test_convert_error(server):
+    assert _request(server, "POST", "/convert/hex_to_text", "48 zz") == (400, backend.hex_to_text("48 zz"))
+
+
+def test_convert_error_after_output_cuts_connection(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=30)
+    try:
+        conn.request("POST", "/convert/hex_to_text", ("41 " * 200_000 + "zz").encode())
+        response = conn.getresponse()
+        assert response.status == 200
+        with pytest.raises(http.client.IncompleteRead):
+            response.read()
+    finally:
+        conn.close()
+
+
+def test_batch(server):
+    items = [
+        {"mode": "text_to_hex", "input": "Hi"},
+        {"mode": "Hexadecimal - Text", "input": "48 zz"},
+        {"mode": "nope", "input": ""},
+        {"input": "Hi"},
+    ]
+    status, body = _request(server, "POST", "/batch", json.dumps({"requests": items}))
+    assert status == 200
+    assert json.loads(body)["results"] == [
+        {"output": ["48", "69"]},
+        {"error": backend.hex_to_text("48 zz"), "offset": 3, "line": 1, "column": 4, "token": "zz"},
+        {"error": "Error: Unknown mode 'nope'."},
+        {"error": 'Error: Each request needs a "mode" and an "input".'},
+    ]
+
+
+def test_batch_sends_big_items_to_the_process_pool(server, monkeypatch):
+    used = []
+    get_pool = backend_parallel._get_pool
+    monkeypatch.setattr(backend_parallel, "PARALLEL_MIN_SIZE", 1000)
+    monkeypatch.setattr(backend_parallel, "worker_count", lambda: 2)
+    monkeypatch.setattr(backend_parallel, "_get_pool", lambda workers: used.append(workers) or get_pool(workers))
+    big = "42 61 74 63 68 " * 1000
+    items = [{"mode": "hex_to_text", "input": "48 69"}, {"mode": "hex_to_text", "input": big}]
+    status, body = _request(server, "POST", "/batch", json.dumps({"requests": items}))
+    assert status == 200
+    assert json.loads(body)["results"] == [{"output": "Hi"}, {"output": "Batch" * 1000}]
+    assert used == [2]   # only the big item
+
+
+@pytest.mark.parametrize("method, path, body, expected", [
+    ("GET", "/nowhere", None, (404, "Error: Not found.")),
+    ("POST", "/convert/nope", "x", (404, "Error: Unknown mode 'nope'.")),
+    ("GET", "/convert/hex_to_text", None, (405, "Error: Use POST.")),
+    ("POST", "/modes", "", (405, "Error: Use GET.")),
+    ("POST", "/batch", "not json", (400, "Error: Body must be JSON.")),
+    ("POST", "/batch", '{"requests": 1}', (400, 'Error: Expected {"requests": [...]}.')),
+    ("POST", "/convert/hex_to_text", b"\xff\xfe", (400, "Error: Body must be UTF-8 text.")),
+])
+def test_bad_requests(server, method, path, body, expected):
+    assert _request(server, method, path, body) == expected
@@ -0,0 +1,123 @@
+# ==========================================================
+# BINLATOR large output view: tests
+# ==========================================================
+# Run without a screen (Qt's offscreen platform); skipped without PyQt5.
+
+import os
+
+import pytest
+
+import backend
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import Qt                    # noqa: E402
+from PyQt5.QtTest import QTest                 # noqa: E402
+from PyQt5.QtWidgets import QApplication       # noqa: E402
+
+import output_view                             # noqa: E402
+
+
+@pytest.fixture
+def view():
+    app = QApplication.instance() or QApplication([])
+    v = output_view.PagedTextView()
+    v.resize(400, 200)
+    v.show()
+    app.processEvents()
+    yield v
+    v.close()
+    app.processEvents()
+
+
+def _rows(v):
+    return v._page.toPlainText().split("\n")
+
+
+def test_first_page(view):
+    text = "".join(chr(ord("a") + i % 26) for i in range(10_000))
+    view.set_text(text)
+    cols, rows = view._cols, view._rows
+    assert cols > 1 and rows > 1
+    assert _rows(view) == [text[i:i + cols] for i in range(0, cols * rows, cols)]
+    assert view._bar.maximum() == -(-len(text) // cols) - rows
+    assert view.text() is text
+
+
+def test_last_page_and_clamping(view):
+    text = "0123456789" * 1_001
+    view.set_text(text)
+    cols = view._cols
+    QTest.keyClick(view._page, Qt.Key_End, Qt.ControlModifier)
+    assert view._bar.value() == view._bar.maximum()
+    shown = _rows(view)
+    assert "".join(shown) == text[view._bar.value() * cols:]
+    assert len(shown[-1]) == (len(text) % cols or cols)   # a short last row
+    QTest.keyClick(view._page, Qt.Key_PageDown)
+    assert view._bar.value() == view._bar.maximum()   # clamped
+    QTest.keyClick(view._page, Qt.Key_Home, Qt.ControlModifier)
+    assert view._bar.value() == 0
+    QTest.keyClick(view._page, Qt.Key_Up)
+    assert view._bar.value() == 0
+
+
+def test_page_down_moves_one_screen(view):
+    view.set_text("x" * 100_000)
+    QTest.keyClick(view._page, Qt.Key_PageDown)
+    assert view._bar.value() == view._rows
+    QTest.keyClick(view._page, Qt.Key_Down)
+    assert view._bar.value() == view._rows + 1
+
+
+def test_text_shorter_than_a_page(view):
+    view.set_text("short")
+    assert view._bar.maximum() == 0
+    assert _rows(view) == ["short"]
+    view.clear()
+    assert view.text() == "" and view._page.toPlainText() == ""
+
+
+def test_line_breaks_shown_as_marks(view):
+    text = "ab\ncd\r\nef g"
+    view.set_text(text)
+    assert "".join(_rows(view)) == "ab⏎cd⏎⏎ef⏎g"
+    assert view.text() == text
+
+
+def test_resize_keeps_first_visible_char(view):
+    view.set_text("".join(map(str, range(50_000))))
+    view._bar.setValue(100)
+    first = 100 * view._cols
+    view.resize(250, 200)
+    QApplication.instance().processEvents()
+    assert view._bar.value() == first // view._cols
+
+
+def test_lazy_mime_gives_exact_text():
+    QApplication.instance() or QApplication([])
+    text = "é😀\r\n" * 100_000
+    mime = output_view.LazyTextMime(text)
+    assert mime.hasText() and mime.formats() == ["text/plain"]
+    assert mime.retrieveData("text/plain", None) is text
+    assert mime.text() == text
+
+
+def test_chunks_match_render():
+    codes = backend.text_to_hex("Hello, World! é😀" * 100_000)
+    text = codes.render()
+    chunks = list(output_view.iter_text_chunks(text))
+    assert len(chunks) > 1 and "".join(chunks) == text
+    assert all(len(c) == output_view.SAVE_CHUNK for c in chunks[:-1])
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_chunk_sizes(size):
+    text = "48 69 " * 1_000 + "é"
+    chunks = list(output_view.iter_text_chunks(text, size))
+    assert "".join(chunks) == text
+    assert all(len(c) == size for c in chunks[:-1]) and 0 < len(chunks[-1]) <= size
+
+
+def test_chunks_of_empty_text():
+    assert list(output_view.iter_text_chunks("")) == []
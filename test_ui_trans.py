@@ -0,0 +1,151 @@
+# ==========================================================
+# BINLATOR GUI: tests
+# ==========================================================
+# Run without a screen (Qt's offscreen platform); skipped without PyQt5.
+
+import importlib.util
+import os
+
+import pytest
+
+import backend
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QTextCursor                                  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QMainWindow, QPushButton   # noqa: E402
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture(scope="module")
+def ui():
+    spec = importlib.util.spec_from_file_location("ui_trans", os.path.join(_HERE, "UI TRANS.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def window(ui):
+    app = QApplication.instance() or QApplication([])
+    w = ui.MainWindow()
+    yield w
+    w.close()
+    app.processEvents()
+
+
+def test_load_ui_uses_bin_ui_when_hash_matches(ui, monkeypatch):
+    import bin_ui
+    from PyQt5 import uic
+    app = QApplication.instance() or QApplication([])   # noqa: F841
+    monkeypatch.setattr(ui, "ui_source_hash", lambda: bin_ui.UI_SOURCE_HASH)
+    monkeypatch.setattr(uic, "loadUi", lambda path, widget: pytest.fail("parsed the .ui with uic"))
+    w = QMainWindow()
+    assert ui.load_ui(w) == "bin_ui"
+    assert isinstance(w._ui, bin_ui.Ui_MainWindow)
+    assert isinstance(w.findChild(QPushButton, "pushButton"), QPushButton)
+
+
+def test_load_ui_falls_back_to_uic_on_hash_mismatch(ui, monkeypatch):
+    from PyQt5 import uic
+    app = QApplication.instance() or QApplication([])   # noqa: F841
+    loaded = []
+    real_load = uic.loadUi
+    monkeypatch.setattr(ui, "ui_source_hash", lambda: "not the hash bin_ui.py was built from")
+    monkeypatch.setattr(uic, "loadUi", lambda path, widget: loaded.append(path) or real_load(path, widget))
+    w = QMainWindow()
+    assert ui.load_ui(w) == "uic"
+    assert loaded == [ui.UI_FILE]
+    assert not hasattr(w, "_ui")
+    assert isinstance(w.findChild(QPushButton, "pushButton"), QPushButton)
+
+
+def test_bin_ui_is_up_to_date(ui):
+    import bin_ui
+    assert bin_ui.UI_SOURCE_HASH == ui.ui_source_hash()
+
+
+def _type(w, text):
+    """Type text at the end of the input box and let live mode catch up."""
+    cursor = w.text_1.textCursor()
+    cursor.movePosition(QTextCursor.End)
+    cursor.insertText(text)
+    w._live_update()   # what the debounce timer would run
+
+
+def _live_window(w, mode, text):
+    w.combo.setCurrentText(mode)
+    w.live_check.setChecked(True)
+    _type(w, text)
+    return w
+
+
+def test_live_patches_output(window):
+    w = _live_window(window, "Text - Binary", "Hi")
+    _type(w, "!")
+    assert w.text_2.toPlainText() == backend.text_to_binary("Hi!")
+
+
+@pytest.mark.parametrize("other", ["", "Error text", "x" * 10])
+def test_live_reseeds_after_other_output(window, other):
+    w = _live_window(window, "Text - Binary", "Hi")
+    w._set_output(other)   # e.g. Translate, Clear or a failed translation
+    _type(w, "!")
+    assert w.text_2.toPlainText() == backend.text_to_binary("Hi!")
+
+
+def test_live_reseeds_after_paged_output(window, ui):
+    w = _live_window(window, "Text - Binary", "Hi")
+    w._set_output("0" * (ui.LARGE_OUTPUT + 1))   # shown in the paged viewer
+    _type(w, "!")
+    assert not w.big_view.isVisibleTo(w)
+    assert w.text_2.toPlainText() == backend.text_to_binary("Hi!")
+
+
+def test_worker_render_matches_and_cancels(ui):
+    codes = backend.text_to_unicode("Hi!" * 100_000)
+    worker = ui.TranslateWorker(backend.text_to_unicode, "")
+    assert worker._render(codes) == codes.render()
+    worker.cancel()
+    with pytest.raises(backend.ConversionCancelled):
+        worker._render(codes)
+
+
+def test_worker_cancelled_before_result(ui):
+    worker = ui.TranslateWorker(backend.hex_to_text, "48 69 " * 300_000)
+    seen = []
+    worker.done.connect(lambda result: seen.append("done"))
+    worker.cancelled.connect(lambda: seen.append("cancelled"))
+    worker.cancel()
+    worker.run()
+    assert seen == ["cancelled"]
+
+
+@pytest.mark.parametrize("size", ["small", "large"])
+def test_copy_gives_exact_output(window, ui, monkeypatch, size):
+    monkeypatch.setattr(ui.QMessageBox, "information", lambda *args: None)
+    text = "é😀 x\r\ny\n" * (10 if size == "small" else ui.LARGE_OUTPUT // 4)
+    window._set_output(text)
+    window.copy_output()
+    mime = QApplication.clipboard().mimeData()
+    if size == "large":
+        assert window.big_view.isVisibleTo(window)
+        assert isinstance(mime, ui.LazyTextMime)
+        assert mime.retrieveData("text/plain", None) is text
+    else:
+        assert QApplication.clipboard().text() == text.replace("\r\n", "\n")   # (QTextBrowser keeps \n only)
+
+
+def test_save_writes_exact_output(window, ui, monkeypatch, tmp_path):
+    path = tmp_path / "out.txt"
+    monkeypatch.setattr(ui.QFileDialog, "getSaveFileName", lambda *args: (str(path), ""))
+    text = "é😀 x\r\ny\n" * ui.LARGE_OUTPUT
+    window._set_output(text)
+    chunks = []
+    real_chunks = ui.iter_text_chunks
+    monkeypatch.setattr(ui, "iter_text_chunks", lambda t: chunks.append(t) or real_chunks(t))
+    window.save_output()
+    assert chunks == [text] and chunks[0] is text   # the stored text itself, not a copy
+    assert path.read_bytes() == text.encode("utf-8")
@@ -0,0 +1,29 @@
+# ==========================================================
+# BINLATOR tests: shared helpers
+# ==========================================================
+# Used by the test_*.py files that compare modes against each other:
+# render() turns a mode result into its output text, random_input()
+# builds seeded random inputs out of pieces and whitespace.
+
+import backend
+
+SPACES = [" ", " ", " ", "  ", "\n", "\t", "\r\n", "\xa0", "\x0b"]
+
+
+def render(result):
+    """The output text for a mode result (CodeLists rendered, strings as they are)."""
+    return result.render() if isinstance(result, backend.CodeList) else result
+
+
+def random_input(rng, pieces, spaces=SPACES, count=(0, 12)):
+    """
+    Between count[0] and count[1] random pieces, most followed by one of
+    `spaces` (no whitespace at all if spaces is empty), sometimes with
+    whitespace in front too.
+    """
+    parts = [rng.choice(spaces)] if spaces and rng.random() < 0.2 else []
+    for _ in range(rng.randint(*count)):
+        parts.append(rng.choice(pieces))
+        if spaces and rng.random() < 0.9:
+            parts.append(rng.choice(spaces))
+    return "".join(parts)